@@ -0,0 +1,77 @@
+import gzip
+from collections.abc import Sequence
+
+from src.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+COMPRESSIBLE_TYPES = ("application/json", "application/javascript", "image/svg+xml", "text/")
+
+# Levels for bodies compressed per response rather than once at build time
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+ZSTD_LEVEL = 3
+
+# Levels for static assets, compressed once at startup and served many times
+STATIC_GZIP_LEVEL = 9
+STATIC_BROTLI_QUALITY = 11
+
+
+def accepted_encodings(accept_encoding: str | None) -> set[str]:
+    """Content codings from an Accept-Encoding header, minus those with q=0"""
+    encodings: set[str] = set()
+    for part in (accept_encoding or "").split(","):
+        coding, _, params = part.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        if coding and quality not in ("0", "0.0", "0.00", "0.000"):
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+def available_encodings(preferred: Sequence[str]) -> tuple[str, ...]:
+    """The preferred encodings this process can produce, best first"""
+    installed = {"gzip": True, "br": brotli is not None, "zstd": zstandard is not None}
+    return tuple(encoding for encoding in preferred if installed.get(encoding))
+
+
+ENCODINGS = available_encodings(settings.compression_encodings_list)
+
+
+def negotiate(accept_encoding: str | None, encodings: Sequence[str] = ENCODINGS) -> str | None:
+    """The first of ``encodings`` that the client accepts, if any"""
+    accepted = accepted_encodings(accept_encoding)
+    return next((encoding for encoding in encodings if encoding in accepted), None)
+
+
+def is_compressible(content_type: str | None) -> bool:
+    return content_type is not None and content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    if encoding == "br" and brotli is not None:
+        compressed: bytes = brotli.compress(body, quality=BROTLI_QUALITY)
+        return compressed
+    if encoding == "zstd" and zstandard is not None:
+        compressed = zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+        return compressed
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+
+def compress_static(body: bytes, encoding: str) -> bytes:
+    """Compress an asset at the highest level, for bodies compressed once at startup"""
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=STATIC_GZIP_LEVEL, mtime=0)
+    if encoding == "br" and brotli is not None:
+        compressed: bytes = brotli.compress(body, quality=STATIC_BROTLI_QUALITY)
+        return compressed
+    raise ValueError(f"Unsupported static content coding: {encoding}")
@@ -1,6 +1,45 @@
-from src.infrastructure.swapi_http_client import SwapiHttpClient
+from collections.abc import Sequence
 
+from fastapi import HTTPException, Request, status
 
-def get_swapi_client() -> SwapiHttpClient:
-    """Dependency injection for SWAPI client"""
-    return SwapiHttpClient()
+from src.application.ports.swapi_client import SwapiClient
+from src.core.config import settings
+
+
+def get_swapi_client(request: Request) -> SwapiClient:
+    """Dependency injection for the application-scoped SWAPI client"""
+    client: SwapiClient = request.app.state.swapi_client
+    return client
+
+
+def parse_expand(expand: str | None, allowed: Sequence[str]) -> tuple[str, ...]:
+    """Relations requested with ``?expand=a,b``, in a canonical order"""
+    if not expand:
+        return ()
+    requested = {relation.strip() for relation in expand.split(",") if relation.strip()}
+    unknown = requested.difference(allowed)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Cannot expand {', '.join(sorted(unknown))}; expected {', '.join(allowed)}",
+        )
+    return tuple(relation for relation in allowed if relation in requested)
+
+
+def parse_ids(ids: str) -> tuple[int, ...]:
+    """IDs requested with ``?ids=1,4,7``, deduplicated, in request order"""
+    try:
+        parsed = tuple(dict.fromkeys(int(value) for value in ids.split(",") if value.strip()))
+    except ValueError:
+        parsed = ()
+    if not parsed or min(parsed) < 1:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="ids must be comma-separated positive integers",
+        )
+    if len(parsed) > settings.IDS_MAX_COUNT:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {settings.IDS_MAX_COUNT} ids can be looked up at once",
+        )
+    return parsed
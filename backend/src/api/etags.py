@@ -0,0 +1,20 @@
+import hashlib
+
+
+def entity_tag(body: bytes, weak: bool = False) -> str:
+    """ETag for a response body, the same hash wherever a body is tagged
+
+    Strong tags are for bytes sent exactly as hashed; weak ones for bodies
+    that may go out in another content coding.
+    """
+    tag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    return f"W/{tag}" if weak else tag
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Whether an If-None-Match header names ``etag``, compared weakly"""
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag == "*" or tag.removeprefix("W/") == opaque
+        for tag in (tag.strip() for tag in if_none_match.split(","))
+    )
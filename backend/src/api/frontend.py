@@ -0,0 +1,173 @@
+import json
+import logging
+import mimetypes
+import os
+from dataclasses import dataclass
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+from typing import Any
+
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from src.api.compression import accepted_encodings, available_encodings, compress_static
+from src.api.etags import entity_tag, etag_matches
+
+logger = logging.getLogger(__name__)
+
+ENV_PLACEHOLDER = "<script>window.__ENV__ = {};</script>"
+COMPRESSIBLE_SUFFIXES = frozenset({".js", ".mjs", ".css", ".html", ".json", ".svg", ".txt", ".map"})
+MIN_COMPRESS_SIZE = 1024
+STATIC_ENCODINGS = available_encodings(("br", "gzip"))
+
+
+def is_not_modified(request_headers: Headers, etag: str, last_modified: float) -> bool:
+    """Evaluate If-None-Match / If-Modified-Since against a cached representation"""
+    if if_none_match := request_headers.get("if-none-match"):
+        return etag_matches(if_none_match, etag)
+    if if_modified_since := request_headers.get("if-modified-since"):
+        try:
+            return int(last_modified) <= parsedate_to_datetime(if_modified_since).timestamp()
+        except (TypeError, ValueError):
+            return False
+    return False
+
+
+@dataclass(frozen=True)
+class Representation:
+    """A body served as-is, with the validators conditional requests check"""
+
+    body: bytes
+    etag: str
+    last_modified: float
+
+
+class IndexPage:
+    """index.html with the runtime config injected, rendered once
+
+    The page is rendered on first use and then served from memory. With
+    ``watch`` (development), the file's mtime is checked on each request and
+    the page is re-rendered when it changes.
+    """
+
+    def __init__(self, path: Path, config: dict[str, Any], watch: bool = False):
+        self.path = path
+        self.config = config
+        self.watch = watch
+        self._rendered: Representation | None = None
+
+    def _render(self) -> Representation | None:
+        try:
+            stat = self.path.stat()
+            content = self.path.read_text()
+        except FileNotFoundError:
+            return None
+
+        injection = f"<script>window.__ENV__ = {json.dumps(self.config)};</script>"
+        body = content.replace(ENV_PLACEHOLDER, injection).encode()
+        return Representation(body=body, etag=entity_tag(body), last_modified=stat.st_mtime)
+
+    def get(self) -> Representation | None:
+        if self._rendered is None:
+            self._rendered = self._render()
+        elif self.watch:
+            try:
+                changed = self.path.stat().st_mtime != self._rendered.last_modified
+            except FileNotFoundError:
+                changed = True
+            if changed:
+                logger.info("index.html changed, re-rendering")
+                self._rendered = self._render()
+        return self._rendered
+
+    def response(self, request_headers: Headers) -> Response | None:
+        """200 with the page, 304 when the client's copy is current, None if missing"""
+        page = self.get()
+        if page is None:
+            return None
+
+        headers = {
+            "ETag": page.etag,
+            "Last-Modified": formatdate(page.last_modified, usegmt=True),
+            "Cache-Control": "no-cache",
+        }
+        if is_not_modified(request_headers, page.etag, page.last_modified):
+            return Response(status_code=304, headers=headers)
+        return Response(page.body, media_type="text/html", headers=headers)
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """StaticFiles that serves gzip/brotli variants built once at startup
+
+    Text assets above MIN_COMPRESS_SIZE are compressed when the app starts
+    (brotli only if the ``brotli`` package is installed); ``.gz``/``.br``
+    files already next to an asset are used as-is. Vite fingerprints the file
+    names under /assets, so every response is marked immutable.
+    """
+
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def __init__(self, *, directory: str | os.PathLike[str], **kwargs: Any):
+        super().__init__(directory=directory, **kwargs)
+        self.variants: dict[str, dict[str, Representation]] = {}
+        root = Path(directory)
+        for file in root.rglob("*"):
+            if file.is_file() and file.suffix in COMPRESSIBLE_SUFFIXES:
+                variants = self._compress(file)
+                if variants:
+                    self.variants[os.path.normpath(file.relative_to(root))] = variants
+
+    def _compress(self, file: Path) -> dict[str, Representation]:
+        data = file.read_bytes()
+        last_modified = file.stat().st_mtime
+        if len(data) < MIN_COMPRESS_SIZE:
+            return {}
+
+        encoded: dict[str, bytes] = {}
+        for encoding, suffix in (("br", ".br"), ("gzip", ".gz")):
+            sibling = file.with_name(file.name + suffix)
+            if sibling.is_file():
+                encoded[encoding] = sibling.read_bytes()
+        for encoding in STATIC_ENCODINGS:
+            if encoding not in encoded:
+                encoded[encoding] = compress_static(data, encoding)
+
+        variants = {}
+        for encoding, body in encoded.items():
+            if len(body) < len(data):
+                variants[encoding] = Representation(body, entity_tag(body), last_modified)
+        return variants
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        variants = self.variants.get(path)
+        if variants and scope["method"] in ("GET", "HEAD"):
+            request_headers = Headers(scope=scope)
+            accepted = accepted_encodings(request_headers.get("accept-encoding"))
+            for encoding in ("br", "gzip"):
+                variant = variants.get(encoding)
+                if variant is not None and encoding in accepted:
+                    return self._variant_response(path, encoding, variant, request_headers)
+
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = self.CACHE_CONTROL
+            if variants:
+                response.headers["Vary"] = "Accept-Encoding"
+        return response
+
+    def _variant_response(
+        self, path: str, encoding: str, variant: Representation, request_headers: Headers
+    ) -> Response:
+        headers = {
+            "Content-Encoding": encoding,
+            "Vary": "Accept-Encoding",
+            "ETag": variant.etag,
+            "Last-Modified": formatdate(variant.last_modified, usegmt=True),
+            "Cache-Control": self.CACHE_CONTROL,
+        }
+        if is_not_modified(request_headers, variant.etag, variant.last_modified):
+            return Response(status_code=304, headers=headers)
+        media_type = mimetypes.guess_type(path)[0] or "application/octet-stream"
+        return Response(variant.body, media_type=media_type, headers=headers)
@@ -0,0 +1,122 @@
+import asyncio
+from collections.abc import Iterator
+from functools import partial
+
+from fastapi import FastAPI
+
+from src.api.responses import response_cache
+from src.application.use_cases.result_cache import result_cache
+from src.infrastructure.cache import cache_stats
+from src.infrastructure.circuit_breaker import CircuitBreaker
+from src.infrastructure.metrics import CONTENT_TYPE, Sample, registry
+
+
+def register_app_metrics(app: FastAPI) -> None:
+    """Metrics read from the caches and the SWAPI client when /metrics is scraped"""
+
+    def cache_tiers() -> dict[str, dict[str, int]]:
+        stats = cache_stats()["tiers"]
+        tiers = {f"swapi_{tier}": values for tier, values in stats.items()}
+        tiers["result"] = result_cache.stats()
+        tiers["response"] = response_cache.stats()
+        return tiers
+
+    def cache_stat(name: str) -> Iterator[Sample]:
+        for tier, stats in cache_tiers().items():
+            if name in stats:
+                yield (tier,), stats[name]
+
+    for stat, documentation in (
+        ("hits", "Cache hits since start"),
+        ("misses", "Cache misses since start"),
+        ("evictions", "Entries evicted to stay within the cache size"),
+    ):
+        registry.counter(
+            f"cache_{stat}_total",
+            documentation,
+            ["cache"],
+            collect=partial(cache_stat, stat),
+        )
+    registry.gauge(
+        "cache_size",
+        "Entries currently cached",
+        ["cache"],
+        collect=partial(cache_stat, "size"),
+    )
+
+    def swapi_cache() -> Iterator[Sample]:
+        stats = cache_stats()
+        for name in ("coalesced_calls", "stale_served", "stale_if_error_served"):
+            yield (name,), stats[name]
+
+    registry.counter(
+        "swapi_cache_events_total",
+        "SWAPI calls avoided by coalescing or stale data",
+        ["event"],
+        collect=swapi_cache,
+    )
+
+    def circuit_state() -> Iterator[Sample]:
+        http_client = getattr(app.state, "swapi_http_client", None)
+        if http_client is None:
+            return
+        current = http_client.breaker.state
+        for state in (CircuitBreaker.CLOSED, CircuitBreaker.OPEN, CircuitBreaker.HALF_OPEN):
+            yield (state,), 1 if state == current else 0
+
+    registry.gauge(
+        "swapi_circuit_state",
+        "1 for the current SWAPI circuit breaker state",
+        ["state"],
+        collect=circuit_state,
+    )
+
+    def pool_connections() -> Iterator[Sample]:
+        http_client = getattr(app.state, "swapi_http_client", None)
+        if http_client is None:
+            return
+        pool = http_client.pool_stats()
+        if pool["open_connections"] is None:
+            return
+        yield ("active",), pool["active_connections"]
+        yield ("idle",), pool["idle_connections"]
+
+    registry.gauge(
+        "swapi_pool_connections",
+        "Open connections in the SWAPI pool",
+        ["state"],
+        collect=pool_connections,
+    )
+
+    def ready() -> Iterator[Sample]:
+        warmer = getattr(app.state, "cache_warmer", None)
+        yield (), 1 if warmer is None or warmer.ready else 0
+
+    registry.gauge("app_ready", "1 once the cache warm-up has completed", collect=ready)
+
+
+async def serve_metrics(host: str, port: int) -> asyncio.Server:
+    """Listener apart from the app answering every HTTP request with the metrics
+
+    It keeps /metrics off the public port, and gives each worker of a forked
+    server an address of its own to be scraped at.
+    """
+
+    async def respond(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            body = registry.render().encode()
+            head = (
+                "HTTP/1.1 200 OK\r\n"
+                f"Content-Type: {CONTENT_TYPE}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n"
+            )
+            writer.write(head.encode() + body)
+            await writer.drain()
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(respond, host, port)
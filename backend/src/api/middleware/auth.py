@@ -4,24 +4,26 @@ from fastapi import HTTPException, Request, status
 from fastapi.security import APIKeyHeader
 
 from src.core.config import settings
+from src.core.timing import phase
 
 api_key_header = APIKeyHeader(name="X-API-Key", auto_error=False)
 
 
 async def verify_api_key(request: Request, api_key: str | None = None) -> None:
     """Verify API key from header"""
-    if not api_key:
-        api_key = request.headers.get("X-API-Key")
+    with phase("auth"):
+        if not api_key:
+            api_key = request.headers.get("X-API-Key")
 
-    if not api_key:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Missing API Key",
-        )
+        if not api_key:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Missing API Key",
+            )
 
-    if not compare_digest(api_key, settings.API_KEY):
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid API Key",
-            headers={"WWW-Authenticate": "ApiKey"},
-        )
+        if not compare_digest(api_key, settings.API_KEY):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid API Key",
+                headers={"WWW-Authenticate": "ApiKey"},
+            )
@@ -0,0 +1,67 @@
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.api.compression import ENCODINGS, compress, is_compressible, negotiate
+from src.core.config import settings
+from src.core.timing import phase
+
+
+class CompressionMiddleware:
+    """Pure ASGI middleware compressing response bodies in an encoding the client accepts
+
+    Only bodies sent in one piece are compressed; streamed responses go out
+    as-is, as do bodies under ``min_size`` and responses that already carry a
+    Content-Encoding (cached API pages and static assets bring their own
+    precompressed copies). A strong ETag is weakened, since the compressed
+    bytes differ from the ones it was computed for.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        min_size: int | None = None,
+        encodings: tuple[str, ...] = ENCODINGS,
+    ):
+        self.app = app
+        self.min_size = settings.COMPRESSION_MIN_SIZE if min_size is None else min_size
+        self.encodings = encodings
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate(Headers(scope=scope).get("accept-encoding"), self.encodings)
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if start is not None and message["type"] == "http.response.body":
+                headers = MutableHeaders(scope=start)
+                body = message.get("body", b"")
+                if (
+                    not message.get("more_body", False)
+                    and len(body) >= self.min_size
+                    and "content-encoding" not in headers
+                    and is_compressible(headers.get("content-type"))
+                ):
+                    with phase("compress"):
+                        body = compress(body, encoding)
+                    headers["Content-Encoding"] = encoding
+                    headers["Content-Length"] = str(len(body))
+                    headers.add_vary_header("Accept-Encoding")
+                    etag = headers.get("etag")
+                    if etag and not etag.startswith("W/"):
+                        headers["ETag"] = f"W/{etag}"
+                    message = {**message, "body": body}
+                await send(start)
+                start = None
+            await send(message)
+
+        await self.app(scope, receive, send_compressed)
@@ -1,4 +1,125 @@
-from slowapi import Limiter
+import logging
+from collections.abc import Awaitable, Callable
+from contextlib import AbstractContextManager
+from contextvars import ContextVar
+from functools import wraps
+from typing import Any
+
+from limits.errors import ConfigurationError
+from limits.storage import MemoryStorage
+from slowapi import Limiter, _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
 from slowapi.util import get_remote_address
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.core.config import settings
+from src.core.timing import phase
+from src.infrastructure.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Keep a slow or unreachable store from stalling requests before the fallback kicks in
+REDIS_STORAGE_OPTIONS: dict[str, Any] = {"socket_timeout": 0.1, "socket_connect_timeout": 0.1}
+
+RATE_LIMIT_REJECTIONS = registry.counter(
+    "rate_limit_rejections_total", "Requests rejected by the rate limiter", ["route"]
+)
+
+
+type Endpoint = Callable[..., Awaitable[Any]]
+
+# The open ``limiter`` phase of the current request, until its endpoint body starts
+_limit_check: ContextVar[AbstractContextManager[None] | None] = ContextVar(
+    "limit_check", default=None
+)
+
+
+def _end_limit_check() -> None:
+    check = _limit_check.get()
+    if check is not None:
+        _limit_check.set(None)
+        check.__exit__(None, None, None)
+
+
+class TimedLimiter(Limiter):
+    """Limiter recording the limit check as the ``limiter`` request phase
+
+    slowapi has no hook around the check, so ``limit`` wraps each endpoint on
+    both sides of slowapi's own wrapper: the outer one opens the phase and the
+    inner one closes it as the endpoint body starts. A rejected request never
+    reaches the body, and the phase is closed as the 429 passes back out.
+    """
+
+    def limit(self, *args: Any, **kwargs: Any) -> Callable[[Endpoint], Endpoint]:
+        check_limit = super().limit(*args, **kwargs)
+
+        def decorator(func: Endpoint) -> Endpoint:
+            @wraps(func)
+            async def body(*args: Any, **kwargs: Any) -> Any:
+                _end_limit_check()
+                return await func(*args, **kwargs)
+
+            limited = check_limit(body)
+
+            @wraps(limited)
+            async def timed(*args: Any, **kwargs: Any) -> Any:
+                check = phase("limiter")
+                check.__enter__()
+                token = _limit_check.set(check)
+                try:
+                    return await limited(*args, **kwargs)
+                finally:
+                    _end_limit_check()
+                    _limit_check.reset(token)
+
+            return timed
+
+        return decorator
+
+
+def create_limiter(
+    storage_uri: str = settings.RATE_LIMIT_STORAGE_URI,
+    strategy: str = settings.RATE_LIMIT_STRATEGY,
+) -> Limiter:
+    """Build the rate limiter on a storage shared by every instance
+
+    With a Redis storage the sliding-window-counter strategy costs one round
+    trip (a single Lua script) per request. If the storage becomes
+    unreachable, slowapi keeps enforcing each route's own limits in process
+    memory and probes the storage with backoff until it recovers.
+    """
+    storage_options: dict[str, Any] = (
+        REDIS_STORAGE_OPTIONS if storage_uri.startswith("redis") else {}
+    )
+    try:
+        return TimedLimiter(
+            key_func=get_remote_address,
+            storage_uri=storage_uri,
+            storage_options=storage_options,
+            strategy=strategy,
+            in_memory_fallback_enabled=True,
+            key_prefix="starwars",
+        )
+    except ConfigurationError as exc:
+        logger.warning(f"Rate limit storage {storage_uri} unavailable ({exc}), limiting locally")
+        return TimedLimiter(key_func=get_remote_address, storage_uri="memory://", strategy=strategy)
+
+
+def limits_in_process(limiter: Limiter) -> bool:
+    """Whether ``limiter`` counts requests in this process's memory
+
+    True for memory://, and for a store create_limiter could not set up (such
+    as redis:// without the "redis" extra) and replaced with memory.
+    """
+    return isinstance(limiter.limiter.storage, MemoryStorage)
+
+
+limiter = create_limiter()
+
 
-limiter = Limiter(key_func=get_remote_address)
+def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded) -> Response:
+    """Count the rejection, then answer like slowapi's default handler"""
+    route = request.scope.get("route")
+    RATE_LIMIT_REJECTIONS.inc((getattr(route, "path", request.url.path),))
+    return _rate_limit_exceeded_handler(request, exc)
@@ -0,0 +1,62 @@
+import logging
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from src.core.config import settings
+from src.core.timing import start_timing, stop_timing
+
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """Pure ASGI middleware collecting the phase timings of each request
+
+    Code on the request path records phases with ``src.core.timing.phase``.
+    The timings are sent as a ``Server-Timing`` header, which browser devtools
+    show in the request's Timing tab, and requests slower than
+    ``slow_request_ms`` are logged with one ``<phase>_ms`` field per phase.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        emit_header: bool | None = None,
+        slow_request_ms: float | None = None,
+    ):
+        self.app = app
+        self.emit_header = settings.server_timing_enabled if emit_header is None else emit_header
+        self.slow_request_ms = (
+            settings.SLOW_REQUEST_LOG_MS if slow_request_ms is None else slow_request_ms
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = start_timing()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.emit_header:
+                    MutableHeaders(scope=message).append("Server-Timing", timing.header())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_timing(token)
+            timings = timing.log_fields()
+            if timings["duration_ms"] >= self.slow_request_ms:
+                route = scope.get("route")
+                fields = {
+                    "method": scope["method"],
+                    "route": getattr(route, "path", scope["path"]),
+                    "status": status,
+                    **timings,
+                }
+                logger.info("Request timing", extra={"fields": fields})
@@ -0,0 +1,59 @@
+from collections.abc import Awaitable, Callable, Mapping, Sequence
+from typing import Any
+
+from fastapi import HTTPException, status
+
+from src.application.ports.swapi_client import SwapiClient
+from src.application.use_cases.expand_relations import ExpandRelations
+from src.application.use_cases.get_by_ids import GetByIds
+from src.domain.value_objects.filters import SearchFilters
+
+type ListExecute = Callable[[SearchFilters], Awaitable[Mapping[str, Any]]]
+
+# Response cache key of a page and the coroutine function that renders it
+type Page = tuple[str, Callable[[], Awaitable[Any]]]
+
+
+def list_page(
+    resource: str,
+    client: SwapiClient,
+    execute: ListExecute,
+    filters: SearchFilters,
+    relations: Sequence[str] = (),
+) -> Page:
+    """One list page, for the response cache
+
+    The cache key depends only on the resource and the query, so a page
+    rendered for a list route is reused by /batch and the other way round.
+    """
+
+    async def render() -> Mapping[str, Any]:
+        result = await execute(filters)
+        if relations:
+            result = await ExpandRelations(client).execute(result, relations)
+        return result
+
+    return f"{resource}:{filters!r}:expand={','.join(relations)}", render
+
+
+def records_page(resource: str, client: SwapiClient, ids: Sequence[int]) -> Page:
+    """The records of a ``?ids=`` lookup, for the response cache"""
+    return (
+        f"{resource}:ids={','.join(map(str, ids))}",
+        lambda: GetByIds(client, resource).execute(ids),
+    )
+
+
+def record_page(resource: str, client: SwapiClient, record_id: int) -> Page:
+    """One record, for the response cache; rendering it is a 404 if there is none"""
+
+    async def render() -> Any:
+        page = await GetByIds(client, resource).execute((record_id,))
+        if not page["results"]:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"No {resource} with ID {record_id}",
+            )
+        return page["results"][0]
+
+    return f"{resource}:id={record_id}", render
@@ -0,0 +1,163 @@
+import json
+import math
+import time
+from collections.abc import Awaitable, Callable, Mapping
+from dataclasses import dataclass, field, is_dataclass
+from typing import Any
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from src.api.compression import compress, negotiate
+from src.api.etags import entity_tag, etag_matches
+from src.core.config import settings
+from src.core.timing import phase
+from src.domain.entities import data_fields
+from src.infrastructure.cache import LRUCache
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def _default(obj: Any) -> Any:
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return {field.name: getattr(obj, field.name) for field in data_fields(obj)}
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize to compact JSON with orjson, or the stdlib encoder without it"""
+    if orjson is not None:
+        body: bytes = orjson.dumps(
+            content, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS
+        )
+        return body
+    return json.dumps(content, default=_default, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+class JSONBytesResponse(Response):
+    """JSON response that sends pre-serialized bytes as-is"""
+
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+
+@dataclass(frozen=True, slots=True)
+class RenderedBody:
+    """Encoded JSON body with its entity tag, computed once when it is rendered
+
+    Compressed copies of the body are kept by content coding, so a cached
+    page is compressed once per coding rather than once per response.
+    """
+
+    body: bytes
+    etag: str
+    compressed: dict[str, bytes] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def of(cls, body: bytes) -> "RenderedBody":
+        return cls(body, entity_tag(body, weak=True))
+
+    def encoded(self, encoding: str) -> bytes:
+        body = self.compressed.get(encoding)
+        if body is None:
+            with phase("compress"):
+                body = self.compressed[encoding] = compress(self.body, encoding)
+        return body
+
+
+class ResponseCache:
+    """Serialized JSON bodies of list results, keyed by resource and query
+
+    Each entry keeps the encoded body and its ETag, so a hit returns the bytes
+    without walking the entities again. Entries live for ``ttl`` seconds,
+    which should stay below the SWAPI fetch TTL so a page never lags the data
+    behind it for long.
+    """
+
+    def __init__(self, max_size: int, ttl: int):
+        self.ttl = ttl
+        self._cache = LRUCache(max_size=max_size, default_ttl=max(ttl, 1))
+
+    async def get_or_render(
+        self, key: str, produce: Callable[[], Awaitable[Any]]
+    ) -> JSONBytesResponse:
+        return JSONBytesResponse(await self.get_or_render_body(key, produce))
+
+    async def get_or_render_body(self, key: str, produce: Callable[[], Awaitable[Any]]) -> bytes:
+        rendered, _ = await self._get_or_render(key, produce)
+        return rendered.body
+
+    async def respond(
+        self, request: Request, key: str, produce: Callable[[], Awaitable[Any]]
+    ) -> Response:
+        """Cached JSON response with ETag and Cache-Control headers
+
+        ``max-age`` is the time the entry has left in the cache. When the
+        request's If-None-Match names the current ETag, the answer is an empty
+        304, and a cached entry is not even rendered. Otherwise the body is
+        sent in the best encoding the client accepts, compressed once per
+        cache entry.
+        """
+        rendered, max_age = await self._get_or_render(key, produce)
+        scope = "public" if settings.HTTP_CACHE_PUBLIC else "private"
+        headers = {
+            "ETag": rendered.etag,
+            "Cache-Control": (
+                f"{scope}, max-age={max_age}, stale-while-revalidate={max(self.ttl, 0)}"
+            ),
+        }
+        if_none_match = request.headers.get("if-none-match")
+        compressible = (
+            settings.COMPRESSION_ENABLED and len(rendered.body) >= settings.COMPRESSION_MIN_SIZE
+        )
+        if compressible:
+            headers["Vary"] = "Accept-Encoding"
+        if if_none_match and etag_matches(if_none_match, rendered.etag):
+            return Response(status_code=304, headers=headers)
+
+        body = rendered.body
+        encoding = negotiate(request.headers.get("accept-encoding")) if compressible else None
+        if encoding is not None:
+            body = rendered.encoded(encoding)
+            headers["Content-Encoding"] = encoding
+        return JSONBytesResponse(body, headers=headers)
+
+    async def _get_or_render(
+        self, key: str, produce: Callable[[], Awaitable[Any]]
+    ) -> tuple[RenderedBody, int]:
+        if self.ttl > 0:
+            with phase("cache"):
+                entry = self._cache.get_entry(key)
+            if entry is not None:
+                remaining = entry.expires_at - time.monotonic()
+                if remaining > 0:
+                    return entry.value, math.ceil(remaining)
+
+        result = await produce()
+        with phase("serialize"):
+            rendered = RenderedBody.of(dumps(result))
+        if self.ttl > 0:
+            self._cache.set(key, rendered)
+        return rendered, max(self.ttl, 0)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> dict[str, int]:
+        return self._cache.stats()
+
+
+response_cache = ResponseCache(
+    max_size=settings.RESPONSE_CACHE_MAX_SIZE, ttl=settings.RESPONSE_CACHE_TTL_SECONDS
+)
@@ -0,0 +1,110 @@
+import asyncio
+import logging
+from typing import Literal
+
+import httpx
+from fastapi import APIRouter, Depends, Request
+from pydantic import BaseModel, Field
+
+from src.api.dependencies import get_swapi_client, parse_expand
+from src.api.middleware.auth import verify_api_key
+from src.api.middleware.rate_limit import limiter
+from src.api.pages import ListExecute, list_page
+from src.api.responses import JSONBytesResponse, dumps, response_cache
+from src.application.ports.swapi_client import SwapiClient
+from src.application.use_cases.expand_relations import EXPANDABLE
+from src.application.use_cases.get_characters import GetCharacters
+from src.application.use_cases.get_films import GetFilms
+from src.application.use_cases.get_planets import GetPlanets
+from src.application.use_cases.get_starships import GetStarships
+from src.core.config import settings
+from src.domain.entities.character import Character
+from src.domain.entities.planet import Planet
+from src.domain.entities.starship import Starship
+from src.domain.value_objects.filters import SearchFilters
+from src.infrastructure.circuit_breaker import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/batch", tags=["batch"])
+
+Resource = Literal["people", "planets", "films", "starships"]
+
+
+class BatchQuery(BaseModel):
+    """One list query, with the same parameters as the resource's own route"""
+
+    resource: Resource
+    search: str | None = None
+    page: int = Field(1, ge=1)
+    ordering: str | None = None
+    expand: str | None = None
+
+
+class BatchRequest(BaseModel):
+    queries: list[BatchQuery] = Field(min_length=1, max_length=settings.BATCH_MAX_QUERIES)
+
+
+def _list_query(
+    query: BatchQuery, client: SwapiClient
+) -> tuple[ListExecute, SearchFilters, tuple[str, ...]]:
+    if query.resource == "films":
+        # Like /films, which only pages
+        return GetFilms(client).execute, SearchFilters(page=query.page), ()
+
+    filters = SearchFilters(search=query.search, page=query.page, ordering=query.ordering)
+    use_case: GetCharacters | GetPlanets | GetStarships
+    entity: type[Character] | type[Planet] | type[Starship]
+    if query.resource == "people":
+        use_case, entity = GetCharacters(client), Character
+    elif query.resource == "planets":
+        use_case, entity = GetPlanets(client), Planet
+    else:
+        use_case, entity = GetStarships(client), Starship
+    return use_case.execute, filters, parse_expand(query.expand, EXPANDABLE[entity])
+
+
+def _error(status: int, detail: str) -> bytes:
+    return dumps({"error": {"status": status, "detail": detail}})
+
+
+@router.post("")
+@limiter.limit(settings.RATE_LIMIT, cost=settings.BATCH_RATE_LIMIT_WEIGHT)
+async def batch(
+    request: Request,
+    body: BatchRequest,
+    client: SwapiClient = Depends(get_swapi_client),
+    _: None = Depends(verify_api_key),
+) -> JSONBytesResponse:
+    """Run several list queries in one request
+
+    The queries run concurrently on the shared SWAPI client and response
+    cache; results come back in the order of ``queries``, each shaped like
+    the resource's own route. A query that fails because SWAPI does is
+    answered with an ``error`` object instead of failing the whole batch.
+    The batch counts as ``BATCH_RATE_LIMIT_WEIGHT`` requests.
+    """
+    # Validate every query before running any of them
+    queries = [(query.resource, *_list_query(query, client)) for query in body.queries]
+    pages = await asyncio.gather(
+        *(
+            response_cache.get_or_render_body(
+                *list_page(resource, client, execute, filters, relations)
+            )
+            for resource, execute, filters, relations in queries
+        ),
+        return_exceptions=True,
+    )
+
+    results = []
+    for (resource, _execute, filters, _relations), page in zip(queries, pages, strict=True):
+        if isinstance(page, CircuitOpenError):
+            results.append(_error(503, "SWAPI is temporarily unavailable"))
+        elif isinstance(page, httpx.HTTPError):
+            logger.warning(f"Batch query {resource} {filters!r} failed: {page!r}")
+            results.append(_error(502, "SWAPI request failed"))
+        elif isinstance(page, BaseException):
+            raise page
+        else:
+            results.append(page)
+    return JSONBytesResponse(b'{"results":[' + b",".join(results) + b"]}")
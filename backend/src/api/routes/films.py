@@ -1,27 +1,42 @@
-from typing import Any
+from fastapi import APIRouter, Depends, Path, Query, Request, Response
 
-from fastapi import APIRouter, Depends, Query, Request
-
-from src.api.dependencies import get_swapi_client
+from src.api.dependencies import get_swapi_client, parse_ids
 from src.api.middleware.auth import verify_api_key
 from src.api.middleware.rate_limit import limiter
+from src.api.pages import list_page, record_page, records_page
+from src.api.responses import response_cache
+from src.application.ports.swapi_client import SwapiClient
 from src.application.use_cases.get_films import GetFilms
+from src.core.config import settings
 from src.domain.value_objects.filters import SearchFilters
-from src.infrastructure.swapi_http_client import SwapiHttpClient
 
 router = APIRouter(prefix="/films", tags=["films"])
 
 
 @router.get("")
-@limiter.limit("100/minute")
+@limiter.limit(settings.RATE_LIMIT)
 async def get_films(
     request: Request,
     page: int = Query(1, ge=1, description="Page number"),
-    client: SwapiHttpClient = Depends(get_swapi_client),
+    ids: str | None = Query(None, description="Look up these comma-separated IDs instead"),
+    client: SwapiClient = Depends(get_swapi_client),
     _: None = Depends(verify_api_key),
-) -> Any:
+) -> Response:
     """Get Star Wars films"""
+    if ids is not None:
+        return await response_cache.respond(request, *records_page("films", client, parse_ids(ids)))
     filters = SearchFilters(page=page)
-    use_case = GetFilms(client)
-    films = await use_case.execute(filters)
-    return films
+    key, render = list_page("films", client, GetFilms(client).execute, filters)
+    return await response_cache.respond(request, key, render)
+
+
+@router.get("/{record_id}")
+@limiter.limit(settings.RATE_LIMIT)
+async def get_film(
+    request: Request,
+    record_id: int = Path(ge=1, description="SWAPI ID"),
+    client: SwapiClient = Depends(get_swapi_client),
+    _: None = Depends(verify_api_key),
+) -> Response:
+    """Get one Star Wars film by ID, 404 if there is none"""
+    return await response_cache.respond(request, *record_page("films", client, record_id))
@@ -1,19 +1,22 @@
-from typing import Any
+from fastapi import APIRouter, Depends, Path, Query, Request, Response
 
-from fastapi import APIRouter, Depends, Query, Request
-
-from src.api.dependencies import get_swapi_client
+from src.api.dependencies import get_swapi_client, parse_expand, parse_ids
 from src.api.middleware.auth import verify_api_key
 from src.api.middleware.rate_limit import limiter
+from src.api.pages import list_page, record_page, records_page
+from src.api.responses import response_cache
+from src.application.ports.swapi_client import SwapiClient
+from src.application.use_cases.expand_relations import EXPANDABLE
 from src.application.use_cases.get_starships import GetStarships
+from src.core.config import settings
+from src.domain.entities.starship import Starship
 from src.domain.value_objects.filters import SearchFilters
-from src.infrastructure.swapi_http_client import SwapiHttpClient
 
 router = APIRouter(prefix="/starships", tags=["starships"])
 
 
 @router.get("")
-@limiter.limit("100/minute")
+@limiter.limit(settings.RATE_LIMIT)
 async def get_starships(
     request: Request,
     search: str | None = Query(None, description="Search starships by name"),
@@ -21,41 +24,29 @@ async def get_starships(
     ordering: str | None = Query(
         None, description="Order by field (name, model, cost). Prefix with - for descending"
     ),
-    client: SwapiHttpClient = Depends(get_swapi_client),
+    expand: str | None = Query(None, description="Resolve related URLs (pilots, films)"),
+    ids: str | None = Query(None, description="Look up these comma-separated IDs instead"),
+    client: SwapiClient = Depends(get_swapi_client),
     _: None = Depends(verify_api_key),
-) -> Any:
+) -> Response:
     """Get Star Wars starships with optional search filter and ordering"""
+    if ids is not None:
+        return await response_cache.respond(
+            request, *records_page("starships", client, parse_ids(ids))
+        )
     filters = SearchFilters(search=search, page=page, ordering=ordering)
-    use_case = GetStarships(client)
-    result = await use_case.execute(filters)
-
-    if ordering and isinstance(result, dict) and "results" in result:
-        reverse = ordering.startswith("-")
-        field = ordering.lstrip("-").strip().lower()
-        try:
-
-            def sort_key(item: Any) -> Any:
-                value = getattr(item, field, None) if hasattr(item, field) else item.get(field, "")
-                if field in [
-                    "cost_in_credits",
-                    "length",
-                    "max_atmosphering_speed",
-                    "crew",
-                    "passengers",
-                    "cargo_capacity",
-                ]:
-                    if not value or str(value).lower() in ["unknown", "n/a", "none"]:
-                        return float("inf") if not reverse else float("-inf")
-                    try:
-                        clean_value = str(value).replace(",", "")
-                        return float(clean_value)
-                    except ValueError:
-                        return float("inf")
+    relations = parse_expand(expand, EXPANDABLE[Starship])
+    key, render = list_page("starships", client, GetStarships(client).execute, filters, relations)
+    return await response_cache.respond(request, key, render)
 
-                return str(value).lower() if value else ""
 
-            result["results"] = sorted(result["results"], key=sort_key, reverse=reverse)
-        except (KeyError, TypeError, AttributeError):
-            pass
-
-    return result
+@router.get("/{record_id}")
+@limiter.limit(settings.RATE_LIMIT)
+async def get_starship(
+    request: Request,
+    record_id: int = Path(ge=1, description="SWAPI ID"),
+    client: SwapiClient = Depends(get_swapi_client),
+    _: None = Depends(verify_api_key),
+) -> Response:
+    """Get one Star Wars starship by ID, 404 if there is none"""
+    return await response_cache.respond(request, *record_page("starships", client, record_id))
@@ -0,0 +1,38 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+
+from src.api.dependencies import get_swapi_client
+from src.api.middleware.auth import verify_api_key
+from src.api.middleware.rate_limit import limiter
+from src.api.responses import JSONBytesResponse, dumps
+from src.application.ports.swapi_client import SwapiClient
+from src.application.use_cases.suggest_names import SuggestionsUnavailableError, SuggestNames
+from src.core.config import settings
+
+router = APIRouter(prefix="/suggest", tags=["suggest"])
+
+
+@router.get("")
+@limiter.limit(settings.SUGGEST_RATE_LIMIT)
+async def suggest(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=100, description="Text typed so far"),
+    limit: int = Query(10, ge=1, le=25, description="Number of suggestions"),
+    client: SwapiClient = Depends(get_swapi_client),
+    _: None = Depends(verify_api_key),
+) -> JSONBytesResponse:
+    """Suggest characters, planets, films and starships whose name starts with ``q``
+
+    Answered from an in-memory prefix index, so it is cheap enough to call on
+    every keystroke; it has its own rate limit and is cacheable by browsers.
+    """
+    try:
+        result = SuggestNames(client).execute(q, limit)
+    except SuggestionsUnavailableError as exc:
+        raise HTTPException(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=str(exc))
+
+    response = JSONBytesResponse(dumps(result))
+    response.headers["Cache-Control"] = (
+        f"private, max-age={settings.SUGGEST_CACHE_MAX_AGE_SECONDS}, "
+        f"stale-while-revalidate={settings.SUGGEST_CACHE_MAX_AGE_SECONDS * 24}"
+    )
+    return response
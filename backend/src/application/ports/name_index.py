@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from src.domain.value_objects.suggestion import Suggestion
+
+
+class NameIndex(ABC):
+    """Names of every record across all resources, looked up by prefix (Port)"""
+
+    @abstractmethod
+    def suggest(self, text: str, limit: int) -> list[Suggestion]:
+        """Best ``limit`` records whose name, or a word of it, starts with ``text``"""
+        pass
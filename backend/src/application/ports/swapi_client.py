@@ -1,9 +1,14 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from src.application.ports.name_index import NameIndex
 from src.domain.value_objects.filters import SearchFilters
 
 
+class RecordNotFoundError(LookupError):
+    """No record of the resource has the requested ID"""
+
+
 class SwapiClient(ABC):
     """Abstract interface for SWAPI data source (Port in Clean Architecture)"""
 
@@ -26,3 +31,21 @@ class SwapiClient(ABC):
     async def get_starships(self, filters: SearchFilters) -> dict[str, Any]:
         """Fetch starships from SWAPI with pagination"""
         pass
+
+    @abstractmethod
+    async def get_resource(self, url: str) -> dict[str, Any]:
+        """Fetch a single SWAPI record by its URL, as found in related fields"""
+        pass
+
+    @abstractmethod
+    async def get_record(self, resource: str, record_id: int) -> dict[str, Any]:
+        """Fetch one record by resource name and ID; RecordNotFoundError if there is none"""
+        pass
+
+    def orders_globally(self, resource: str) -> bool:
+        """Whether list pages of the resource come back ordered across all its records"""
+        return False
+
+    def name_index(self) -> NameIndex | None:
+        """Prefix index of every record's name, for clients holding the whole dataset"""
+        return None
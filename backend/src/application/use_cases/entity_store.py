@@ -0,0 +1,61 @@
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+from src.core.config import settings
+from src.domain.value_objects.record_id import record_id
+
+
+class EntityStore:
+    """LRU of entities with a TTL, keyed by resource name and SWAPI ID
+
+    Use cases add every entity they build, so each list page fills the store
+    as a side effect and a later lookup by ID is usually a dictionary hit.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[tuple[str, int], tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, resource: str, record: int) -> Any | None:
+        key = (resource, record)
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def add(self, resource: str, entities: Iterable[Any]) -> None:
+        """Store entities by the ID at the end of their ``url``"""
+        if self.ttl <= 0:
+            return
+        expires = time.monotonic() + self.ttl
+        for entity in entities:
+            record = record_id(entity.url)
+            if record is None:
+                continue
+            key = (resource, record)
+            if key in self._entries:
+                self._entries.move_to_end(key)
+            elif len(self._entries) >= self.max_size:
+                self._entries.popitem(last=False)
+            self._entries[key] = (expires, entity)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+entity_store = EntityStore(
+    max_size=settings.ENTITY_STORE_MAX_SIZE, ttl=settings.ENTITY_STORE_TTL_SECONDS
+)
@@ -0,0 +1,109 @@
+import asyncio
+import logging
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import Any
+
+from src.application.ports.swapi_client import SwapiClient
+from src.application.use_cases.entity_store import entity_store
+from src.application.use_cases.result_cache import freeze_page
+from src.core.config import settings
+from src.core.timing import phase
+from src.domain.entities import data_fields
+from src.domain.entities.character import Character
+from src.domain.entities.film import Film
+from src.domain.entities.planet import Planet
+from src.domain.entities.starship import Starship
+
+logger = logging.getLogger(__name__)
+
+EXPANDABLE: dict[type, tuple[str, ...]] = {
+    Character: ("homeworld", "films"),
+    Planet: ("residents",),
+    Starship: ("pilots", "films"),
+}
+
+RELATED_ENTITIES: dict[str, Any] = {
+    "people": Character,
+    "planets": Planet,
+    "films": Film,
+    "starships": Starship,
+}
+
+
+def _urls(value: Any) -> list[str]:
+    if isinstance(value, str):
+        return [value] if value else []
+    return list(value)
+
+
+def _entity_for(url: str, record: dict[str, Any]) -> Any:
+    """Build the entity a SWAPI URL points to; the raw record for other resources"""
+    parts = url.rstrip("/").rsplit("/", 2)
+    entity = RELATED_ENTITIES.get(parts[-2]) if len(parts) == 3 else None
+    if entity is None:
+        return record
+    built = entity.from_swapi(record)
+    entity_store.add(parts[-2], (built,))
+    return built
+
+
+class ExpandRelations:
+    """Use case: Replace related SWAPI URLs on a page with the records they point to
+
+    URLs are deduplicated across the whole page, so a planet shared by ten
+    characters is fetched once, and the unique URLs are fetched concurrently
+    through the SWAPI client (and its cache) with at most ``max_concurrency``
+    in flight. A URL that cannot be resolved is left as-is.
+    """
+
+    def __init__(
+        self, swapi_client: SwapiClient, max_concurrency: int = settings.EXPAND_MAX_CONCURRENCY
+    ):
+        self.swapi_client = swapi_client
+        self.max_concurrency = max_concurrency
+
+    async def execute(self, page: Mapping[str, Any], relations: Sequence[str]) -> Mapping[str, Any]:
+        """
+        Execute use case to expand the given relations of every result
+
+        Returns a read-only mapping: {"count": int, "results": tuple[Mapping, ...]}
+        """
+        urls = list(
+            dict.fromkeys(
+                url
+                for entity in page["results"]
+                for relation in relations
+                for url in _urls(getattr(entity, relation))
+            )
+        )
+        resolved = await self._resolve(urls)
+
+        results = []
+        with phase("build"):
+            for entity in page["results"]:
+                item = {field.name: getattr(entity, field.name) for field in data_fields(entity)}
+                for relation in relations:
+                    value = item[relation]
+                    if isinstance(value, str):
+                        item[relation] = resolved.get(value, value)
+                    else:
+                        item[relation] = tuple(resolved.get(url, url) for url in value)
+                results.append(MappingProxyType(item))
+        return freeze_page(page["count"], results)
+
+    async def _resolve(self, urls: list[str]) -> dict[str, Any]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(url: str) -> Any:
+            async with semaphore:
+                return _entity_for(url, await self.swapi_client.get_resource(url))
+
+        entities = await asyncio.gather(*(fetch(url) for url in urls), return_exceptions=True)
+        resolved = {}
+        for url, entity in zip(urls, entities, strict=True):
+            if isinstance(entity, BaseException):
+                logger.warning(f"Could not expand {url}: {entity!r}")
+            else:
+                resolved[url] = entity
+        return resolved
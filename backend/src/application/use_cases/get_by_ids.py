@@ -0,0 +1,73 @@
+import asyncio
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
+from typing import Any
+
+from src.application.ports.swapi_client import RecordNotFoundError, SwapiClient
+from src.application.use_cases.entity_store import entity_store
+from src.application.use_cases.expand_relations import RELATED_ENTITIES
+from src.core.config import settings
+from src.core.timing import phase
+
+
+class GetByIds:
+    """Use case: Look up records of one resource by their SWAPI IDs
+
+    IDs held in the entity store are answered from it; the others are fetched
+    concurrently, with at most ``max_concurrency`` in flight, and stored.
+    """
+
+    def __init__(
+        self,
+        swapi_client: SwapiClient,
+        resource: str,
+        max_concurrency: int = settings.EXPAND_MAX_CONCURRENCY,
+    ):
+        self.swapi_client = swapi_client
+        self.resource = resource
+        self.entity = RELATED_ENTITIES[resource]
+        self.max_concurrency = max_concurrency
+
+    async def execute(self, ids: Sequence[int]) -> Mapping[str, Any]:
+        """
+        Execute use case to get the records with the given IDs
+
+        Returns a read-only mapping: {"count": int, "results": tuple[Entity, ...],
+        "missing": tuple[int, ...]} with results in the order of ``ids``
+        """
+        with phase("cache"):
+            found = {
+                record: entity
+                for record in ids
+                if (entity := entity_store.get(self.resource, record)) is not None
+            }
+        misses = [record for record in ids if record not in found]
+        if misses:
+            found.update(await self._fetch(misses))
+
+        return MappingProxyType(
+            {
+                "count": len(found),
+                "results": tuple(found[record] for record in ids if record in found),
+                "missing": tuple(record for record in ids if record not in found),
+            }
+        )
+
+    async def _fetch(self, ids: list[int]) -> dict[int, Any]:
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def fetch(record: int) -> dict[str, Any]:
+            async with semaphore:
+                return await self.swapi_client.get_record(self.resource, record)
+
+        responses = await asyncio.gather(*(fetch(record) for record in ids), return_exceptions=True)
+        fetched = {}
+        with phase("build"):
+            for record, response in zip(ids, responses, strict=True):
+                if isinstance(response, RecordNotFoundError):
+                    continue
+                if isinstance(response, BaseException):
+                    raise response
+                fetched[record] = self.entity.from_swapi(response)
+        entity_store.add(self.resource, fetched.values())
+        return fetched
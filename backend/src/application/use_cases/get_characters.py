@@ -1,22 +1,37 @@
+from collections.abc import Mapping
 from typing import Any
 
 from src.application.ports.swapi_client import SwapiClient
+from src.application.use_cases.entity_store import entity_store
+from src.application.use_cases.result_cache import cached_result, freeze_page
+from src.core.timing import phase
 from src.domain.entities.character import Character
 from src.domain.value_objects.filters import SearchFilters
+from src.domain.value_objects.ordering import Ordering
 
 
 class GetCharacters:
-    """Use case: Retrieve Star Wars characters with optional search"""
+    """Use case: Retrieve Star Wars characters with optional search and ordering"""
 
     def __init__(self, swapi_client: SwapiClient):
         self.swapi_client = swapi_client
 
-    async def execute(self, filters: SearchFilters) -> dict[str, Any]:
+    @cached_result
+    async def execute(self, filters: SearchFilters) -> Mapping[str, Any]:
         """
         Execute use case to get characters from SWAPI
 
-        Returns dict with: {"count": int, "results": List[Character]}
+        Returns a read-only mapping: {"count": int, "results": tuple[Character, ...]}
         """
+        # Checked first: the mirror may finish loading while the page is fetched
+        ordered = self.swapi_client.orders_globally("people")
         response = await self.swapi_client.get_characters(filters)
-        characters = [Character.from_swapi(item) for item in response["results"]]
-        return {"count": response["count"], "results": characters}
+        with phase("build"):
+            characters = [Character.from_swapi(item) for item in response["results"]]
+        entity_store.add("people", characters)
+
+        ordering = Ordering.parse(filters.ordering)
+        if ordering and not ordered:
+            with phase("sort"):
+                characters = ordering.sort(characters)
+        return freeze_page(response["count"], characters)
@@ -0,0 +1,84 @@
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Mapping
+from functools import wraps
+from types import MappingProxyType
+from typing import Any
+
+from src.core.config import settings
+from src.core.timing import phase
+from src.domain.value_objects.filters import SearchFilters
+
+type Execute[UseCase] = Callable[[UseCase, SearchFilters], Awaitable[Mapping[str, Any]]]
+
+
+def freeze_page(count: int, results: list[Any]) -> Mapping[str, Any]:
+    """Read-only ``{"count", "results"}`` page that callers can safely share"""
+    return MappingProxyType({"count": count, "results": tuple(results)})
+
+
+class ResultCache:
+    """LRU of use case results with a TTL, keyed by use case, client and filters
+
+    Results are frozen pages of frozen entities, so one cached page is handed
+    to every caller as-is: a hit is a single dictionary lookup.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, Mapping[str, Any]]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Mapping[str, Any] | None:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, result: Mapping[str, Any]) -> None:
+        if key in self._entries:
+            self._entries.move_to_end(key)
+        elif len(self._entries) >= self.max_size:
+            self._entries.popitem(last=False)
+        self._entries[key] = (time.monotonic() + self.ttl, result)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+
+result_cache = ResultCache(
+    max_size=settings.RESULT_CACHE_MAX_SIZE, ttl=settings.RESULT_CACHE_TTL_SECONDS
+)
+
+
+def cached_result[UseCase](execute: Execute[UseCase]) -> Execute[UseCase]:
+    """Cache a use case's ``execute`` on (use case, SWAPI client, filters)
+
+    The client is part of the key because the mirror and the HTTP client can
+    answer the same filters differently (global vs per-page ordering).
+    """
+
+    @wraps(execute)
+    async def wrapper(self: UseCase, filters: SearchFilters) -> Mapping[str, Any]:
+        if result_cache.ttl <= 0:
+            return await execute(self, filters)
+
+        key = (type(self), getattr(self, "swapi_client", None), filters)
+        with phase("cache"):
+            result = result_cache.get(key)
+        if result is None:
+            result = await execute(self, filters)
+            result_cache.set(key, result)
+        return result
+
+    return wrapper
@@ -0,0 +1,26 @@
+from collections.abc import Mapping
+from typing import Any
+
+from src.application.ports.swapi_client import SwapiClient
+
+
+class SuggestionsUnavailableError(Exception):
+    """The SWAPI client does not hold the whole dataset (yet)"""
+
+
+class SuggestNames:
+    """Use case: Suggest records across all resources as the user types"""
+
+    def __init__(self, swapi_client: SwapiClient):
+        self.swapi_client = swapi_client
+
+    def execute(self, text: str, limit: int) -> Mapping[str, Any]:
+        """
+        Execute use case to rank the names matching what was typed so far
+
+        Returns {"results": list[Suggestion]}
+        """
+        index = self.swapi_client.name_index()
+        if index is None:
+            raise SuggestionsUnavailableError("Suggestions are available once SWAPI is mirrored")
+        return {"results": index.suggest(text, limit)}
@@ -13,11 +13,96 @@ class Settings(BaseSettings):
 
     SWAPI_BASE_URL: str = "https://swapi.dev/api"
     CACHE_TTL_SECONDS: int = 3600
+    CACHE_MAX_SIZE: int = 10_000
+    CACHE_STALE_TTL_SECONDS: int = 3600
+    CACHE_STALE_IF_ERROR_SECONDS: int = 86400
+    CACHE_L1_MAX_TTL_SECONDS: int | None = None
+
+    RESULT_CACHE_TTL_SECONDS: int = 60
+    RESULT_CACHE_MAX_SIZE: int = 2_000
+    RESPONSE_CACHE_TTL_SECONDS: int = 60
+    RESPONSE_CACHE_MAX_SIZE: int = 2_000
+    # Let shared caches (a CDN) store API responses; only if they check the API key
+    HTTP_CACHE_PUBLIC: bool = False
+    ENTITY_STORE_TTL_SECONDS: int = 300
+    ENTITY_STORE_MAX_SIZE: int = 5_000
+
+    CACHE_REDIS_URL: str = ""
+    CACHE_REDIS_PREFIX: str = "starwars:"
+    CACHE_REDIS_MAX_TTL_SECONDS: int = 86400
+    CACHE_REDIS_TIMEOUT_SECONDS: float = 0.1
+
+    SWAPI_MAX_CONNECTIONS: int = 100
+    SWAPI_MAX_KEEPALIVE_CONNECTIONS: int = 20
+    SWAPI_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    SWAPI_HTTP2: bool = False
+    SWAPI_CONNECT_TIMEOUT_SECONDS: float = 3.0
+    SWAPI_READ_TIMEOUT_SECONDS: float = 10.0
+    SWAPI_REQUEST_BUDGET_SECONDS: float = 15.0
+    SWAPI_RETRIES: int = 2
+    SWAPI_RETRY_BACKOFF_SECONDS: float = 0.2
+    SWAPI_BREAKER_FAILURE_RATIO: float = 0.5
+    SWAPI_BREAKER_WINDOW: int = 20
+    SWAPI_BREAKER_MIN_CALLS: int = 10
+    SWAPI_BREAKER_RESET_SECONDS: float = 30.0
+    SWAPI_MIRROR_ENABLED: bool = True
+    # Serve from this snapshot file (python -m src.snapshot) instead of SWAPI
+    SWAPI_SNAPSHOT_PATH: str = ""
+    EXPAND_MAX_CONCURRENCY: int = 10
+    IDS_MAX_COUNT: int = 50
+
+    WARMUP_ENABLED: bool = True
+    WARMUP_PAGES: int = 3
+    WARMUP_SEARCH_TERMS: str = "skywalker,vader,tatooine,falcon,star"
+    WARMUP_TIMEOUT_SECONDS: float = 15.0
+    WARMUP_REFRESH_INTERVAL_SECONDS: float = 240.0
 
     RATE_LIMIT: str = "100/minute"
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
+    RATE_LIMIT_STRATEGY: str = "sliding-window-counter"
+    # /suggest is called on every keystroke, so it has its own, higher limit
+    SUGGEST_RATE_LIMIT: str = "600/minute"
+    SUGGEST_CACHE_MAX_AGE_SECONDS: int = 3600
+    # A /batch request counts as this many requests against RATE_LIMIT
+    BATCH_RATE_LIMIT_WEIGHT: int = 1
+    BATCH_MAX_QUERIES: int = 10
 
     CORS_ORIGINS: str = "*"
 
+    # python -m src.serve; PORT is set by Cloud Run
+    SERVER_HOST: str = "0.0.0.0"
+    PORT: int = 8080
+    # 0 runs one worker per CPU available to the container, given a shared
+    # RATE_LIMIT_STORAGE_URI; with memory:// (the default) a single worker runs
+    SERVER_WORKERS: int = 0
+    SERVER_BACKLOG: int = 2048
+    SERVER_KEEPALIVE_SECONDS: int = 5
+    # Connections over this many get a 503 (0 is unlimited)
+    SERVER_LIMIT_CONCURRENCY: int = 0
+    # Workers that exit are replaced after 1s, 2s, 4s... up to the max; more exits than
+    # the limit within the window stop the server with status 1
+    SERVER_RESTART_BACKOFF_MAX_SECONDS: float = 30.0
+    SERVER_RESTART_LIMIT: int = 5
+    SERVER_RESTART_WINDOW_SECONDS: float = 60.0
+    # With several workers, crawl SWAPI once in the parent and share it as a snapshot;
+    # the data is then frozen until a restart, so this is opt-in
+    SERVER_SHARE_WARM_DATA: bool = False
+
+    COMPRESSION_ENABLED: bool = True
+    COMPRESSION_MIN_SIZE: int = 1024
+    # Best first; br and zstd need the "compression" extra
+    COMPRESSION_ENCODINGS: str = "zstd,br,gzip"
+
+    METRICS_ENABLED: bool = True
+    # Serve /metrics on this port, without the API key the app's port requires (0: on the
+    # app's port). Under src.serve with several workers, worker i listens on
+    # METRICS_PORT + i (9100 + i when 0) with its own counts
+    METRICS_PORT: int = 0
+    # Server-Timing headers are always sent outside production
+    SERVER_TIMING_ENABLED: bool = False
+    # Requests at least this slow are logged with their phase timings (0 logs all)
+    SLOW_REQUEST_LOG_MS: float = 1000.0
+
     @property
     def cors_origins_list(self) -> list[str]:
         """Convert comma-separated CORS origins to list"""
@@ -25,5 +110,23 @@ class Settings(BaseSettings):
             return ["*"]
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
+    @property
+    def server_timing_enabled(self) -> bool:
+        return self.SERVER_TIMING_ENABLED or self.ENVIRONMENT != "production"
+
+    @property
+    def compression_encodings_list(self) -> list[str]:
+        """Convert comma-separated content codings to list"""
+        return [
+            encoding.strip().lower()
+            for encoding in self.COMPRESSION_ENCODINGS.split(",")
+            if encoding.strip()
+        ]
+
+    @property
+    def warmup_search_terms_list(self) -> list[str]:
+        """Convert comma-separated warm-up search terms to list"""
+        return [term.strip() for term in self.WARMUP_SEARCH_TERMS.split(",") if term.strip()]
+
 
 settings = Settings()
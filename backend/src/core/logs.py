@@ -0,0 +1,21 @@
+import json
+import logging
+
+
+class JSONFormatter(logging.Formatter):
+    """One JSON object per line for Cloud Logging
+
+    Structured fields passed as ``extra={"fields": {...}}`` are added as
+    top-level keys next to time, level and msg.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "msg": record.getMessage(),
+            **getattr(record, "fields", {}),
+        }
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(payload, default=str)
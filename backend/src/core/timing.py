@@ -0,0 +1,90 @@
+import time
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import ContextVar, Token
+from types import TracebackType
+
+_current: ContextVar["ServerTiming | None"] = ContextVar("server_timing", default=None)
+_untimed = nullcontext()
+
+
+class ServerTiming:
+    """Phase durations of one request
+
+    A phase entered more than once (one SWAPI call per expanded record, a
+    cache lookup per layer) accumulates its durations and counts. Tasks
+    started during the request inherit the context, so their phases are
+    recorded too; concurrent phases can add up to more than the total.
+    """
+
+    __slots__ = ("durations", "counts", "start")
+
+    def __init__(self) -> None:
+        self.durations: dict[str, float] = {}
+        self.counts: dict[str, int] = {}
+        self.start = time.perf_counter()
+
+    def add(self, name: str, seconds: float) -> None:
+        self.durations[name] = self.durations.get(name, 0.0) + seconds
+        self.counts[name] = self.counts.get(name, 0) + 1
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.start
+
+    def header(self) -> str:
+        """Server-Timing header value, durations in milliseconds"""
+        metrics = []
+        for name, seconds in self.durations.items():
+            metric = f"{name};dur={seconds * 1000:.2f}"
+            if self.counts[name] > 1:
+                metric += f';desc="{self.counts[name]} calls"'
+            metrics.append(metric)
+        metrics.append(f"total;dur={self.elapsed() * 1000:.2f}")
+        return ", ".join(metrics)
+
+    def log_fields(self) -> dict[str, float]:
+        fields = {
+            f"{name}_ms": round(seconds * 1000, 2) for name, seconds in self.durations.items()
+        }
+        fields["duration_ms"] = round(self.elapsed() * 1000, 2)
+        return fields
+
+
+class _Phase:
+    __slots__ = ("timing", "name", "start")
+
+    def __init__(self, timing: ServerTiming, name: str):
+        self.timing = timing
+        self.name = name
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.timing.add(self.name, time.perf_counter() - self.start)
+
+
+def phase(name: str) -> AbstractContextManager[None]:
+    """Time the enclosed block as ``name`` if the current request is timed
+
+    Outside a timed request this returns a shared no-op context manager, so
+    instrumented code costs one context variable lookup.
+    """
+    timing = _current.get()
+    if timing is None:
+        return _untimed
+    return _Phase(timing, name)
+
+
+def start_timing() -> tuple[ServerTiming, Token["ServerTiming | None"]]:
+    timing = ServerTiming()
+    return timing, _current.set(timing)
+
+
+def stop_timing(token: Token["ServerTiming | None"]) -> None:
+    _current.reset(token)
@@ -1 +1,7 @@
+from dataclasses import Field, fields
+from typing import Any
 
+
+def data_fields(entity: Any) -> tuple[Field[Any], ...]:
+    """An entity's own fields, without the values ``__post_init__`` derives from them"""
+    return tuple(field for field in fields(entity) if field.init)
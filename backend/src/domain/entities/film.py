@@ -1,9 +1,13 @@
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
+from src.domain.value_objects.ordering import parse_numeric_fields
 
-@dataclass
+
+@dataclass(frozen=True)
 class Film:
+    NUMERIC_FIELDS: ClassVar[frozenset[str]] = frozenset({"episode_id"})
+
     title: str
     episode_id: int
     opening_crawl: str
@@ -12,6 +16,11 @@ class Film:
     release_date: str
     url: str
 
+    numeric_values: dict[str, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "numeric_values", parse_numeric_fields(self, self.NUMERIC_FIELDS))
+
     @classmethod
     def from_swapi(cls, data: dict[str, Any]) -> "Film":
         return cls(
@@ -1,9 +1,15 @@
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
+from src.domain.value_objects.ordering import parse_numeric_fields
 
-@dataclass
+
+@dataclass(frozen=True)
 class Planet:
+    NUMERIC_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {"rotation_period", "orbital_period", "diameter", "surface_water", "population"}
+    )
+
     name: str
     rotation_period: str
     orbital_period: str
@@ -14,6 +20,13 @@ class Planet:
     surface_water: str
     population: str
     url: str
+    residents: list[str] = field(default_factory=list)
+    films: list[str] = field(default_factory=list)
+
+    numeric_values: dict[str, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "numeric_values", parse_numeric_fields(self, self.NUMERIC_FIELDS))
 
     @classmethod
     def from_swapi(cls, data: dict[str, Any]) -> "Planet":
@@ -28,4 +41,6 @@ class Planet:
             surface_water=data["surface_water"],
             population=data["population"],
             url=data["url"],
+            residents=data.get("residents", []),
+            films=data.get("films", []),
         )
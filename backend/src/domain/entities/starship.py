@@ -1,9 +1,22 @@
-from dataclasses import dataclass
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, ClassVar
 
+from src.domain.value_objects.ordering import parse_numeric_fields
 
-@dataclass
+
+@dataclass(frozen=True)
 class Starship:
+    NUMERIC_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "cost_in_credits",
+            "length",
+            "max_atmosphering_speed",
+            "crew",
+            "passengers",
+            "cargo_capacity",
+        }
+    )
+
     name: str
     model: str
     manufacturer: str
@@ -17,6 +30,13 @@ class Starship:
     hyperdrive_rating: str
     starship_class: str
     url: str
+    pilots: list[str] = field(default_factory=list)
+    films: list[str] = field(default_factory=list)
+
+    numeric_values: dict[str, float] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "numeric_values", parse_numeric_fields(self, self.NUMERIC_FIELDS))
 
     @classmethod
     def from_swapi(cls, data: dict[str, Any]) -> "Starship":
@@ -34,4 +54,6 @@ class Starship:
             hyperdrive_rating=data["hyperdrive_rating"],
             starship_class=data["starship_class"],
             url=data["url"],
+            pilots=data.get("pilots", []),
+            films=data.get("films", []),
         )
@@ -0,0 +1,102 @@
+import math
+from array import array
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any, Final, TypeVar
+
+from src.domain.entities import data_fields
+
+T = TypeVar("T")
+
+UNKNOWN: Final[float] = math.nan
+"""Parsed value of "unknown", "n/a" and other non-numeric SWAPI values"""
+
+UNKNOWN_VALUES = frozenset({"", "unknown", "n/a", "none"})
+
+
+def parse_numeric(value: Any) -> float:
+    """Parse SWAPI numeric strings like "1,000,000"; UNKNOWN when not a number"""
+    if value is None or str(value).strip().lower() in UNKNOWN_VALUES:
+        return UNKNOWN
+    try:
+        return float(str(value).replace(",", ""))
+    except ValueError:
+        return UNKNOWN
+
+
+def is_unknown(number: float) -> bool:
+    return math.isnan(number)
+
+
+def parse_numeric_fields(entity: Any, fields: Iterable[str]) -> dict[str, float]:
+    """Parsed values of an entity's numeric fields, computed once when it is built"""
+    return {field: parse_numeric(getattr(entity, field)) for field in fields}
+
+
+@dataclass(frozen=True)
+class Ordering:
+    """Ordering requested through the ``ordering`` query parameter
+
+    ``-field`` means descending. Numeric fields compare by value and records
+    with an unknown value always come last, whatever the direction. Sorting is
+    stable, so re-sorting an already ordered slice leaves it unchanged.
+    """
+
+    field: str
+    descending: bool = False
+
+    @classmethod
+    def parse(cls, ordering: str | None) -> "Ordering | None":
+        if not ordering:
+            return None
+        field = ordering.lstrip("-").strip().lower()
+        if not field:
+            return None
+        return cls(field=field, descending=ordering.startswith("-"))
+
+    def sort(self, items: Sequence[T]) -> list[T]:
+        return [items[i] for i in SortColumns(items).argsort(self)]
+
+
+class SortColumns:
+    """Column store of sort keys for a list of entities
+
+    Fields an entity lists in ``NUMERIC_FIELDS`` come already parsed in its
+    ``numeric_values`` and are copied into ``array('d')`` columns, with the
+    known and unknown positions split up front. An argsort is then a single
+    ``sorted`` over positions keyed by the column's C-level ``__getitem__``,
+    with no per-item parsing or Python key function. Columns are built on first
+    use and reused for every later ordering of the same items.
+    """
+
+    def __init__(self, items: Sequence[Any]):
+        self.items = items
+        self._numeric: dict[str, tuple[array[float], list[int], list[int]]] = {}
+        self._text: dict[str, list[str]] = {}
+
+    def argsort(self, ordering: Ordering) -> list[int]:
+        """Positions of the items in the requested order"""
+        field = ordering.field
+        if not self.items or field not in {f.name for f in data_fields(self.items[0])}:
+            return list(range(len(self.items)))
+
+        if field in self.items[0].numeric_values:
+            column, known, unknown = self._numeric_column(field)
+            return sorted(known, key=column.__getitem__, reverse=ordering.descending) + unknown
+
+        keys = self._text_column(field)
+        return sorted(range(len(keys)), key=keys.__getitem__, reverse=ordering.descending)
+
+    def _numeric_column(self, field: str) -> tuple[array[float], list[int], list[int]]:
+        if field not in self._numeric:
+            column = array("d", (item.numeric_values[field] for item in self.items))
+            known = [i for i, number in enumerate(column) if not is_unknown(number)]
+            unknown = [i for i, number in enumerate(column) if is_unknown(number)]
+            self._numeric[field] = (column, known, unknown)
+        return self._numeric[field]
+
+    def _text_column(self, field: str) -> list[str]:
+        if field not in self._text:
+            values = (getattr(item, field) for item in self.items)
+            self._text[field] = [str(value).lower() if value else "" for value in values]
+        return self._text[field]
@@ -0,0 +1,4 @@
+def record_id(url: str) -> int | None:
+    """SWAPI ID at the end of a record URL such as https://swapi.dev/api/people/1/"""
+    last = url.rstrip("/").rsplit("/", 1)[-1]
+    return int(last) if last.isdigit() else None
@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Suggestion:
+    """A record offered while the user types: its name, resource and SWAPI URL"""
+
+    name: str
+    resource: str
+    url: str
@@ -1,70 +1,298 @@
+import asyncio
+import logging
 import time
-from collections.abc import Callable
-from functools import wraps
+from abc import ABC, abstractmethod
+from collections import Counter, OrderedDict
+from collections.abc import Awaitable, Callable
+from functools import partial, wraps
 from typing import Any
 
+from src.core.config import settings
+from src.core.timing import phase
+from src.infrastructure.circuit_breaker import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
 
 class CacheEntry:
-    """Cache entry with TTL support"""
+    """Cache entry with TTL support
+
+    ``expires_at`` is the soft expiry: after it the value is stale. A stale
+    value is kept until ``retain_until`` so it can still be served while it is
+    revalidated (until ``stale_until``) or when revalidation fails.
+    """
+
+    __slots__ = ("value", "expires_at", "stale_until", "retain_until")
 
-    def __init__(self, value: Any, ttl_seconds: int):
+    def __init__(
+        self,
+        value: Any,
+        ttl_seconds: float,
+        now: float | None = None,
+        stale_ttl: float = 0,
+        stale_if_error_ttl: float = 0,
+    ):
         self.value = value
-        self.expires_at = time.time() + ttl_seconds
+        self.expires_at = (time.monotonic() if now is None else now) + ttl_seconds
+        self.stale_until = self.expires_at + stale_ttl
+        self.retain_until = self.expires_at + max(stale_ttl, stale_if_error_ttl)
 
-    def is_expired(self) -> bool:
-        return time.time() > self.expires_at
+    def is_expired(self, now: float | None = None) -> bool:
+        return (time.monotonic() if now is None else now) > self.expires_at
+
+    def is_revalidatable(self, now: float) -> bool:
+        """True while a stale value may be served and refreshed in the background"""
+        return now <= self.stale_until
+
+    def is_retained(self, now: float) -> bool:
+        return now <= self.retain_until
+
+    def capped(self, max_ttl: float, now: float) -> "CacheEntry":
+        """Copy of this entry that a tier retains for at most max_ttl seconds"""
+        limit = now + max_ttl
+        if self.retain_until <= limit:
+            return self
+        entry = CacheEntry(self.value, 0, now=now)
+        entry.expires_at = min(self.expires_at, limit)
+        entry.stale_until = min(self.stale_until, limit)
+        entry.retain_until = limit
+        return entry
 
 
 class LRUCache:
-    """Simple LRU cache with TTL"""
+    """LRU cache with TTL and O(1) get/set/evict
+
+    Recency is tracked by the insertion order of an OrderedDict: hits move the
+    key to the end and eviction pops from the front. ``max_ttl`` caps how long
+    this tier keeps any entry, whatever TTL it was stored with.
+    """
 
-    def __init__(self, max_size: int = 128, default_ttl: int = 3600):
-        self.cache: dict[str, CacheEntry] = {}
+    name = "memory"
+
+    def __init__(self, max_size: int = 128, default_ttl: int = 3600, max_ttl: int | None = None):
+        self.cache: OrderedDict[str, CacheEntry] = OrderedDict()
         self.max_size = max_size
         self.default_ttl = default_ttl
-        self.access_order: list[str] = []
+        self.max_ttl = max_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
 
     def get(self, key: str) -> Any | None:
-        if key not in self.cache:
+        now = time.monotonic()
+        entry = self._lookup(key, now)
+        if entry is None or entry.is_expired(now):
             return None
+        return entry.value
 
-        entry = self.cache[key]
-        if entry.is_expired():
-            self._evict(key)
-            return None
+    def get_entry(self, key: str) -> CacheEntry | None:
+        """Return the entry for key, including stale entries that are still retained"""
+        return self._lookup(key, time.monotonic())
 
-        self.access_order.remove(key)
-        self.access_order.append(key)
-        return entry.value
+    def _lookup(self, key: str, now: float) -> CacheEntry | None:
+        entry = self.cache.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
 
-    def set(self, key: str, value: Any, ttl: int | None = None) -> None:
-        if key in self.cache:
-            self.access_order.remove(key)
+        if not entry.is_retained(now):
+            del self.cache[key]
+            self.misses += 1
+            return None
 
-        if len(self.cache) >= self.max_size and key not in self.cache:
-            lru_key = self.access_order[0]
-            self._evict(lru_key)
+        self.cache.move_to_end(key)
+        self.hits += 1
+        return entry
 
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: int | None = None,
+        stale_ttl: int = 0,
+        stale_if_error_ttl: int = 0,
+    ) -> None:
         ttl_seconds = ttl or self.default_ttl
-        self.cache[key] = CacheEntry(value, ttl_seconds)
-        self.access_order.append(key)
+        entry = CacheEntry(
+            value,
+            ttl_seconds,
+            stale_ttl=stale_ttl,
+            stale_if_error_ttl=stale_if_error_ttl,
+        )
+        self.set_entry(key, entry)
 
-    def _evict(self, key: str) -> None:
+    def set_entry(self, key: str, entry: CacheEntry) -> None:
         if key in self.cache:
-            del self.cache[key]
-        if key in self.access_order:
-            self.access_order.remove(key)
+            self.cache.move_to_end(key)
+        elif len(self.cache) >= self.max_size:
+            self.cache.popitem(last=False)
+            self.evictions += 1
+
+        if self.max_ttl is not None:
+            entry = entry.capped(self.max_ttl, time.monotonic())
+        self.cache[key] = entry
 
     def clear(self) -> None:
         self.cache.clear()
-        self.access_order.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self.cache),
+        }
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+
+class CacheBackend(ABC):
+    """Second cache tier shared by every process, consulted on L1 misses
+
+    Implementations must turn their own failures into misses so that an
+    unavailable shared cache degrades to the in-process tier only.
+    """
+
+    name: str
+
+    @abstractmethod
+    async def get(self, key: str) -> CacheEntry | None:
+        pass
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        pass
+
+    @abstractmethod
+    async def clear(self) -> None:
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict[str, int]:
+        pass
 
 
-_cache = LRUCache(max_size=128, default_ttl=3600)
+class SingleFlight:
+    """Deduplicate concurrent calls for the same key into one shared task
 
+    The first caller for a key (the leader) starts the call as a task; callers
+    arriving while it is in flight await the same task instead of starting
+    their own. Each caller awaits through asyncio.shield, so cancelling one
+    caller never cancels the call the others are waiting on.
+    """
 
-def cached(ttl: int | None = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-    """Decorator to cache async function results"""
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task[Any]] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        return await asyncio.shield(self.start(key, fn))
+
+    def start(self, key: str, fn: Callable[[], Awaitable[Any]]) -> asyncio.Task[Any]:
+        """Start the call for key, or join the one already in flight"""
+        task = self._calls.get(key)
+        if task is None or task.get_loop() is not asyncio.get_running_loop():
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            task.add_done_callback(partial(self._forget, key))
+            self.calls += 1
+        else:
+            self.coalesced += 1
+        return task
+
+    def _forget(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._calls.get(key) is task:
+            del self._calls[key]
+        # Mark the exception as retrieved even if every caller was cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def is_in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    def in_flight(self) -> int:
+        return len(self._calls)
+
+    def clear(self) -> None:
+        self._calls.clear()
+        self.calls = 0
+        self.coalesced = 0
+
+
+_cache = LRUCache(
+    max_size=settings.CACHE_MAX_SIZE,
+    default_ttl=settings.CACHE_TTL_SECONDS,
+    max_ttl=settings.CACHE_L1_MAX_TTL_SECONDS,
+)
+_shared: CacheBackend | None = None
+_in_flight = SingleFlight()
+_counters: Counter[str] = Counter()
+_shared_writes: set[asyncio.Task[None]] = set()
+
+
+def configure_shared_cache(backend: CacheBackend | None) -> None:
+    """Attach (or detach, with None) the shared tier behind the in-process LRU"""
+    global _shared
+    _shared = backend
+
+
+def _write_shared(key: str, entry: CacheEntry) -> None:
+    """Store entry in the shared tier in the background, off the request path"""
+    assert _shared is not None
+    task = asyncio.ensure_future(_shared.set(key, entry))
+    _shared_writes.add(task)
+    task.add_done_callback(_shared_writes.discard)
+
+
+async def flush_shared_cache() -> None:
+    """Wait for the shared tier writes still in flight"""
+    if _shared_writes:
+        await asyncio.gather(*_shared_writes, return_exceptions=True)
+
+
+async def close_shared_cache() -> None:
+    await flush_shared_cache()
+    if _shared is not None:
+        await _shared.close()
+    configure_shared_cache(None)
+
+
+def _log_refresh_failure(key: str, task: asyncio.Task[Any]) -> None:
+    if task.cancelled() or task.exception() is None:
+        return
+    _counters["background_refresh_failures"] += 1
+    # An open circuit is logged once by the breaker, not once per stale hit
+    level = logging.DEBUG if isinstance(task.exception(), CircuitOpenError) else logging.WARNING
+    logger.log(level, f"Background refresh failed for {key}: {task.exception()!r}")
+
+
+def cached(
+    ttl: int | None = None, stale_ttl: int = 0, stale_if_error_ttl: int = 0
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator to cache async function results
+
+    Lookups go to the in-process LRU first and then to the shared tier, if one
+    is configured; results are written to both, to the shared tier in the
+    background so callers never wait on it. Concurrent misses for the same
+    key are coalesced into a single call of the wrapped function; all callers
+    receive its result or its exception.
+
+    ``ttl`` is the soft TTL. For ``stale_ttl`` seconds after it, the stale value
+    is returned immediately and refreshed by a background task
+    (stale-while-revalidate). Past that window callers wait for the refresh,
+    but if it raises and the entry is younger than ``stale_if_error_ttl``
+    seconds past its soft expiry, the stale value is returned instead of the
+    error (stale-if-error).
+    """
 
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         @wraps(func)
@@ -76,19 +304,75 @@ def cached(ttl: int | None = None) -> Callable[[Callable[..., Any]], Callable[..
 
             cache_key = f"{func.__name__}:{str(cache_args)}:{str(kwargs)}"
 
-            cached_value = _cache.get(cache_key)
-            if cached_value is not None:
-                return cached_value
+            with phase("cache"):
+                entry = _cache.get_entry(cache_key)
+                if entry is None and _shared is not None:
+                    entry = await _shared.get(cache_key)
+                    if entry is not None:
+                        _cache.set_entry(cache_key, entry)
+
+            now = time.monotonic()
+            if entry is not None and not entry.is_expired(now):
+                return entry.value
+
+            async def load() -> Any:
+                result = await func(*args, **kwargs)
+                fresh = CacheEntry(
+                    result,
+                    ttl or _cache.default_ttl,
+                    stale_ttl=stale_ttl,
+                    stale_if_error_ttl=stale_if_error_ttl,
+                )
+                _cache.set_entry(cache_key, fresh)
+                if _shared is not None:
+                    _write_shared(cache_key, fresh)
+                return result
+
+            if entry is None:
+                return await _in_flight.do(cache_key, load)
 
-            result = await func(*args, **kwargs)
-            _cache.set(cache_key, result, ttl)
-            return result
+            if entry.is_revalidatable(now):
+                if not _in_flight.is_in_flight(cache_key):
+                    _counters["background_refreshes"] += 1
+                    task = _in_flight.start(cache_key, load)
+                    task.add_done_callback(partial(_log_refresh_failure, cache_key))
+                _counters["stale_served"] += 1
+                return entry.value
+
+            try:
+                return await _in_flight.do(cache_key, load)
+            except Exception as exc:
+                level = logging.DEBUG if isinstance(exc, CircuitOpenError) else logging.WARNING
+                logger.log(level, f"Serving stale value for {cache_key} after error: {exc!r}")
+                _counters["stale_if_error_served"] += 1
+                return entry.value
 
         return wrapper
 
     return decorator
 
 
+def cache_stats() -> dict[str, Any]:
+    """Counters for the response cache tiers and upstream call coalescing"""
+    tiers = {"l1": {**_cache.stats(), "backend": _cache.name}}
+    if _shared is not None:
+        tiers["l2"] = {**_shared.stats(), "backend": _shared.name}
+    return {
+        "size": len(_cache),
+        "max_size": _cache.max_size,
+        "tiers": tiers,
+        "upstream_calls": _in_flight.calls,
+        "coalesced_calls": _in_flight.coalesced,
+        "in_flight": _in_flight.in_flight(),
+        "stale_served": _counters["stale_served"],
+        "stale_if_error_served": _counters["stale_if_error_served"],
+        "background_refreshes": _counters["background_refreshes"],
+        "background_refresh_failures": _counters["background_refresh_failures"],
+    }
+
+
 def clear_cache() -> None:
     """Clear all cache entries (useful for testing)"""
     _cache.clear()
+    _in_flight.clear()
+    _counters.clear()
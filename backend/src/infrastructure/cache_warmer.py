@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import time
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from src.application.ports.swapi_client import SwapiClient
+from src.application.use_cases.get_characters import GetCharacters
+from src.application.use_cases.get_films import GetFilms
+from src.application.use_cases.get_planets import GetPlanets
+from src.application.use_cases.get_starships import GetStarships
+from src.domain.value_objects.filters import SearchFilters
+
+logger = logging.getLogger(__name__)
+
+# Use cases warmed by page, and whether their route accepts ?search=
+WARMED_USE_CASES = (
+    (GetCharacters, True),
+    (GetPlanets, True),
+    (GetFilms, False),
+    (GetStarships, True),
+)
+
+
+class CacheWarmer:
+    """Fill the caches before an instance reports itself ready
+
+    A warm-up pass runs the ``preload`` callables (such as the mirror load)
+    and then the list use cases for the first ``pages`` pages of each
+    resource and for each popular search term, all concurrently, so both the
+    SWAPI response cache and the use case cache are hot. Failures are logged
+    and counted; a pass never raises.
+    """
+
+    def __init__(
+        self,
+        client: SwapiClient,
+        pages: int,
+        search_terms: Sequence[str] = (),
+        preload: Sequence[Callable[[], Awaitable[None]]] = (),
+    ):
+        self.client = client
+        self.pages = pages
+        self.search_terms = search_terms
+        self.preload = preload
+        self.ready = False
+        self.timed_out = False
+        self.passes = 0
+        self.failures = 0
+        self.last_duration: float | None = None
+
+    def _requests(self) -> list[Awaitable[Any]]:
+        requests = []
+        for use_case, searchable in WARMED_USE_CASES:
+            for page in range(1, self.pages + 1):
+                requests.append(use_case(self.client).execute(SearchFilters(page=page)))
+            if searchable:
+                for term in self.search_terms:
+                    requests.append(use_case(self.client).execute(SearchFilters(search=term)))
+        return requests
+
+    async def warm(self) -> None:
+        """Run one warm-up pass"""
+        start = time.perf_counter()
+        results = await asyncio.gather(*(load() for load in self.preload), return_exceptions=True)
+        results += await asyncio.gather(*self._requests(), return_exceptions=True)
+
+        errors = [result for result in results if isinstance(result, Exception)]
+        for error in errors:
+            logger.warning(f"Cache warm-up request failed: {error!r}")
+        self.passes += 1
+        self.failures = len(errors)
+        self.last_duration = time.perf_counter() - start
+        logger.info(
+            f"Cache warm-up pass {self.passes} took {self.last_duration:.2f}s "
+            f"with {self.failures} failures"
+        )
+
+    async def run(self, timeout: float, refresh_interval: float) -> None:
+        """Warm up, report ready after it completes or ``timeout``, then keep refreshing"""
+        first = asyncio.ensure_future(self.warm())
+        done, _ = await asyncio.wait({first}, timeout=timeout)
+        if not done:
+            self.timed_out = True
+            logger.warning(f"Cache warm-up still running after {timeout}s, reporting ready")
+        self.ready = True
+        await first
+
+        while refresh_interval > 0:
+            await asyncio.sleep(refresh_interval)
+            await self.warm()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ready": self.ready,
+            "timed_out": self.timed_out,
+            "passes": self.passes,
+            "last_failures": self.failures,
+            "last_duration_seconds": self.last_duration,
+        }
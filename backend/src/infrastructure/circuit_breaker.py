@@ -0,0 +1,109 @@
+import logging
+import time
+from collections import deque
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a dependency whose circuit is open"""
+
+
+class CircuitBreaker:
+    """Failure-rate circuit breaker over a rolling window of recent calls
+
+    closed: calls go through and their outcomes are recorded. Once at least
+    ``min_calls`` of the last ``window`` calls are known and the share of
+    failures reaches ``failure_ratio``, the circuit opens.
+
+    open: calls fail fast with CircuitOpenError for ``reset_timeout`` seconds.
+
+    half_open: a single trial call is let through; success closes the
+    circuit, failure opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_ratio: float = 0.5,
+        window: int = 20,
+        min_calls: int = 10,
+        reset_timeout: float = 30.0,
+    ):
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.reset_timeout = reset_timeout
+        self._outcomes: deque[bool] = deque(maxlen=window)
+        self._state = self.CLOSED
+        self._opened_at = 0.0
+        self._trial_in_flight = False
+        self.opened_total = 0
+        self.rejected_total = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.reset_timeout:
+            self._state = self.HALF_OPEN
+        return self._state
+
+    def before_call(self) -> None:
+        """Raise CircuitOpenError unless a call may go through now"""
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and not self._trial_in_flight:
+            self._trial_in_flight = True
+            return
+        self.rejected_total += 1
+        raise CircuitOpenError(f"Circuit open, retrying after {self.reset_timeout}s")
+
+    def record_success(self) -> None:
+        if self._state == self.HALF_OPEN:
+            self._close()
+        else:
+            self._outcomes.append(True)
+
+    def record_failure(self) -> None:
+        if self._state == self.HALF_OPEN:
+            self._open()
+            return
+        self._outcomes.append(False)
+        failures = self._outcomes.count(False)
+        if (
+            self._state == self.CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and failures / len(self._outcomes) >= self.failure_ratio
+        ):
+            self._open()
+
+    def record_abandoned(self) -> None:
+        """A call that ended without an outcome (cancelled) frees the trial slot"""
+        self._trial_in_flight = False
+
+    def _open(self) -> None:
+        if self._state != self.HALF_OPEN:
+            logger.warning(f"Circuit opened, failing calls fast for {self.reset_timeout}s")
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._trial_in_flight = False
+        self.opened_total += 1
+
+    def _close(self) -> None:
+        logger.info("Circuit closed")
+        self._state = self.CLOSED
+        self._trial_in_flight = False
+        self._outcomes.clear()
+
+    def stats(self) -> dict[str, Any]:
+        failures = self._outcomes.count(False)
+        return {
+            "state": self.state,
+            "window_calls": len(self._outcomes),
+            "window_failures": failures,
+            "opened_total": self.opened_total,
+            "rejected_total": self.rejected_total,
+        }
@@ -0,0 +1,198 @@
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Sequence
+
+Labels = tuple[str, ...]
+Sample = tuple[Labels, float]
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values, strict=True)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def header(self) -> list[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.kind}"]
+
+    @abstractmethod
+    def render(self) -> list[str]:
+        pass
+
+
+class Counter(Metric):
+    """Monotonic counter; ``inc`` is a single dict update
+
+    With ``collect``, the totals are instead read from a running count kept
+    elsewhere (such as a cache's hits) when the registry is scraped.
+    """
+
+    kind = "counter"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Callable[[], Iterable[Sample]] | None = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.values: dict[Labels, float] = {}
+        self.collect = collect
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self) -> list[str]:
+        samples = list(self.collect()) if self.collect is not None else self.values.items()
+        return self.header() + [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+            for labels, value in samples
+        ]
+
+
+class Gauge(Metric):
+    """Gauge set directly, or read from ``collect`` when the registry is scraped"""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Callable[[], Iterable[Sample]] | None = None,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.values: dict[Labels, float] = {}
+        self.collect = collect
+
+    def set(self, value: float, labels: Labels = ()) -> None:
+        self.values[labels] = value
+
+    def inc(self, labels: Labels = (), amount: float = 1) -> None:
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def dec(self, labels: Labels = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+    def render(self) -> list[str]:
+        samples = list(self.collect()) if self.collect is not None else self.values.items()
+        return self.header() + [
+            f"{self.name}{_labels(self.labelnames, labels)} {_number(value)}"
+            for labels, value in samples
+        ]
+
+
+class Histogram(Metric):
+    """Histogram with fixed buckets
+
+    ``observe`` bisects into a per-label list of bucket counts; cumulative
+    counts are only computed when the registry is rendered.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: counts per bucket (last one is +Inf), then the sum
+        self.series: dict[Labels, list[float]] = {}
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        series = self.series.get(labels)
+        if series is None:
+            series = self.series[labels] = [0.0] * (len(self.buckets) + 2)
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> list[str]:
+        lines = self.header()
+        for labels, series in self.series.items():
+            cumulative = 0.0
+            for bound, count in zip((*self.buckets, float("inf")), series, strict=False):
+                cumulative += count
+                le = _labels(self.labelnames, labels, f'le="{_number(bound)}"')
+                lines.append(f"{self.name}_bucket{le} {_number(cumulative)}")
+            label_text = _labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{label_text} {_number(cumulative)}")
+        return lines
+
+
+class MetricsRegistry:
+    """Process-wide metrics rendered in the Prometheus text exposition format"""
+
+    def __init__(self) -> None:
+        self.metrics: dict[str, Metric] = {}
+
+    def _register[M: Metric](self, metric: M) -> M:
+        if metric.name in self.metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Callable[[], Iterable[Sample]] | None = None,
+    ) -> Counter:
+        return self._register(Counter(name, documentation, labelnames, collect))
+
+    def gauge(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        collect: Callable[[], Iterable[Sample]] | None = None,
+    ) -> Gauge:
+        return self._register(Gauge(name, documentation, labelnames, collect))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        lines: list[str] = []
+        for metric in self.metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
@@ -0,0 +1,63 @@
+import heapq
+import re
+from bisect import bisect_left
+from collections.abc import Iterable
+
+from src.application.ports.name_index import NameIndex
+from src.domain.value_objects.suggestion import Suggestion
+from src.infrastructure.search_index import fold
+
+# Match kinds, best first
+EXACT, NAME_PREFIX, WORD_PREFIX = 0, 1, 2
+
+WORD_BREAK = re.compile(r"[\s\-/(]+")
+
+
+class PrefixIndex(NameIndex):
+    """Sorted name keys searched by prefix with bisect
+
+    Each name is indexed under its folded text and under the text from every
+    word start on, so "sky" finds "Luke Skywalker". Matches rank exact names
+    first, then names starting with the text, then names with a word starting
+    with it; within a rank, shorter names come first.
+    """
+
+    def __init__(self, suggestions: Iterable[Suggestion]):
+        self.suggestions = list(suggestions)
+        names = [fold(suggestion.name) for suggestion in self.suggestions]
+        by_length = sorted(range(len(names)), key=lambda entry: (len(names[entry]), names[entry]))
+        self._tiebreak = {entry: rank for rank, entry in enumerate(by_length)}
+
+        keys: list[tuple[str, int, int]] = []
+        for entry, name in enumerate(names):
+            keys.append((name, NAME_PREFIX, entry))
+            for word_break in WORD_BREAK.finditer(name):
+                if word_break.end() < len(name):
+                    keys.append((name[word_break.end() :], WORD_PREFIX, entry))
+        keys.sort()
+        self._keys = [key for key, _, _ in keys]
+        self._matches = [(kind, entry) for _, kind, entry in keys]
+
+    def __len__(self) -> int:
+        return len(self.suggestions)
+
+    def suggest(self, text: str, limit: int) -> list[Suggestion]:
+        prefix = fold(text).strip()
+        if not prefix:
+            return []
+
+        best: dict[int, int] = {}
+        for i in range(bisect_left(self._keys, prefix), len(self._keys)):
+            key = self._keys[i]
+            if not key.startswith(prefix):
+                break
+            kind, entry = self._matches[i]
+            if kind == NAME_PREFIX and key == prefix:
+                kind = EXACT
+            if kind < best.get(entry, WORD_PREFIX + 1):
+                best[entry] = kind
+
+        ranked = heapq.nsmallest(
+            limit, best, key=lambda entry: (best[entry], self._tiebreak[entry])
+        )
+        return [self.suggestions[entry] for entry in ranked]
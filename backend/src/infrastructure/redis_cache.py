@@ -0,0 +1,130 @@
+import json
+import logging
+import time
+from collections import Counter
+from collections.abc import AsyncIterator
+from typing import Any, Protocol
+
+from src.infrastructure.cache import CacheBackend, CacheEntry
+
+try:
+    from redis import asyncio as redis_asyncio
+except ImportError:  # pragma: no cover - optional dependency
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+
+class RedisClient(Protocol):
+    """Subset of the redis.asyncio.Redis API used by the shared cache"""
+
+    async def get(self, name: str) -> bytes | None: ...
+
+    async def set(self, name: str, value: bytes, px: int | None = None) -> Any: ...
+
+    async def delete(self, *names: str) -> Any: ...
+
+    def scan_iter(self, match: str | None = None) -> AsyncIterator[Any]: ...
+
+    async def aclose(self) -> None: ...
+
+
+class RedisCacheBackend(CacheBackend):
+    """Shared cache tier speaking the Redis protocol
+
+    Entries are stored as JSON with wall-clock deadlines so every instance
+    agrees on freshness, and with a Redis expiry at the end of their retention
+    (capped by ``max_ttl``). The cached values are raw SWAPI payloads, plain
+    JSON already. Any Redis error or malformed entry is logged and treated as a
+    miss.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        client: RedisClient,
+        prefix: str = "starwars:",
+        max_ttl: int | None = None,
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.max_ttl = max_ttl
+        self.counters: Counter[str] = Counter()
+
+    @classmethod
+    def from_url(
+        cls,
+        url: str,
+        prefix: str = "starwars:",
+        max_ttl: int | None = None,
+        timeout: float = 0.1,
+    ) -> "RedisCacheBackend | None":
+        """Connect lazily to url; None when the redis package is not installed
+
+        ``timeout`` bounds connecting and every command, so an unreachable
+        Redis turns into a quick miss instead of stalling each L1 miss.
+        """
+        if redis_asyncio is None:
+            logger.warning("CACHE_REDIS_URL is set but 'redis' is not installed, using L1 only")
+            return None
+        client = redis_asyncio.from_url(url, socket_timeout=timeout, socket_connect_timeout=timeout)
+        return cls(client, prefix=prefix, max_ttl=max_ttl)
+
+    async def get(self, key: str) -> CacheEntry | None:
+        try:
+            data = await self.client.get(self.prefix + key)
+            if data is None:
+                self.counters["misses"] += 1
+                return None
+            payload = json.loads(data)
+            # Translate wall-clock deadlines into this process's monotonic clock
+            offset = time.monotonic() - time.time()
+            entry = CacheEntry(payload["value"], 0)
+            entry.expires_at = payload["expires_at"] + offset
+            entry.stale_until = payload["stale_until"] + offset
+            entry.retain_until = payload["retain_until"] + offset
+        except Exception as exc:
+            self.counters["errors"] += 1
+            logger.warning(f"Shared cache read failed for {key}: {exc!r}")
+            return None
+
+        if not entry.is_retained(time.monotonic()):
+            self.counters["misses"] += 1
+            return None
+        self.counters["hits"] += 1
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        now = time.monotonic()
+        if self.max_ttl is not None:
+            entry = entry.capped(self.max_ttl, now)
+        retain_ms = int((entry.retain_until - now) * 1000)
+        if retain_ms <= 0:
+            return
+
+        offset = time.time() - now
+        payload = {
+            "value": entry.value,
+            "expires_at": entry.expires_at + offset,
+            "stale_until": entry.stale_until + offset,
+            "retain_until": entry.retain_until + offset,
+        }
+        data = json.dumps(payload, separators=(",", ":")).encode()
+        try:
+            await self.client.set(self.prefix + key, data, px=retain_ms)
+            self.counters["sets"] += 1
+        except Exception as exc:
+            self.counters["errors"] += 1
+            logger.warning(f"Shared cache write failed for {key}: {exc!r}")
+
+    async def clear(self) -> None:
+        keys = [key async for key in self.client.scan_iter(match=self.prefix + "*")]
+        if keys:
+            await self.client.delete(*keys)
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+    def stats(self) -> dict[str, int]:
+        return {name: self.counters[name] for name in ("hits", "misses", "sets", "errors")}
@@ -0,0 +1,66 @@
+import unicodedata
+from collections.abc import Collection, Iterable, Mapping, Sequence
+
+NGRAM = 3
+
+
+def fold(text: str) -> str:
+    """Casefold and strip accents, so that "Padmé" and "PADME" match"""
+    if text.isascii():
+        return text.lower()
+    decomposed = unicodedata.normalize("NFKD", text)
+    return "".join(char for char in decomposed if not unicodedata.combining(char)).casefold()
+
+
+def _grams(text: str, size: int) -> Iterable[str]:
+    return (text[i : i + size] for i in range(len(text) - size + 1))
+
+
+def build_postings(texts: Sequence[str]) -> dict[str, list[int]]:
+    """Ascending positions of the folded texts containing each 1-, 2- and 3-gram"""
+    postings: dict[str, list[int]] = {}
+    for position, text in enumerate(texts):
+        for size in range(1, NGRAM + 1):
+            for gram in dict.fromkeys(_grams(text, size)):
+                postings.setdefault(gram, []).append(position)
+    return postings
+
+
+class SearchIndex:
+    """N-gram index answering case- and accent-insensitive substring searches
+
+    Every 1-, 2- and 3-gram of each folded text maps to the positions of the
+    texts containing it. A term of up to three characters is answered by its
+    posting list alone. For a longer term, the texts holding its rarest
+    trigram are the only candidates, and each is confirmed with a substring
+    check.
+    """
+
+    def __init__(self, texts: Sequence[str]):
+        self.texts: Sequence[str] = [fold(text) for text in texts]
+        self.postings: Mapping[str, Collection[int]] = {
+            gram: frozenset(positions) for gram, positions in build_postings(self.texts).items()
+        }
+        self.all = frozenset(range(len(self.texts)))
+
+    @classmethod
+    def from_postings(
+        cls, texts: Sequence[str], postings: Mapping[str, Collection[int]]
+    ) -> "SearchIndex":
+        """Index over folded texts and postings built beforehand, e.g. read from a snapshot"""
+        index = cls.__new__(cls)
+        index.texts = texts
+        index.postings = postings
+        index.all = frozenset(range(len(texts)))
+        return index
+
+    def search(self, term: str) -> frozenset[int]:
+        """Positions of the texts containing ``term``"""
+        term = fold(term)
+        if not term:
+            return self.all
+        if len(term) <= NGRAM:
+            return frozenset(self.postings.get(term, ()))
+
+        rarest = min((self.postings.get(gram, ()) for gram in _grams(term, NGRAM)), key=len)
+        return frozenset(i for i in rarest if term in self.texts[i])
@@ -1,32 +1,186 @@
+import asyncio
+import logging
+import random
+import re
+import time
+from importlib.util import find_spec
 from typing import Any
 
 import httpx
 
-from src.application.ports.swapi_client import SwapiClient
+from src.application.ports.swapi_client import RecordNotFoundError, SwapiClient
 from src.core.config import settings
+from src.core.timing import phase
 from src.domain.value_objects.filters import SearchFilters
 from src.infrastructure.cache import cached
+from src.infrastructure.circuit_breaker import CircuitBreaker
+from src.infrastructure.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+# Upstream statuses worth retrying a GET for: the request never reached a
+# healthy SWAPI worker, so repeating it is safe
+RETRYABLE_STATUS = frozenset({429, 502, 503, 504})
+
+UPSTREAM_DURATION = registry.histogram(
+    "swapi_request_duration_seconds",
+    "SWAPI request latency per attempt by endpoint and status",
+    ["endpoint", "status"],
+)
+UPSTREAM_RETRIES = registry.counter("swapi_retries_total", "SWAPI request retries")
+UPSTREAM_BUDGET_EXHAUSTED = registry.counter(
+    "swapi_budget_exhausted_total", "SWAPI calls that ran out of their deadline budget"
+)
+
+_ID_SEGMENT = re.compile(r"/\d+/")
+
+
+def endpoint_label(path: str) -> str:
+    """``/planets/1/`` -> ``/planets/{id}/``, keeping the label set small"""
+    return _ID_SEGMENT.sub("/{id}/", path)
 
 
 class SwapiHttpClient(SwapiClient):
-    """HTTP client implementation for SWAPI using httpx"""
+    """HTTP client implementation for SWAPI using httpx
+
+    A single instance is meant to be shared by the whole application so that
+    connections to SWAPI are pooled and kept alive between requests.
 
-    TIMEOUT = 30.0
+    Every call has a total deadline budget that covers all of its attempts,
+    on top of separate connect and read timeouts per attempt. Transport
+    errors and retryable statuses are retried with jittered exponential
+    backoff while the budget lasts. A circuit breaker fails calls fast while
+    SWAPI is unhealthy; the ``cached`` decorator then serves stale data where
+    it has any.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, base_url: str | None = None, breaker: CircuitBreaker | None = None):
+        self.limits = httpx.Limits(
+            max_connections=settings.SWAPI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.SWAPI_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.SWAPI_KEEPALIVE_EXPIRY_SECONDS,
+        )
+        self.timeout = httpx.Timeout(
+            connect=settings.SWAPI_CONNECT_TIMEOUT_SECONDS,
+            read=settings.SWAPI_READ_TIMEOUT_SECONDS,
+            write=settings.SWAPI_READ_TIMEOUT_SECONDS,
+            pool=settings.SWAPI_CONNECT_TIMEOUT_SECONDS,
+        )
+        self.budget = settings.SWAPI_REQUEST_BUDGET_SECONDS
+        self.retries = settings.SWAPI_RETRIES
+        self.retry_backoff = settings.SWAPI_RETRY_BACKOFF_SECONDS
+        self.breaker = breaker or CircuitBreaker(
+            failure_ratio=settings.SWAPI_BREAKER_FAILURE_RATIO,
+            window=settings.SWAPI_BREAKER_WINDOW,
+            min_calls=settings.SWAPI_BREAKER_MIN_CALLS,
+            reset_timeout=settings.SWAPI_BREAKER_RESET_SECONDS,
+        )
+        http2 = settings.SWAPI_HTTP2
+        if http2 and find_spec("h2") is None:
+            logger.warning("SWAPI_HTTP2 is enabled but 'h2' is not installed, using HTTP/1.1")
+            http2 = False
+
+        self._transport = httpx.AsyncHTTPTransport(limits=self.limits, http2=http2)
         self.client = httpx.AsyncClient(
-            base_url=settings.SWAPI_BASE_URL,
-            timeout=self.TIMEOUT,
+            base_url=base_url or settings.SWAPI_BASE_URL,
+            timeout=self.timeout,
             headers={"User-Agent": "StarWars-GCP-Explorer/1.0"},
+            transport=self._transport,
         )
+        self.in_flight = 0
+        self.requests_total = 0
+        self.retries_total = 0
+        self.budget_exhausted_total = 0
+
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> httpx.Response:
+        """GET through the circuit breaker, retrying within the deadline budget"""
+        self.breaker.before_call()
+        try:
+            async with asyncio.timeout(self.budget):
+                response = await self._get_with_retries(path, params)
+        except TimeoutError:
+            self.budget_exhausted_total += 1
+            UPSTREAM_BUDGET_EXHAUSTED.inc()
+            self.breaker.record_failure()
+            raise httpx.TimeoutException(f"SWAPI budget of {self.budget}s exhausted") from None
+        except httpx.HTTPError:
+            self.breaker.record_failure()
+            raise
+        except BaseException:
+            self.breaker.record_abandoned()
+            raise
 
-    @cached(ttl=300)  # Cache for 5 minutes  # type: ignore[misc]
+        if response.status_code >= 500 or response.status_code == 429:
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        response.raise_for_status()
+        return response
+
+    async def _get_with_retries(self, path: str, params: dict[str, Any] | None) -> httpx.Response:
+        attempt = 0
+        while True:
+            self.in_flight += 1
+            self.requests_total += 1
+            status = "error"
+            start = time.perf_counter()
+            try:
+                response = await self.client.get(path, params=params)
+                status = str(response.status_code)
+                if response.status_code not in RETRYABLE_STATUS or attempt >= self.retries:
+                    return response
+                logger.warning(f"SWAPI {path} returned {response.status_code}, retrying")
+            except httpx.TransportError as exc:
+                if attempt >= self.retries:
+                    raise
+                logger.warning(f"SWAPI {path} failed with {exc!r}, retrying")
+            finally:
+                self.in_flight -= 1
+                UPSTREAM_DURATION.observe(
+                    time.perf_counter() - start, (endpoint_label(path), status)
+                )
+
+            # Full jitter: sleep a random fraction of the exponential backoff
+            await asyncio.sleep(random.uniform(0, self.retry_backoff * 2**attempt))
+            attempt += 1
+            self.retries_total += 1
+            UPSTREAM_RETRIES.inc()
+
+    @cached(
+        ttl=300,  # Fresh for 5 minutes, then served stale while refreshing
+        stale_ttl=settings.CACHE_STALE_TTL_SECONDS,
+        stale_if_error_ttl=settings.CACHE_STALE_IF_ERROR_SECONDS,
+    )
     async def _fetch(self, endpoint: str, filters: SearchFilters) -> dict[str, Any]:
         """Generic fetch method for SWAPI endpoints"""
-        params = filters.to_query_params()
-        response = await self.client.get(endpoint, params=params)
-        response.raise_for_status()
-        return response.json()  # type: ignore[no-any-return]
+        with phase("swapi"):
+            response = await self._get(endpoint, params=filters.to_query_params())
+            return response.json()  # type: ignore[no-any-return]
+
+    @cached(
+        ttl=300,
+        stale_ttl=settings.CACHE_STALE_TTL_SECONDS,
+        stale_if_error_ttl=settings.CACHE_STALE_IF_ERROR_SECONDS,
+    )
+    async def _fetch_url(self, path: str) -> dict[str, Any]:
+        """Fetch one SWAPI record by its path relative to the base URL"""
+        with phase("swapi"):
+            response = await self._get(path)
+            return response.json()  # type: ignore[no-any-return]
+
+    async def get_resource(self, url: str) -> dict[str, Any]:
+        base_url = str(self.client.base_url)
+        if not url.startswith(base_url):
+            raise ValueError(f"Not a SWAPI URL: {url}")
+        return await self._fetch_url("/" + url.removeprefix(base_url).lstrip("/"))  # type: ignore[no-any-return]
+
+    async def get_record(self, resource: str, record_id: int) -> dict[str, Any]:
+        try:
+            return await self._fetch_url(f"/{resource}/{record_id}/")  # type: ignore[no-any-return]
+        except httpx.HTTPStatusError as exc:
+            if exc.response.status_code == 404:
+                raise RecordNotFoundError(f"No {resource} with ID {record_id}") from exc
+            raise
 
     async def get_characters(self, filters: SearchFilters) -> dict[str, Any]:
         return await self._fetch("/people/", filters)  # type: ignore[no-any-return]
@@ -40,5 +194,45 @@ class SwapiHttpClient(SwapiClient):
     async def get_starships(self, filters: SearchFilters) -> dict[str, Any]:
         return await self._fetch("/starships/", filters)  # type: ignore[no-any-return]
 
+    def _open_connections(self) -> list[Any] | None:
+        """The pool's open connections, or None if httpcore stops exposing them
+
+        httpx has no public API for this, so it is read from httpcore internals
+        that may change in any release.
+        """
+        pool = getattr(self._transport, "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return None if connections is None else list(connections)
+
+    def pool_stats(self) -> dict[str, Any]:
+        """Snapshot of connection pool utilization, used to size the pool limits
+
+        Connection counts are None when the pool cannot be inspected.
+        """
+        stats: dict[str, Any] = {
+            "max_connections": self.limits.max_connections,
+            "max_keepalive_connections": self.limits.max_keepalive_connections,
+            "open_connections": None,
+            "active_connections": None,
+            "idle_connections": None,
+            "in_flight_requests": self.in_flight,
+            "requests_total": self.requests_total,
+        }
+        connections = self._open_connections()
+        if connections is not None:
+            idle = sum(1 for connection in connections if connection.is_idle())
+            stats["open_connections"] = len(connections)
+            stats["active_connections"] = len(connections) - idle
+            stats["idle_connections"] = idle
+        return stats
+
+    def resilience_stats(self) -> dict[str, Any]:
+        """Circuit breaker state and retry counters"""
+        return {
+            "circuit": self.breaker.stats(),
+            "retries_total": self.retries_total,
+            "budget_exhausted_total": self.budget_exhausted_total,
+        }
+
     async def close(self) -> None:
         await self.client.aclose()
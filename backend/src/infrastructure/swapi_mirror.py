@@ -0,0 +1,255 @@
+import asyncio
+import logging
+import math
+from collections.abc import Awaitable, Callable, Iterator, Mapping, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+from src.application.ports.name_index import NameIndex
+from src.application.ports.swapi_client import RecordNotFoundError, SwapiClient
+from src.domain.entities import data_fields
+from src.domain.entities.character import Character
+from src.domain.entities.film import Film
+from src.domain.entities.planet import Planet
+from src.domain.entities.starship import Starship
+from src.domain.value_objects.filters import SearchFilters
+from src.domain.value_objects.ordering import Ordering, SortColumns
+from src.domain.value_objects.record_id import record_id
+from src.domain.value_objects.suggestion import Suggestion
+from src.infrastructure.name_index import PrefixIndex
+from src.infrastructure.search_index import SearchIndex
+
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 10  # SWAPI page size, kept so page numbers mean the same thing
+
+
+@dataclass(frozen=True)
+class MirrorResource:
+    """How one SWAPI resource is turned into entities and searched"""
+
+    name: str
+    entity: type[Character] | type[Planet] | type[Film] | type[Starship]
+    search_fields: tuple[str, ...]
+
+
+RESOURCES = (
+    MirrorResource("people", Character, ("name",)),
+    MirrorResource("planets", Planet, ("name",)),
+    MirrorResource("films", Film, ("title",)),
+    MirrorResource("starships", Starship, ("name", "model")),
+)
+
+
+class IndexedTable:
+    """Records of one resource queried through precomputed indexes
+
+    ``search_index`` answers substring searches over the records' searchable
+    text; ``sort_indexes`` holds the record positions for every supported
+    ordering and ``ids`` the position of each record by SWAPI ID.
+    """
+
+    def __init__(
+        self,
+        resource: MirrorResource,
+        records: Sequence[dict[str, Any]],
+        search_index: SearchIndex,
+        sort_indexes: Mapping[Ordering, Sequence[int]],
+        ids: Mapping[int, int],
+    ):
+        self.resource = resource
+        self.records = records
+        self.search_index = search_index
+        self.sort_indexes = sort_indexes
+        self.ids = ids
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def record_for_url(self, url: str) -> dict[str, Any] | None:
+        record = self.record_for_id(record_id(url) or 0)
+        return record if record is not None and record.get("url") == url else None
+
+    def record_for_id(self, record: int) -> dict[str, Any] | None:
+        position = self.ids.get(record)
+        return self.records[position] if position is not None else None
+
+    def query(self, filters: SearchFilters) -> dict[str, Any]:
+        """Search, order and paginate locally, in SWAPI's response shape"""
+        ordering = Ordering.parse(filters.ordering)
+        positions: Sequence[int] = range(len(self.records))
+        if ordering is not None:
+            positions = self.sort_indexes.get(ordering, positions)
+
+        if filters.search:
+            matches = self.search_index.search(filters.search)
+            if ordering is None:
+                positions = sorted(matches)
+            else:
+                positions = [i for i in positions if i in matches]
+
+        start = (filters.page - 1) * PAGE_SIZE
+        return {
+            "count": len(positions),
+            "results": [self.records[i] for i in positions[start : start + PAGE_SIZE]],
+        }
+
+
+def build_indexes(
+    resource: MirrorResource, records: Sequence[dict[str, Any]]
+) -> tuple[SearchIndex, dict[Ordering, list[int]], dict[int, int]]:
+    """Search index, sort orders and ID positions of a resource's records"""
+    entities = [resource.entity.from_swapi(record) for record in records]
+    search_index = SearchIndex(
+        [
+            " ".join(str(record.get(field, "")) for field in resource.search_fields)
+            for record in records
+        ]
+    )
+    columns = SortColumns(entities)
+    sort_indexes: dict[Ordering, list[int]] = {}
+    for field in data_fields(resource.entity):
+        if field.type in (str, int):
+            for descending in (False, True):
+                ordering = Ordering(field.name, descending)
+                sort_indexes[ordering] = columns.argsort(ordering)
+    ids = {
+        record: position
+        for position, entity in enumerate(entities)
+        if (record := record_id(entity.url)) is not None
+    }
+    return search_index, sort_indexes, ids
+
+
+def suggestions(tables: Mapping[str, IndexedTable]) -> Iterator[Suggestion]:
+    """The name (or title) of every record, for the typeahead index"""
+    for name, table in tables.items():
+        name_field = table.resource.search_fields[0]
+        for record in table.records:
+            if record.get(name_field):
+                yield Suggestion(record[name_field], name, record.get("url", ""))
+
+
+class MirrorTable(IndexedTable):
+    """All records of one resource, held in memory"""
+
+    def __init__(self, resource: MirrorResource, records: list[dict[str, Any]]):
+        super().__init__(resource, records, *build_indexes(resource, records))
+
+
+class SwapiMirror(SwapiClient):
+    """In-memory mirror of every SWAPI resource
+
+    ``load`` pulls all pages of each resource concurrently through the
+    upstream client. Once a resource is loaded, search, ordering and
+    pagination are answered locally, so ordering is global across pages and no
+    upstream call is made. Resources that are not loaded yet are delegated to
+    the upstream client.
+    """
+
+    def __init__(self, upstream: SwapiClient):
+        self.upstream = upstream
+        self.tables: dict[str, MirrorTable] = {}
+        self._name_index: PrefixIndex | None = None
+
+    def _upstream_getter(self, name: str) -> Callable[[SearchFilters], Awaitable[dict[str, Any]]]:
+        getters = {
+            "people": self.upstream.get_characters,
+            "planets": self.upstream.get_planets,
+            "films": self.upstream.get_films,
+            "starships": self.upstream.get_starships,
+        }
+        return getters[name]
+
+    @property
+    def is_ready(self) -> bool:
+        return len(self.tables) == len(RESOURCES)
+
+    async def load(self) -> bool:
+        """Pull every resource; a resource that fails keeps being served upstream
+
+        Returns whether any table changed: a resource mirrored for the first
+        time, or one whose records differ from the previous load. Unchanged
+        tables keep their indexes.
+        """
+        results = await asyncio.gather(
+            *(self._load_resource(resource) for resource in RESOURCES), return_exceptions=True
+        )
+        changed = False
+        for resource, result in zip(RESOURCES, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"Mirror load failed for {resource.name}: {result!r}")
+            else:
+                changed |= result
+        if changed:
+            self._name_index = PrefixIndex(suggestions(self.tables))
+        return changed
+
+    def name_index(self) -> NameIndex | None:
+        return self._name_index
+
+    def orders_globally(self, resource: str) -> bool:
+        # Only mirrored resources are ordered here; the rest still come from upstream
+        return resource in self.tables
+
+    async def _load_resource(self, resource: MirrorResource) -> bool:
+        fetch = self._upstream_getter(resource.name)
+        first = await fetch(SearchFilters(page=1))
+        records: list[dict[str, Any]] = list(first["results"])
+
+        page_size = len(records) or PAGE_SIZE
+        pages = math.ceil(first["count"] / page_size)
+        rest = await asyncio.gather(
+            *(fetch(SearchFilters(page=page)) for page in range(2, pages + 1))
+        )
+        for response in rest:
+            records.extend(response["results"])
+
+        current = self.tables.get(resource.name)
+        if current is not None and current.records == records:
+            return False
+        self.tables[resource.name] = MirrorTable(resource, records)
+        logger.info(f"Mirrored {len(records)} {resource.name}")
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "ready": self.is_ready,
+            "records": {name: len(table) for name, table in self.tables.items()},
+        }
+
+    async def _get(self, name: str, filters: SearchFilters) -> dict[str, Any]:
+        table = self.tables.get(name)
+        if table is None:
+            return await self._upstream_getter(name)(filters)
+        return table.query(filters)
+
+    async def get_resource(self, url: str) -> dict[str, Any]:
+        # SWAPI URLs look like <base>/<resource>/<id>/
+        parts = url.rstrip("/").rsplit("/", 2)
+        table = self.tables.get(parts[-2]) if len(parts) == 3 else None
+        record = table.record_for_url(url) if table is not None else None
+        if record is None:
+            return await self.upstream.get_resource(url)
+        return record
+
+    async def get_record(self, resource: str, record_id: int) -> dict[str, Any]:
+        table = self.tables.get(resource)
+        if table is None:
+            return await self.upstream.get_record(resource, record_id)
+        record = table.record_for_id(record_id)
+        if record is None:
+            raise RecordNotFoundError(f"No {resource} with ID {record_id}")
+        return record
+
+    async def get_characters(self, filters: SearchFilters) -> dict[str, Any]:
+        return await self._get("people", filters)
+
+    async def get_planets(self, filters: SearchFilters) -> dict[str, Any]:
+        return await self._get("planets", filters)
+
+    async def get_films(self, filters: SearchFilters) -> dict[str, Any]:
+        return await self._get("films", filters)
+
+    async def get_starships(self, filters: SearchFilters) -> dict[str, Any]:
+        return await self._get("starships", filters)
@@ -0,0 +1,300 @@
+import json
+import mmap
+import os
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Any, Final, overload
+
+from src.application.ports.name_index import NameIndex
+from src.application.ports.swapi_client import RecordNotFoundError, SwapiClient
+from src.domain.value_objects.filters import SearchFilters
+from src.domain.value_objects.ordering import Ordering
+from src.domain.value_objects.suggestion import Suggestion
+from src.infrastructure.name_index import PrefixIndex
+from src.infrastructure.search_index import SearchIndex, build_postings
+from src.infrastructure.swapi_mirror import RESOURCES, IndexedTable, build_indexes
+
+FORMAT = "swapi-snapshot"
+VERSION = 3
+# Arrays are native unsigned ints, read in place with memoryview.cast
+ARRAY_TYPE: Final = "I"
+ITEMSIZE = array(ARRAY_TYPE).itemsize
+
+type Span = list[int]  # [start, end) in bytes from the end of the header
+
+
+class SnapshotError(Exception):
+    """The snapshot file is missing, truncated or written by another version"""
+
+
+def _ordering_key(ordering: Ordering) -> str:
+    return f"-{ordering.field}" if ordering.descending else ordering.field
+
+
+class _Body:
+    """The snapshot after its header line, built up section by section"""
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+
+    def add(self, data: bytes) -> Span:
+        start = len(self.data)
+        self.data += data
+        return [start, len(self.data)]
+
+    def add_array(self, values: Iterable[int]) -> Span:
+        self.data += bytes(-len(self.data) % ITEMSIZE)
+        return self.add(array(ARRAY_TYPE, values).tobytes())
+
+    def add_lines(self, lines: Iterable[bytes]) -> dict[str, Span]:
+        """Newline-terminated lines, and the array of their offsets within the section"""
+        offsets = [0]
+        data = bytearray()
+        for line in lines:
+            data += line + b"\n"
+            offsets.append(len(data))
+        return {"data": self.add(bytes(data)), "offsets": self.add_array(offsets)}
+
+
+def write_snapshot(
+    path: str | Path, records: Mapping[str, Sequence[dict[str, Any]]], base_url: str
+) -> dict[str, int]:
+    """Write every resource's records and their indexes to a snapshot file
+
+    The header line holds the position of every section; after it come the
+    records as compact JSON lines, the folded search texts, and the sort
+    orders, ID table and n-gram postings as arrays of native unsigned ints.
+    The indexes are computed here, so a reader parses nothing but the header
+    and maps the rest. The file is written next to ``path`` and renamed into
+    place.
+    """
+    body = _Body()
+    index: dict[str, Any] = {}
+    for resource in RESOURCES:
+        resource_records = records[resource.name]
+        search_index, sort_indexes, ids = build_indexes(resource, resource_records)
+        grams: dict[str, Span] = {}
+        postings: list[int] = []
+        for gram, positions in build_postings(search_index.texts).items():
+            grams[gram] = [len(postings), len(postings) + len(positions)]
+            postings.extend(positions)
+        by_id = sorted(ids.items())
+
+        index[resource.name] = {
+            "records": body.add_lines(
+                json.dumps(record, separators=(",", ":"), ensure_ascii=False).encode()
+                for record in resource_records
+            ),
+            "texts": body.add_lines(text.encode() for text in search_index.texts),
+            "sort_indexes": {
+                _ordering_key(key): body.add_array(value) for key, value in sort_indexes.items()
+            },
+            "ids": body.add_array(record for record, _ in by_id),
+            "id_positions": body.add_array(position for _, position in by_id),
+            "postings": body.add_array(postings),
+            "grams": grams,
+            "names": [
+                [name, record.get("url", "")]
+                for record in resource_records
+                if (name := record.get(resource.search_fields[0]))
+            ],
+        }
+
+    header = {
+        "format": FORMAT,
+        "version": VERSION,
+        "byteorder": sys.byteorder,
+        "itemsize": ITEMSIZE,
+        "base_url": base_url,
+        "created_at": datetime.now(UTC).isoformat(timespec="seconds"),
+        "resources": index,
+    }
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    with partial.open("wb") as file:
+        file.write(json.dumps(header, separators=(",", ":")).encode() + b"\n")
+        file.write(body.data)
+    os.replace(partial, path)
+    return {name: len(resource_records) for name, resource_records in records.items()}
+
+
+class MappedLines[T](Sequence[T]):
+    """Lines of one section, decoded from the memory-mapped file on access"""
+
+    def __init__(
+        self, data: mmap.mmap, start: int, offsets: Sequence[int], decode: Callable[[bytes], T]
+    ):
+        self._data = data
+        self._start = start
+        self._offsets = offsets
+        self._decode = decode
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> list[T]: ...
+
+    def __getitem__(self, index: int | slice) -> T | list[T]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        start = self._start + self._offsets[index]
+        end = self._start + self._offsets[index + 1]
+        return self._decode(self._data[start:end])
+
+
+class MappedIds(Mapping[int, int]):
+    """Record positions by SWAPI ID, bisected in the sorted ID array"""
+
+    def __init__(self, ids: Sequence[int], positions: Sequence[int]):
+        self._ids = ids
+        self._positions = positions
+
+    def __getitem__(self, record: int) -> int:
+        i = bisect_left(self._ids, record)
+        if i == len(self._ids) or self._ids[i] != record:
+            raise KeyError(record)
+        return self._positions[i]
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+
+class MappedPostings(Mapping[str, Sequence[int]]):
+    """N-gram posting lists, each a slice of one mapped array"""
+
+    def __init__(self, grams: Mapping[str, Span], postings: Sequence[int]):
+        self._grams = grams
+        self._postings = postings
+
+    def __getitem__(self, gram: str) -> Sequence[int]:
+        start, end = self._grams[gram]
+        return self._postings[start:end]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._grams)
+
+    def __len__(self) -> int:
+        return len(self._grams)
+
+
+class SwapiSnapshot(SwapiClient):
+    """SWAPI served entirely from a snapshot file, with no upstream calls
+
+    The file is memory-mapped read-only, so the page cache holds one copy of
+    the data whatever the number of worker processes, and only the records of
+    the requested page are decoded. Build the file with ``python -m
+    src.snapshot``.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        try:
+            with self.path.open("rb") as file:
+                self._data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError) as exc:
+            raise SnapshotError(f"Cannot open snapshot {self.path}: {exc}") from exc
+
+        header_end = self._data.find(b"\n")
+        try:
+            header = json.loads(self._data[:header_end])
+        except ValueError as exc:
+            raise SnapshotError(f"{self.path} is not a SWAPI snapshot") from exc
+        if header.get("format") != FORMAT or header.get("version") != VERSION:
+            raise SnapshotError(f"{self.path} is not a version {VERSION} SWAPI snapshot")
+        if header["byteorder"] != sys.byteorder or header["itemsize"] != ITEMSIZE:
+            raise SnapshotError(f"{self.path} was written on another platform")
+
+        self.created_at: str = header["created_at"]
+        self._body = header_end + 1
+        self._view = memoryview(self._data)
+        self.tables: dict[str, IndexedTable] = {}
+        names: list[Suggestion] = []
+        for resource in RESOURCES:
+            index = header["resources"][resource.name]
+            records = self._lines(index["records"], json.loads)
+            self.tables[resource.name] = IndexedTable(
+                resource,
+                records,
+                SearchIndex.from_postings(
+                    self._lines(index["texts"], bytes.decode),
+                    MappedPostings(index["grams"], self._array(index["postings"])),
+                ),
+                {
+                    ordering: self._array(span)
+                    for key, span in index["sort_indexes"].items()
+                    if (ordering := Ordering.parse(key)) is not None
+                },
+                MappedIds(self._array(index["ids"]), self._array(index["id_positions"])),
+            )
+            names.extend(Suggestion(name, resource.name, url) for name, url in index["names"])
+        self._name_index = PrefixIndex(names)
+
+    def _array(self, span: Span) -> Sequence[int]:
+        start, end = span
+        return self._view[self._body + start : self._body + end].cast(ARRAY_TYPE)
+
+    def _lines[T](self, section: dict[str, Span], decode: Callable[[bytes], T]) -> MappedLines[T]:
+        return MappedLines(
+            self._data, self._body + section["data"][0], self._array(section["offsets"]), decode
+        )
+
+    def name_index(self) -> NameIndex | None:
+        return self._name_index
+
+    def orders_globally(self, resource: str) -> bool:
+        return True
+
+    def close(self) -> None:
+        # The mapping can only be closed once no array view into it is left
+        self.tables = {}
+        self._view.release()
+        self._data.close()
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "path": str(self.path),
+            "created_at": self.created_at,
+            "records": {name: len(table) for name, table in self.tables.items()},
+        }
+
+    async def get_resource(self, url: str) -> dict[str, Any]:
+        # SWAPI URLs look like <base>/<resource>/<id>/
+        parts = url.rstrip("/").rsplit("/", 2)
+        table = self.tables.get(parts[-2]) if len(parts) == 3 else None
+        record = table.record_for_url(url) if table is not None else None
+        if record is None:
+            raise ValueError(f"Not in the snapshot: {url}")
+        return record
+
+    async def get_record(self, resource: str, record_id: int) -> dict[str, Any]:
+        table = self.tables.get(resource)
+        record = table.record_for_id(record_id) if table is not None else None
+        if record is None:
+            raise RecordNotFoundError(f"No {resource} with ID {record_id}")
+        return record
+
+    async def get_characters(self, filters: SearchFilters) -> dict[str, Any]:
+        return self.tables["people"].query(filters)
+
+    async def get_planets(self, filters: SearchFilters) -> dict[str, Any]:
+        return self.tables["planets"].query(filters)
+
+    async def get_films(self, filters: SearchFilters) -> dict[str, Any]:
+        return self.tables["films"].query(filters)
+
+    async def get_starships(self, filters: SearchFilters) -> dict[str, Any]:
+        return self.tables["starships"].query(filters)
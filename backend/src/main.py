@@ -1,25 +1,145 @@
-import json
+import asyncio
+import contextlib
 import logging
-from collections.abc import Awaitable, Callable
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import Any
 
-from fastapi import FastAPI, Request, Response
+from fastapi import Depends, FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import FileResponse, HTMLResponse, JSONResponse
-from fastapi.staticfiles import StaticFiles
-from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
-from src.api.middleware.rate_limit import limiter
-from src.api.routes import characters, films, planets, starships
+from src.api.frontend import IndexPage, PrecompressedStaticFiles
+from src.api.metrics import register_app_metrics, serve_metrics
+from src.api.middleware.auth import verify_api_key
+from src.api.middleware.compression import CompressionMiddleware
+from src.api.middleware.metrics import MetricsMiddleware
+from src.api.middleware.rate_limit import limiter, rate_limit_exceeded_handler
+from src.api.middleware.security import SecurityHeadersMiddleware
+from src.api.middleware.timing import ServerTimingMiddleware
+from src.api.responses import response_cache
+from src.api.routes import batch, characters, films, planets, starships, suggest
+from src.application.use_cases.entity_store import entity_store
+from src.application.use_cases.result_cache import result_cache
 from src.core.config import settings
+from src.core.logs import JSONFormatter
+from src.infrastructure.cache import close_shared_cache, configure_shared_cache
+from src.infrastructure.cache_warmer import CacheWarmer
+from src.infrastructure.circuit_breaker import CircuitOpenError
+from src.infrastructure.metrics import CONTENT_TYPE, registry
+from src.infrastructure.redis_cache import RedisCacheBackend
+from src.infrastructure.swapi_http_client import SwapiHttpClient
+from src.infrastructure.swapi_mirror import SwapiMirror
+from src.infrastructure.swapi_snapshot import SwapiSnapshot
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='{"time":"%(asctime)s", "level":"%(levelname)s", "msg":"%(message)s"}',
-)
+log_handler = logging.StreamHandler()
+log_handler.setFormatter(JSONFormatter())
+logging.basicConfig(level=logging.INFO, handlers=[log_handler])
 logger = logging.getLogger(__name__)
 
+
+def clear_cached_pages() -> None:
+    result_cache.clear()
+    response_cache.clear()
+    entity_store.clear()
+
+
+# Set on app.state for the lifetime of the app, and removed again on shutdown
+LIFESPAN_STATE = (
+    "swapi_http_client",
+    "swapi_client",
+    "swapi_snapshot",
+    "swapi_mirror",
+    "cache_warmer",
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Create the shared SWAPI connection pool on startup and close it on shutdown
+
+    With the mirror enabled, all SWAPI resources are loaded in the background;
+    requests are served upstream until their resource is mirrored. The mirror
+    load is part of the cache warm-up, which /health waits for before it
+    reports the instance as ready. With a snapshot configured, every request
+    is served from it and SWAPI is never called.
+    """
+    if settings.CACHE_REDIS_URL:
+        configure_shared_cache(
+            RedisCacheBackend.from_url(
+                settings.CACHE_REDIS_URL,
+                prefix=settings.CACHE_REDIS_PREFIX,
+                max_ttl=settings.CACHE_REDIS_MAX_TTL_SECONDS,
+                timeout=settings.CACHE_REDIS_TIMEOUT_SECONDS,
+            )
+        )
+
+    metrics_server: asyncio.Server | None = None
+    if settings.METRICS_ENABLED and settings.METRICS_PORT:
+        metrics_server = await serve_metrics(settings.SERVER_HOST, settings.METRICS_PORT)
+        logger.info(f"Serving /metrics on port {settings.METRICS_PORT}")
+
+    http_client = SwapiHttpClient()
+    app.state.swapi_http_client = http_client
+    app.state.swapi_client = http_client
+    logger.info("SWAPI connection pool started")
+
+    preload: list[Callable[[], Awaitable[None]]] = []
+    snapshot: SwapiSnapshot | None = None
+    if settings.SWAPI_SNAPSHOT_PATH:
+        snapshot = SwapiSnapshot(settings.SWAPI_SNAPSHOT_PATH)
+        app.state.swapi_snapshot = snapshot
+        app.state.swapi_client = snapshot
+        logger.info(f"Serving SWAPI snapshot {snapshot.path} from {snapshot.created_at}")
+    elif settings.SWAPI_MIRROR_ENABLED:
+        mirror = SwapiMirror(http_client)
+        app.state.swapi_mirror = mirror
+        app.state.swapi_client = mirror
+
+        async def load_mirror() -> None:
+            # Pages rendered from upstream were only ordered within themselves, and
+            # pages of changed records are outdated; unchanged reloads keep the caches
+            if await mirror.load():
+                clear_cached_pages()
+
+        preload.append(load_mirror)
+
+    warmer = CacheWarmer(
+        app.state.swapi_client,
+        pages=settings.WARMUP_PAGES if settings.WARMUP_ENABLED else 0,
+        search_terms=settings.warmup_search_terms_list if settings.WARMUP_ENABLED else [],
+        preload=preload,
+    )
+    app.state.cache_warmer = warmer
+    if settings.WARMUP_ENABLED:
+        warmup = asyncio.create_task(
+            warmer.run(settings.WARMUP_TIMEOUT_SECONDS, settings.WARMUP_REFRESH_INTERVAL_SECONDS)
+        )
+    else:
+        warmer.ready = True
+        warmup = asyncio.create_task(warmer.warm())
+
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await warmup
+        for name in LIFESPAN_STATE:
+            if hasattr(app.state, name):
+                delattr(app.state, name)
+        await http_client.close()
+        if snapshot is not None:
+            snapshot.close()
+        await close_shared_cache()
+        if metrics_server is not None:
+            metrics_server.close()
+            await metrics_server.wait_closed()
+        logger.info("SWAPI connection pool closed")
+
+
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
@@ -27,6 +147,7 @@ app = FastAPI(
     openapi_url=f"{settings.API_PREFIX}/openapi.json",
     docs_url=f"{settings.API_PREFIX}/docs",
     redoc_url=f"{settings.API_PREFIX}/redoc",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -38,99 +159,134 @@ app.add_middleware(
 )
 
 
-@app.middleware("http")
-async def add_security_headers(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """Add security headers to all responses"""
-    response = await call_next(request)
-
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-
-    if settings.ENVIRONMENT == "production":
-        response.headers["Content-Security-Policy"] = (
-            "default-src 'self'; "
-            "script-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
-            "style-src 'self' 'unsafe-inline' https://cdn.jsdelivr.net; "
-            "img-src 'self' data: https:; "
-            "font-src 'self' data:; "
-            "connect-src 'self' https://swapi.dev"
-        )
-        response.headers["Strict-Transport-Security"] = "max-age=31536000; includeSubDomains"
+app.add_middleware(SecurityHeadersMiddleware)
+
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware)
 
-    return response
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+    register_app_metrics(app)
 
+# Outermost, so the total covers every other middleware
+app.add_middleware(ServerTimingMiddleware)
 
 app.state.limiter = limiter
-app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)  # type: ignore[arg-type]
+app.add_exception_handler(RateLimitExceeded, rate_limit_exceeded_handler)  # type: ignore[arg-type]
+
+
+@app.exception_handler(CircuitOpenError)
+async def circuit_open_handler(request: Request, exc: CircuitOpenError) -> JSONResponse:
+    """SWAPI is failing and nothing is cached for this request: fail fast"""
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "SWAPI is temporarily unavailable"},
+        headers={"Retry-After": str(int(settings.SWAPI_BREAKER_RESET_SECONDS))},
+    )
+
 
 app.include_router(characters.router, prefix=settings.API_PREFIX)
 app.include_router(planets.router, prefix=settings.API_PREFIX)
 app.include_router(films.router, prefix=settings.API_PREFIX)
 app.include_router(starships.router, prefix=settings.API_PREFIX)
+app.include_router(suggest.router, prefix=settings.API_PREFIX)
+app.include_router(batch.router, prefix=settings.API_PREFIX)
 
 
 @app.get("/health")
 def health_check() -> JSONResponse:
-    """Health check endpoint for monitoring"""
-    return JSONResponse(
-        content={
-            "status": "healthy",
-            "service": "starwars-api",
-            "version": settings.VERSION,
-            "environment": settings.ENVIRONMENT,
-        }
-    )
+    """Health check endpoint for monitoring
 
+    Returns 503 while the cache warm-up is running so that traffic is only
+    routed to the instance once it is ready.
+    """
+    content: dict[str, Any] = {
+        "status": "healthy",
+        "service": "starwars-api",
+        "version": settings.VERSION,
+        "environment": settings.ENVIRONMENT,
+    }
+    http_client: SwapiHttpClient | None = getattr(app.state, "swapi_http_client", None)
+    if http_client is not None:
+        content["swapi_pool"] = http_client.pool_stats()
+        content["swapi_resilience"] = http_client.resilience_stats()
+    mirror: SwapiMirror | None = getattr(app.state, "swapi_mirror", None)
+    if mirror is not None:
+        content["mirror"] = mirror.stats()
+    snapshot: SwapiSnapshot | None = getattr(app.state, "swapi_snapshot", None)
+    if snapshot is not None:
+        content["snapshot"] = snapshot.stats()
+    warmer: CacheWarmer | None = getattr(app.state, "cache_warmer", None)
+    if warmer is not None:
+        content["warmup"] = warmer.stats()
+        if not warmer.ready:
+            content["status"] = "warming"
+            return JSONResponse(status_code=503, content=content)
+    return JSONResponse(content=content)
 
-FRONTEND_DIR = Path("/app/frontend/dist")
-if FRONTEND_DIR.exists():
-    app.mount("/assets", StaticFiles(directory=FRONTEND_DIR / "assets"), name="assets")
 
-    def get_index_html() -> str:
-        """Read and inject runtime configuration into index.html"""
-        index_path = FRONTEND_DIR / "index.html"
-        if not index_path.exists():
-            return ""
+if settings.METRICS_ENABLED:
+
+    @app.get("/metrics", include_in_schema=False, dependencies=[Depends(verify_api_key)])
+    def metrics() -> Response:
+        """Prometheus metrics in the text exposition format, unless they have a port of their own
+
+        On the app's port they sit behind the API key like the rest of the API;
+        the listener on METRICS_PORT is meant for the internal network and is open.
+        """
+        if settings.METRICS_PORT:
+            return Response(status_code=404)
+        return Response(registry.render(), media_type=CONTENT_TYPE)
 
-        with open(index_path) as f:
-            content = f.read()
 
-        config = {
+FRONTEND_DIR = Path("/app/frontend/dist")
+if FRONTEND_DIR.exists():
+    app.mount(
+        "/assets",
+        PrecompressedStaticFiles(directory=FRONTEND_DIR / "assets"),
+        name="assets",
+    )
+
+    index_page = IndexPage(
+        FRONTEND_DIR / "index.html",
+        config={
             "API_KEY": settings.API_KEY,
             "BASE_URL": f"{settings.API_PREFIX}",
             "ENVIRONMENT": settings.ENVIRONMENT,
-        }
+        },
+        watch=settings.ENVIRONMENT != "production",
+    )
+    # Top-level files (favicon, robots.txt, ...) are listed once at startup
+    # rather than stat'ed on every SPA request; development re-checks the disk.
+    dist_files = {path.name: path for path in FRONTEND_DIR.iterdir() if path.is_file()}
+
+    def find_dist_file(name: str) -> Path | None:
+        if settings.ENVIRONMENT == "production":
+            return dist_files.get(name)
+        file_path = FRONTEND_DIR / name
+        return file_path if file_path.is_file() else None
 
-        injection = f"<script>window.__ENV__ = {json.dumps(config)};</script>"
-        return content.replace("<script>window.__ENV__ = {};</script>", injection)
+    def serve_index(request: Request) -> Response:
+        response = index_page.response(request.headers)
+        if response is None:
+            return JSONResponse(status_code=500, content={"error": "Frontend not found"})
+        return response
 
     @app.get("/", response_class=HTMLResponse)
-    def root() -> Response:
+    def index(request: Request) -> Response:
         """Serve React frontend with injected config"""
-        logger.info("Serving frontend with runtime config")
-        content = get_index_html()
-        if content:
-            return HTMLResponse(content)
-        return JSONResponse(status_code=500, content={"error": "Frontend not found"})
+        return serve_index(request)
 
     @app.get("/{full_path:path}", include_in_schema=False)
-    def spa_fallback(full_path: str) -> Response:
+    def spa_fallback(full_path: str, request: Request) -> Response:
         """SPA fallback - serve index.html for all non-API routes"""
-        if full_path.startswith(("api", "health", "assets")):
+        if full_path.startswith(("api", "health", "metrics", "assets")):
             return JSONResponse({"detail": "Not Found"}, status_code=404)
 
-        file_path = FRONTEND_DIR / full_path
-        if file_path.exists() and file_path.is_file():
+        if full_path != "index.html" and (file_path := find_dist_file(full_path)):
             return FileResponse(file_path)
 
-        content = get_index_html()
-        if content:
-            return HTMLResponse(content)
-        return FileResponse(FRONTEND_DIR / "index.html")
+        return serve_index(request)
 
 else:
 
@@ -0,0 +1,265 @@
+"""Production server: the app preloaded once, then forked into one worker per CPU
+
+Usage: python -m src.serve
+
+The parent process imports the app and binds the socket. With several
+workers and SERVER_SHARE_WARM_DATA, it also crawls SWAPI once into a snapshot
+that every worker memory-maps, so the warm-up is not repeated per worker.
+Workers that die are replaced after a growing delay; if they keep dying, the
+server exits with status 1.
+
+Several workers need a shared rate limit store, so the default configuration
+(RATE_LIMIT_STORAGE_URI=memory://, SERVER_SHARE_WARM_DATA=false) always runs a
+single worker: one per CPU is only forked once a redis:// store is configured
+and the "redis" extra is installed.
+"""
+
+import asyncio
+import logging
+import math
+import os
+import signal
+import socket
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+from types import FrameType
+
+import uvicorn
+from slowapi import Limiter
+
+from src.api.middleware import rate_limit
+from src.core.config import settings
+from src.infrastructure.swapi_snapshot import SnapshotError
+from src.snapshot import crawl
+
+logger = logging.getLogger("src.serve")
+
+CGROUP_CPU_MAX = Path("/sys/fs/cgroup/cpu.max")
+
+# First per-worker /metrics port when METRICS_PORT is not set
+WORKER_METRICS_PORT = 9100
+
+
+def available_cpus(cpu_max: Path = CGROUP_CPU_MAX) -> int:
+    """CPUs this process may use: its affinity, capped by a cgroup v2 CPU quota"""
+    cpus = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else os.cpu_count()
+    cpus = cpus or 1
+    try:
+        quota, period = cpu_max.read_text().split()
+        if quota != "max":
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+    except (OSError, ValueError):
+        pass
+    return max(cpus, 1)
+
+
+def _installed(module: str) -> bool:
+    try:
+        __import__(module)
+    except ImportError:
+        return False
+    return True
+
+
+def worker_count(cpus: int, limiter: Limiter | None = None) -> int:
+    """Workers to fork: SERVER_WORKERS, or one per CPU
+
+    Rate-limit counters kept in process memory would let clients through at N
+    times RATE_LIMIT across N workers. That is decided from the storage the
+    app's limiter actually uses, since a redis:// URI without the "redis" extra
+    falls back to memory too. Without a shared store, asking for several
+    workers is refused and the per-CPU default drops to one.
+    """
+    limiter = limiter or rate_limit.limiter
+    workers = settings.SERVER_WORKERS or cpus
+    if workers > 1 and rate_limit.limits_in_process(limiter):
+        if settings.SERVER_WORKERS:
+            raise SystemExit(
+                f"SERVER_WORKERS={workers} needs a shared RATE_LIMIT_STORAGE_URI "
+                "(e.g. redis://host:6379/1, with the redis extra installed); rate limits "
+                f"are counted in process memory with {settings.RATE_LIMIT_STORAGE_URI}"
+            )
+        logger.warning(
+            "Rate limits are counted in process memory, so one worker instead of one per CPU"
+        )
+        return 1
+    return workers
+
+
+def server_config() -> uvicorn.Config:
+    return uvicorn.Config(
+        "src.main:app",
+        host=settings.SERVER_HOST,
+        port=settings.PORT,
+        loop="uvloop" if _installed("uvloop") else "asyncio",
+        http="httptools" if _installed("httptools") else "h11",
+        backlog=settings.SERVER_BACKLOG,
+        timeout_keep_alive=settings.SERVER_KEEPALIVE_SECONDS,
+        limit_concurrency=settings.SERVER_LIMIT_CONCURRENCY or None,
+    )
+
+
+def share_warm_data() -> Path | None:
+    """Crawl SWAPI into a snapshot for the workers to serve, instead of each mirroring it
+
+    Opt-in with SERVER_SHARE_WARM_DATA: workers serving a snapshot never call
+    SWAPI, so the mirror, stale-while-revalidate and the warm-up refresh are
+    all bypassed and the data stays as crawled until the server restarts.
+    Nothing is crawled when a snapshot is already configured or the mirror is
+    off. The file goes to /dev/shm when there is one, so it is never written to
+    disk. If the crawl fails, each worker warms up on its own as usual.
+    """
+    if not settings.SERVER_SHARE_WARM_DATA or settings.SWAPI_SNAPSHOT_PATH:
+        return None
+    if not settings.SWAPI_MIRROR_ENABLED:
+        return None
+
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    path = Path(directory) / f"swapi-snapshot-{os.getpid()}.bin"
+    try:
+        counts = asyncio.run(asyncio.wait_for(crawl(str(path)), settings.WARMUP_TIMEOUT_SECONDS))
+    except (SnapshotError, TimeoutError, OSError) as exc:
+        logger.warning(f"Shared warm-up failed, workers will warm up on their own: {exc!r}")
+        return None
+
+    logger.info(f"Crawled {sum(counts.values())} SWAPI records for the workers into {path}")
+    # Workers are forked from this process, so they inherit the setting
+    settings.SWAPI_SNAPSHOT_PATH = str(path)
+    return path
+
+
+class Supervisor:
+    """Forks the workers from the preloaded parent and replaces any that exit
+
+    A worker that exits is replaced after a delay doubling with each exit in
+    the last ``restart_window`` seconds, up to ``max_backoff``. More than
+    ``restart_limit`` exits in that window means the workers cannot stay up
+    (a bad config, an unreachable dependency), so the rest are stopped and
+    ``run`` returns 1 instead of forking forever.
+
+    Each worker has a slot, kept by its replacement. With metrics enabled,
+    the worker in slot i serves its own /metrics on ``metrics_port`` + i,
+    since every process only counts the requests it handled.
+    """
+
+    def __init__(
+        self,
+        config: uvicorn.Config,
+        sock: socket.socket,
+        workers: int,
+        restart_limit: int | None = None,
+        restart_window: float | None = None,
+        max_backoff: float | None = None,
+    ):
+        self.config = config
+        self.sock = sock
+        self.workers = workers
+        self.restart_limit = (
+            settings.SERVER_RESTART_LIMIT if restart_limit is None else restart_limit
+        )
+        self.restart_window = (
+            settings.SERVER_RESTART_WINDOW_SECONDS if restart_window is None else restart_window
+        )
+        self.max_backoff = (
+            settings.SERVER_RESTART_BACKOFF_MAX_SECONDS if max_backoff is None else max_backoff
+        )
+        self.metrics_port = (
+            (settings.METRICS_PORT or WORKER_METRICS_PORT) if settings.METRICS_ENABLED else 0
+        )
+        self.pids: dict[int, int] = {}
+        self.exits: deque[float] = deque()
+        self.stopping = False
+
+    def spawn(self, slot: int) -> int:
+        pid = os.fork()
+        if pid == 0:  # pragma: no cover - runs in the worker
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            if self.metrics_port:
+                settings.METRICS_PORT = self.metrics_port + slot
+            status = 1
+            try:
+                uvicorn.Server(self.config).run(sockets=[self.sock])
+                status = 0
+            except SystemExit as exc:
+                # uvicorn exits with 3 when the app fails to start
+                status = exc.code if isinstance(exc.code, int) else 1
+            except BaseException:
+                logger.exception("Worker crashed")
+            finally:
+                os._exit(status)
+        return pid
+
+    def backoff(self) -> float | None:
+        """Seconds to wait before replacing a worker that just exited; None to give up"""
+        now = time.monotonic()
+        self.exits.append(now)
+        while self.exits[0] < now - self.restart_window:
+            self.exits.popleft()
+        if len(self.exits) > self.restart_limit:
+            return None
+        return min(2.0 ** (len(self.exits) - 1), self.max_backoff)
+
+    def stop(self, signum: int, frame: FrameType | None) -> None:
+        self.stopping = True
+        for pid in self.pids:
+            os.kill(pid, signal.SIGTERM)
+
+    def run(self) -> int:
+        """Supervise the workers until they are stopped; the exit status for the server"""
+        signal.signal(signal.SIGTERM, self.stop)
+        signal.signal(signal.SIGINT, self.stop)
+        self.pids = {self.spawn(slot): slot for slot in range(self.workers)}
+        logger.info(f"Started {self.workers} workers: {sorted(self.pids)}")
+        if self.metrics_port:
+            last = self.metrics_port + self.workers - 1
+            logger.info(f"Worker metrics on ports {self.metrics_port}-{last}")
+
+        exit_status = 0
+        while self.pids:
+            pid, status = os.wait()
+            slot = self.pids.pop(pid)
+            if self.stopping:
+                continue
+            code = os.waitstatus_to_exitcode(status)
+            delay = self.backoff()
+            if delay is None:
+                logger.error(
+                    f"Worker {pid} exited with status {code}; {len(self.exits)} exits "
+                    f"in {self.restart_window:g}s, stopping the server"
+                )
+                exit_status = 1
+                self.stop(signal.SIGTERM, None)
+                continue
+            logger.warning(f"Worker {pid} exited with status {code}, replacing it in {delay:g}s")
+            time.sleep(delay)
+            if not self.stopping:
+                self.pids[self.spawn(slot)] = slot
+        return exit_status
+
+
+def main() -> None:
+    config = server_config()
+    # Import the app (and its logging setup) once; workers share it copy-on-write
+    config.load()
+    workers = worker_count(available_cpus())
+    if workers == 1:
+        uvicorn.Server(config).run()
+        return
+
+    snapshot = share_warm_data()
+    sock = config.bind_socket()
+    try:
+        status = Supervisor(config, sock, workers).run()
+    finally:
+        sock.close()
+        if snapshot is not None:
+            snapshot.unlink(missing_ok=True)
+    sys.exit(status)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Crawl every SWAPI resource into a snapshot file
+
+Usage: python -m src.snapshot [PATH]
+
+Serve it with SWAPI_SNAPSHOT_PATH=PATH to run without calling SWAPI.
+"""
+
+import argparse
+import asyncio
+
+from src.core.config import settings
+from src.infrastructure.swapi_http_client import SwapiHttpClient
+from src.infrastructure.swapi_mirror import SwapiMirror
+from src.infrastructure.swapi_snapshot import SnapshotError, write_snapshot
+
+DEFAULT_PATH = "data/swapi-snapshot.bin"
+
+
+async def crawl(path: str) -> dict[str, int]:
+    """Load every page of every resource from SWAPI, then write the snapshot"""
+    client = SwapiHttpClient()
+    try:
+        mirror = SwapiMirror(client)
+        await mirror.load()
+        if not mirror.is_ready:
+            raise SnapshotError("SWAPI crawl incomplete, snapshot not written")
+        records = {name: table.records for name, table in mirror.tables.items()}
+        return write_snapshot(path, records, settings.SWAPI_BASE_URL)
+    finally:
+        await client.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Crawl every SWAPI resource into a snapshot file")
+    parser.add_argument("path", nargs="?", default=DEFAULT_PATH)
+    args = parser.parse_args()
+
+    try:
+        counts = asyncio.run(crawl(args.path))
+    except SnapshotError as exc:
+        raise SystemExit(str(exc)) from exc
+    print(f"Wrote {sum(counts.values())} records to {args.path}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import timeit
+
+import pytest
+
+from src.infrastructure.cache import LRUCache
+
+SIZES = [128, 1_000, 10_000, 100_000]
+LOOKUPS = 20_000
+# Large tables spill out of the CPU caches, so some growth is expected; a linear
+# scan would be ~800x slower at 100k entries than at 128.
+MAX_SLOWDOWN = 5.0
+
+
+def _filled_cache(size: int) -> LRUCache:
+    cache = LRUCache(max_size=size, default_ttl=3600)
+    for i in range(size):
+        cache.set(f"key:{i}", i)
+    return cache
+
+
+def _per_op_seconds(statement: str, namespace: dict[str, object]) -> float:
+    timer = timeit.Timer(statement, globals=namespace)
+    return min(timer.repeat(repeat=5, number=1)) / LOOKUPS
+
+
+def _hit_latency(size: int) -> float:
+    cache = _filled_cache(size)
+    keys = [f"key:{i % size}" for i in range(0, LOOKUPS * 7, 7)]
+    return _per_op_seconds("for key in keys: get(key)", {"keys": keys, "get": cache.get})
+
+
+def _miss_latency(size: int) -> float:
+    cache = _filled_cache(size)
+    keys = [f"missing:{i}" for i in range(LOOKUPS)]
+    return _per_op_seconds("for key in keys: get(key)", {"keys": keys, "get": cache.get})
+
+
+def _set_latency(size: int) -> float:
+    cache = _filled_cache(size)
+    keys = [f"new:{i}" for i in range(LOOKUPS)]
+    # Every set on a full cache evicts the least recently used entry
+    return _per_op_seconds("for key in keys: set_(key, 1)", {"keys": keys, "set_": cache.set})
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "measure", [_hit_latency, _miss_latency, _set_latency], ids=["hit", "miss", "set-evict"]
+)
+def test_latency_stays_flat_from_128_to_100k_entries(measure) -> None:
+    latencies = {size: measure(size) for size in SIZES}
+
+    for size, latency in latencies.items():
+        print(f"{measure.__name__} size={size:>7}: {latency * 1e9:8.1f} ns/op")
+
+    assert latencies[SIZES[-1]] <= latencies[SIZES[0]] * MAX_SLOWDOWN
@@ -0,0 +1,107 @@
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import pytest
+from starlette.requests import Request
+from starlette.types import Message, Receive, Scope, Send
+
+from src.api.compression import ENCODINGS
+from src.api.middleware.compression import CompressionMiddleware
+from src.api.responses import ResponseCache, dumps
+
+REQUESTS = 300
+
+# A page of films is the largest list response: ten opening crawls
+FILMS = {
+    "count": 60,
+    "results": [
+        {
+            "title": f"Episode {i}",
+            "episode_id": i,
+            "opening_crawl": (
+                "It is a period of civil war. Rebel spaceships, striking from a hidden base, "
+                "have won their first victory against the evil Galactic Empire. "
+            )
+            * 6,
+            "director": "George Lucas",
+            "producer": "Gary Kurtz, Rick McCallum",
+            "release_date": "1977-05-25",
+            "url": f"https://swapi.dev/api/films/{i}/",
+        }
+        for i in range(10)
+    ],
+}
+
+
+def _request(accept_encoding: str) -> Request:
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding else []
+    return Request({"type": "http", "method": "GET", "headers": headers})
+
+
+async def _cpu_per_request(serve: Callable[[], Awaitable[bytes]]) -> tuple[float, int]:
+    """CPU microseconds per request and the bytes of the last body sent"""
+    body = await serve()  # warm up caches
+    start = time.process_time()
+    for _ in range(REQUESTS):
+        body = await serve()
+    return (time.process_time() - start) / REQUESTS * 1e6, len(body)
+
+
+def _middleware_serve(encoding: str) -> Callable[[], Awaitable[bytes]]:
+    """The same body, compressed by CompressionMiddleware on every request"""
+    body = dumps(FILMS)
+
+    async def app(scope: Scope, receive: Receive, send: Send) -> None:
+        headers = [(b"content-type", b"application/json")]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
+
+    middleware = CompressionMiddleware(app, min_size=0, encodings=(encoding,))
+    scope = {"type": "http", "headers": [(b"accept-encoding", encoding.encode())]}
+
+    async def receive() -> Message:
+        return {"type": "http.request"}
+
+    async def serve() -> bytes:
+        sent: list[Message] = []
+
+        async def send(message: Message) -> None:
+            sent.append(message)
+
+        await middleware(scope, receive, send)
+        return bytes(sent[-1]["body"])
+
+    return serve
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("encoding", ENCODINGS)
+async def test_cached_compressed_pages_cost_less_cpu_than_recompressing(encoding: str) -> None:
+    cache = ResponseCache(max_size=10, ttl=60)
+
+    async def produce() -> dict[str, Any]:
+        return FILMS
+
+    def cached(accept_encoding: str) -> Callable[[], Awaitable[bytes]]:
+        async def serve() -> bytes:
+            response = await cache.respond(_request(accept_encoding), "films:1", produce)
+            return bytes(response.body)
+
+        return serve
+
+    identity_cpu, identity_bytes = await _cpu_per_request(cached(""))
+    cached_cpu, cached_bytes = await _cpu_per_request(cached(encoding))
+    middleware_cpu, middleware_bytes = await _cpu_per_request(_middleware_serve(encoding))
+    print(
+        f"{encoding:>5}: {identity_bytes} B identity, {cached_bytes} B compressed; "
+        f"{identity_cpu:.1f} us identity, {cached_cpu:.1f} us cached, "
+        f"{middleware_cpu:.1f} us recompressed per request"
+    )
+
+    assert cached_bytes == middleware_bytes
+    assert cached_bytes < identity_bytes / 3
+    if sys.gettrace() is not None:
+        pytest.skip("coverage tracing distorts CPU timings; run with --no-cov")
+    assert cached_cpu < middleware_cpu
@@ -0,0 +1,154 @@
+import math
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+
+import httpx
+import pytest
+from fastapi import FastAPI, Query
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, Response
+from fastapi.testclient import TestClient
+
+from src.api.responses import response_cache
+from src.application.ports.swapi_client import SwapiClient
+from src.application.use_cases.get_characters import GetCharacters
+from src.application.use_cases.get_films import GetFilms
+from src.application.use_cases.get_planets import GetPlanets
+from src.application.use_cases.get_starships import GetStarships
+from src.core.config import settings
+from src.domain.entities import data_fields
+from src.domain.entities.character import Character
+from src.domain.entities.film import Film
+from src.domain.entities.planet import Planet
+from src.domain.entities.starship import Starship
+from src.domain.value_objects.filters import SearchFilters
+from src.main import app
+
+ENDPOINTS = {
+    "people": (Character, GetCharacters),
+    "planets": (Planet, GetPlanets),
+    "films": (Film, GetFilms),
+    "starships": (Starship, GetStarships),
+}
+REQUESTS = 300
+ROUNDS = 5
+HEADERS = {"X-API-Key": settings.API_KEY}
+
+
+def _record(entity: type, i: int) -> dict[str, Any]:
+    record: dict[str, Any] = {}
+    for field in data_fields(entity):
+        if field.type is int:
+            record[field.name] = i
+        elif field.type is str:
+            record[field.name] = f"{field.name} {i}" if field.name != "url" else f"/{i}/"
+        else:
+            record[field.name] = [f"https://swapi.dev/api/films/{n}/" for n in range(6)]
+    return record
+
+
+@pytest.fixture
+def swapi_client(make_swapi) -> Any:
+    """Ten records per resource, every list call answered with the same page"""
+    return make_swapi(
+        {name: [_record(entity, i) for i in range(10)] for name, (entity, _) in ENDPOINTS.items()}
+    )
+
+
+async def _before(name: str, swapi_client: SwapiClient, page: int = 1) -> Response:
+    """A list route as it used to be: entities through jsonable_encoder"""
+    _, use_case = ENDPOINTS[name]
+    result = await use_case(swapi_client).execute(SearchFilters(page=page))
+    results = [
+        {field.name: getattr(entity, field.name) for field in data_fields(entity)}
+        for entity in result["results"]
+    ]
+    return JSONResponse(jsonable_encoder({"count": result["count"], "results": results}))
+
+
+async def _after(name: str, swapi_client: SwapiClient, page: int = 1) -> Response:
+    """A list route through the response cache"""
+    _, use_case = ENDPOINTS[name]
+    filters = SearchFilters(page=page)
+    return await response_cache.get_or_render(
+        f"{name}:{filters!r}", lambda: use_case(swapi_client).execute(filters)
+    )
+
+
+def _list_app(swapi_client: SwapiClient) -> FastAPI:
+    """The four list routes twice, without auth or rate limiting"""
+    bench = FastAPI()
+
+    for name in ENDPOINTS:
+
+        async def before(page: int = Query(1), name: str = name) -> Response:
+            return await _before(name, swapi_client, page)
+
+        async def after(page: int = Query(1), name: str = name) -> Response:
+            return await _after(name, swapi_client, page)
+
+        bench.add_api_route(f"/before/{name}", before)
+        bench.add_api_route(f"/after/{name}", after)
+    return bench
+
+
+@pytest.fixture
+async def client(swapi_client: SwapiClient) -> AsyncIterator[httpx.AsyncClient]:
+    response_cache.clear()
+    transport = httpx.ASGITransport(app=_list_app(swapi_client))
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        yield client
+    response_cache.clear()
+
+
+async def _cpu_per_request(serve: Callable[[], Awaitable[Response]]) -> float:
+    """CPU microseconds per request, the best of ROUNDS runs
+
+    The handlers are called directly: through an HTTP transport, its own
+    overhead would dwarf the difference being measured.
+    """
+    await serve()  # warm up caches
+    best = math.inf
+    for _ in range(ROUNDS):
+        start = time.process_time()
+        for _ in range(REQUESTS):
+            await serve()
+        best = min(best, (time.process_time() - start) / REQUESTS * 1e6)
+    return best
+
+
+@pytest.mark.parametrize("name", ENDPOINTS)
+async def test_both_routes_return_the_same_page(name: str, client: httpx.AsyncClient) -> None:
+    before = await client.get(f"/before/{name}")
+    after = await client.get(f"/after/{name}")
+
+    assert before.json() == after.json()
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("name", ENDPOINTS)
+async def test_serialized_responses_cost_less_cpu(name: str, swapi_client: SwapiClient) -> None:
+    response_cache.clear()
+    try:
+        before = await _cpu_per_request(lambda: _before(name, swapi_client))
+        after = await _cpu_per_request(lambda: _after(name, swapi_client))
+    finally:
+        response_cache.clear()
+    print(f"{name:>9}: {before:6.1f} us before, {after:6.1f} us after per request")
+
+    if sys.gettrace() is not None:
+        pytest.skip("coverage tracing distorts CPU timings; run with --no-cov")
+    assert after < before
+
+
+def test_list_routes_return_cached_bytes(swapi_client: Any, serve_swapi: Any) -> None:
+    serve_swapi(swapi_client)
+    client = TestClient(app)
+    first = client.get(f"{settings.API_PREFIX}/people", headers=HEADERS)
+    swapi_client.records["people"] = []
+    second = client.get(f"{settings.API_PREFIX}/people", headers=HEADERS)
+
+    assert first.content == second.content
+    assert first.headers["content-type"] == "application/json"
@@ -1 +1,164 @@
 # Tests use src. imports directly
+import asyncio
+from collections.abc import Callable, Iterator
+from typing import Any
+
+import pytest
+
+from src.api.dependencies import get_swapi_client
+from src.api.responses import response_cache
+from src.application.ports.swapi_client import RecordNotFoundError, SwapiClient
+from src.application.use_cases.entity_store import entity_store
+from src.application.use_cases.result_cache import result_cache
+from src.domain.value_objects.filters import SearchFilters
+from src.main import app
+
+SWAPI_URL = "https://swapi.dev/api"
+
+Record = dict[str, Any]
+
+
+def person(index: int, **fields: Any) -> Record:
+    """A SWAPI people record; keyword arguments override its fields"""
+    return {
+        "name": f"Person {index}",
+        "height": "172",
+        "mass": "77",
+        "hair_color": "blond",
+        "skin_color": "fair",
+        "eye_color": "blue",
+        "birth_year": "19BBY",
+        "gender": "male",
+        "homeworld": f"{SWAPI_URL}/planets/1/",
+        "url": f"{SWAPI_URL}/people/{index}/",
+        "films": [],
+        **fields,
+    }
+
+
+def planet(index: int, **fields: Any) -> Record:
+    """A SWAPI planets record, Tatooine unless overridden"""
+    return {
+        "name": "Tatooine",
+        "rotation_period": "23",
+        "orbital_period": "304",
+        "diameter": "10465",
+        "climate": "arid",
+        "gravity": "1 standard",
+        "terrain": "desert",
+        "surface_water": "1",
+        "population": "200000",
+        "url": f"{SWAPI_URL}/planets/{index}/",
+        **fields,
+    }
+
+
+class FakeSwapiClient(SwapiClient):
+    """In-memory SWAPI paging its records like the real one and recording every call
+
+    List calls land in ``calls`` and fetched URLs in ``fetched``; a resource
+    mapped in ``failures`` raises that error on every list call.
+    """
+
+    def __init__(
+        self,
+        records: dict[str, list[Record]] | None = None,
+        failures: dict[str, Exception] | None = None,
+        page_size: int = 10,
+        delay: float = 0,
+    ) -> None:
+        self.records = records or {}
+        self.failures = failures or {}
+        self.page_size = page_size
+        self.delay = delay
+        self.calls: list[tuple[str, SearchFilters]] = []
+        self.fetched: list[str] = []
+        self.active = 0
+        self.max_active = 0
+
+    async def _page(self, resource: str, filters: SearchFilters) -> dict[str, Any]:
+        self.calls.append((resource, filters))
+        if resource in self.failures:
+            raise self.failures[resource]
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        items = self.records.get(resource, [])
+        start = (filters.page - 1) * self.page_size
+        return {"count": len(items), "results": items[start : start + self.page_size]}
+
+    async def get_characters(self, filters: SearchFilters) -> dict[str, Any]:
+        return await self._page("people", filters)
+
+    async def get_planets(self, filters: SearchFilters) -> dict[str, Any]:
+        return await self._page("planets", filters)
+
+    async def get_films(self, filters: SearchFilters) -> dict[str, Any]:
+        return await self._page("films", filters)
+
+    async def get_starships(self, filters: SearchFilters) -> dict[str, Any]:
+        return await self._page("starships", filters)
+
+    async def get_resource(self, url: str) -> dict[str, Any]:
+        self.fetched.append(url)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        resource = url.rstrip("/").rsplit("/", 2)[-2]
+        for record in self.records.get(resource, []):
+            if record["url"] == url:
+                return record
+        raise RecordNotFoundError(url)
+
+    async def get_record(self, resource: str, record_id: int) -> dict[str, Any]:
+        return await self.get_resource(f"{SWAPI_URL}/{resource}/{record_id}/")
+
+
+@pytest.fixture
+def make_person() -> Callable[..., Record]:
+    return person
+
+
+@pytest.fixture
+def make_planet() -> Callable[..., Record]:
+    return planet
+
+
+@pytest.fixture
+def people() -> list[Record]:
+    """25 people to page through, every seventh of unknown height"""
+    return [
+        person(
+            i,
+            name=f"Person {i:02d}",
+            height="unknown" if i % 7 == 0 else str(100 + i),
+            mass=str(i * 3),
+        )
+        for i in range(1, 26)
+    ]
+
+
+@pytest.fixture
+def make_swapi() -> Callable[..., FakeSwapiClient]:
+    return FakeSwapiClient
+
+
+@pytest.fixture
+def serve_swapi() -> Iterator[Callable[[FakeSwapiClient], FakeSwapiClient]]:
+    """Puts a client behind the app's routes, with the page and entity caches emptied"""
+
+    def clear() -> None:
+        result_cache.clear()
+        response_cache.clear()
+        entity_store.clear()
+
+    def serve(client: FakeSwapiClient) -> FakeSwapiClient:
+        app.dependency_overrides[get_swapi_client] = lambda: client
+        return client
+
+    clear()
+    yield serve
+    app.dependency_overrides.clear()
+    clear()
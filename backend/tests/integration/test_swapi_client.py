@@ -1,7 +1,7 @@
 import pytest
 
-from domain.value_objects.filters import SearchFilters
-from infrastructure.swapi_http_client import SwapiHttpClient
+from src.domain.value_objects.filters import SearchFilters
+from src.infrastructure.swapi_http_client import SwapiHttpClient
 
 
 @pytest.fixture
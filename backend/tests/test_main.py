@@ -1,6 +1,8 @@
 import pytest
 from fastapi.testclient import TestClient
 
+from src.core.config import settings
+from src.infrastructure.swapi_snapshot import write_snapshot
 from src.main import app
 
 
@@ -9,6 +11,13 @@ def client():
     return TestClient(app)
 
 
+@pytest.fixture
+def offline(monkeypatch):
+    """Run the lifespan without mirroring or warming up from SWAPI"""
+    monkeypatch.setattr(settings, "SWAPI_MIRROR_ENABLED", False)
+    monkeypatch.setattr(settings, "WARMUP_ENABLED", False)
+
+
 def test_health_endpoint(client):
     response = client.get("/health")
     assert response.status_code == 200
@@ -25,3 +34,107 @@ def test_root_endpoint(client):
     assert data["message"] == "Star Wars API Platform"
     assert data["version"] == "1.0.0"
     assert data["docs"] == "/api/v1/docs"
+
+
+def test_lifespan_shares_one_swapi_client(offline):
+    with TestClient(app) as client:
+        swapi_client = app.state.swapi_http_client
+        response = client.get("/health")
+
+        assert response.status_code == 200
+        pool = response.json()["swapi_pool"]
+        assert pool["max_connections"] == swapi_client.limits.max_connections
+        assert "open_connections" in pool
+        assert "in_flight_requests" in pool
+
+    assert swapi_client.client.is_closed
+
+
+def test_shutdown_clears_the_lifespan_state(offline, client):
+    with TestClient(app):
+        assert app.state.cache_warmer is not None
+
+    assert not hasattr(app.state, "cache_warmer")
+    assert not hasattr(app.state, "swapi_http_client")
+    assert client.get("/health").status_code == 200
+
+
+def test_health_reports_warming_until_warm_up_completes(offline):
+    with TestClient(app) as client:
+        warmer = app.state.cache_warmer
+        warmer.ready = False
+        warming = client.get("/health")
+        warmer.ready = True
+        ready = client.get("/health")
+
+    assert warming.status_code == 503
+    assert warming.json()["status"] == "warming"
+    assert ready.status_code == 200
+    assert ready.json()["warmup"]["ready"] is True
+
+
+def test_metrics_endpoint_exposes_prometheus_text(client):
+    client.get("/health")
+    response = client.get("/metrics", headers={"X-API-Key": settings.API_KEY})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert 'http_request_duration_seconds_count{method="GET",route="/health"' in response.text
+    assert "# TYPE app_ready gauge" in response.text
+    assert "# TYPE cache_hits_total counter" in response.text
+
+
+def test_metrics_on_the_app_port_require_the_api_key(client):
+    assert client.get("/metrics").status_code == 401
+
+
+def test_metrics_with_a_port_of_their_own_are_not_on_the_app_port(monkeypatch, client):
+    monkeypatch.setattr(settings, "METRICS_PORT", 9100)
+
+    response = client.get("/metrics", headers={"X-API-Key": settings.API_KEY})
+
+    assert response.status_code == 404
+
+
+def test_snapshot_serves_the_api_without_swapi(monkeypatch, tmp_path):
+    path = tmp_path / "swapi-snapshot.bin"
+    films = [
+        {
+            "title": "A New Hope",
+            "episode_id": 4,
+            "opening_crawl": "It is a period of civil war.",
+            "director": "George Lucas",
+            "producer": "Gary Kurtz",
+            "release_date": "1977-05-25",
+            "url": "https://swapi.dev/api/films/1/",
+        }
+    ]
+    write_snapshot(path, {"people": [], "planets": [], "films": films, "starships": []}, "")
+    monkeypatch.setattr(settings, "SWAPI_SNAPSHOT_PATH", str(path))
+    monkeypatch.setattr(settings, "WARMUP_ENABLED", False)
+
+    with TestClient(app) as client:
+        health = client.get("/health")
+        response = client.get("/api/v1/films", headers={"X-API-Key": settings.API_KEY})
+        suggestions = client.get("/api/v1/suggest?q=new", headers={"X-API-Key": settings.API_KEY})
+
+    assert health.json()["snapshot"]["records"]["films"] == 1
+    assert response.status_code == 200
+    assert response.json()["results"][0]["title"] == "A New Hope"
+    assert suggestions.json()["results"] == [
+        {"name": "A New Hope", "resource": "films", "url": "https://swapi.dev/api/films/1/"}
+    ]
+    assert "max-age=" in suggestions.headers["cache-control"]
+
+
+def test_app_compresses_responses_and_adds_security_headers(client):
+    response = client.get(
+        f"{settings.API_PREFIX}/openapi.json", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert int(response.headers["content-length"]) < len(response.content)
+    assert response.json()["info"]["title"] == settings.PROJECT_NAME
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-frame-options"] == "DENY"
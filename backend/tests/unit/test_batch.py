@@ -0,0 +1,63 @@
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.config import settings
+from src.infrastructure.circuit_breaker import CircuitOpenError
+from src.main import app
+
+HEADERS = {"X-API-Key": settings.API_KEY}
+
+
+@pytest.fixture
+def swapi(make_swapi, make_person, serve_swapi):
+    """People and films answer; starships fail as if SWAPI's circuit were open"""
+    people = [make_person(1, name="Luke"), make_person(2, name="Leia")]
+    failures = {"starships": CircuitOpenError("open")}
+    return serve_swapi(make_swapi({"people": people}, failures=failures))
+
+
+def _resources(swapi: Any) -> list[str]:
+    return [resource for resource, _ in swapi.calls]
+
+
+def _batch(*queries: dict[str, Any]) -> Any:
+    return TestClient(app).post("/api/v1/batch", json={"queries": list(queries)}, headers=HEADERS)
+
+
+def test_results_come_back_in_query_order(swapi):
+    response = _batch(
+        {"resource": "films"},
+        {"resource": "people", "ordering": "name"},
+        {"resource": "planets", "search": "tatooine"},
+    )
+
+    assert response.status_code == 200
+    films, people, planets = response.json()["results"]
+    assert films == {"count": 0, "results": []}
+    assert [person["name"] for person in people["results"]] == ["Leia", "Luke"]
+    assert planets["count"] == 0
+
+
+def test_shares_the_response_cache_with_the_list_routes(swapi):
+    listed = TestClient(app).get("/api/v1/people?ordering=name", headers=HEADERS)
+    batched = _batch({"resource": "people", "ordering": "name"})
+
+    assert batched.content == b'{"results":[' + listed.content + b"]}"
+    assert _resources(swapi) == ["people"]
+
+
+def test_failed_query_does_not_fail_the_batch(swapi):
+    response = _batch({"resource": "starships"}, {"resource": "people"})
+
+    starships, people = response.json()["results"]
+    assert starships == {"error": {"status": 503, "detail": "SWAPI is temporarily unavailable"}}
+    assert people["count"] == 2
+
+
+def test_invalid_queries_are_rejected_before_running(swapi):
+    assert _batch({"resource": "people", "expand": "pilots"}).status_code == 400
+    assert _batch(*[{"resource": "films"}] * (settings.BATCH_MAX_QUERIES + 1)).status_code == 422
+    assert _batch({"resource": "vehicles"}).status_code == 422
+    assert _resources(swapi) == []
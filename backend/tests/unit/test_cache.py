@@ -3,7 +3,7 @@ import time
 
 import pytest
 
-from infrastructure.cache import LRUCache, cached, clear_cache
+from src.infrastructure.cache import LRUCache, cache_stats, cached, clear_cache
 
 
 class TestLRUCache:
@@ -48,6 +48,16 @@ class TestLRUCache:
         assert cache.get("key2") is None
         assert cache.get("key3") == "value3"
 
+    def test_cache_overwrite_does_not_evict(self) -> None:
+        cache = LRUCache(max_size=2)
+        cache.set("key1", "value1")
+        cache.set("key2", "value2")
+        cache.set("key1", "updated")
+
+        assert len(cache) == 2
+        assert cache.get("key1") == "updated"
+        assert cache.get("key2") == "value2"
+
     def test_cache_clear_removes_all_entries(self) -> None:
         cache = LRUCache()
         cache.set("key1", "value1")
@@ -115,3 +125,123 @@ class TestCachedDecorator:
         assert result1 == 10
         assert result2 == 10
         assert call_count == 2
+
+
+@pytest.mark.asyncio
+class TestRequestCoalescing:
+    async def test_concurrent_misses_share_one_call(self) -> None:
+        call_count = 0
+
+        @cached(ttl=60)
+        async def fetch_page(page: int) -> dict[str, int]:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return {"page": page}
+
+        clear_cache()
+
+        results = await asyncio.gather(*(fetch_page(1) for _ in range(200)))
+
+        assert call_count == 1
+        assert all(result == {"page": 1} for result in results)
+        stats = cache_stats()
+        assert stats["upstream_calls"] == 1
+        assert stats["coalesced_calls"] == 199
+        assert stats["in_flight"] == 0
+
+    async def test_exception_propagates_to_all_callers_and_is_not_cached(self) -> None:
+        call_count = 0
+
+        @cached(ttl=60)
+        async def flaky(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            if call_count == 1:
+                raise RuntimeError("upstream down")
+            return x
+
+        clear_cache()
+
+        results = await asyncio.gather(*(flaky(1) for _ in range(5)), return_exceptions=True)
+
+        assert call_count == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert await flaky(1) == 1
+        assert call_count == 2
+
+    async def test_cancelled_caller_does_not_cancel_shared_call(self) -> None:
+        started = asyncio.Event()
+
+        @cached(ttl=60)
+        async def slow(x: int) -> int:
+            started.set()
+            await asyncio.sleep(0.05)
+            return x
+
+        clear_cache()
+
+        leader = asyncio.create_task(slow(3))
+        await started.wait()
+        follower = asyncio.create_task(slow(3))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        assert await follower == 3
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        assert cache_stats()["upstream_calls"] == 1
+
+
+@pytest.mark.asyncio
+class TestStaleWhileRevalidate:
+    async def test_stale_value_served_and_refreshed_in_background(self) -> None:
+        call_count = 0
+
+        @cached(ttl=1, stale_ttl=60)
+        async def fetch(x: int) -> int:
+            nonlocal call_count
+            call_count += 1
+            await asyncio.sleep(0.01)
+            return x * call_count
+
+        clear_cache()
+
+        assert await fetch(5) == 5
+        await asyncio.sleep(1.1)
+
+        assert await fetch(5) == 5
+        assert cache_stats()["stale_served"] == 1
+
+        await asyncio.sleep(0.05)
+        assert call_count == 2
+        assert await fetch(5) == 10
+
+    async def test_stale_served_on_error_after_revalidate_window(self) -> None:
+        fail = False
+
+        @cached(ttl=1, stale_if_error_ttl=60)
+        async def fetch(x: int) -> int:
+            if fail:
+                raise RuntimeError("SWAPI unavailable")
+            return x
+
+        clear_cache()
+
+        assert await fetch(7) == 7
+        await asyncio.sleep(1.1)
+        fail = True
+
+        assert await fetch(7) == 7
+        assert cache_stats()["stale_if_error_served"] == 1
+
+    async def test_error_raised_when_no_stale_value_retained(self) -> None:
+        @cached(ttl=1)
+        async def fetch(x: int) -> int:
+            raise RuntimeError("SWAPI unavailable")
+
+        clear_cache()
+
+        with pytest.raises(RuntimeError):
+            await fetch(1)
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from src.application.use_cases.result_cache import result_cache
+from src.infrastructure.cache_warmer import CacheWarmer
+
+
+@pytest.fixture
+def make_client(make_swapi):
+    """Records every list call; planets fail, and calls can be slowed down"""
+
+    def make_client(delay: float = 0):
+        return make_swapi(failures={"planets": RuntimeError("SWAPI unavailable")}, delay=delay)
+
+    return make_client
+
+
+@pytest.fixture(autouse=True)
+def _clear_results():
+    result_cache.clear()
+    yield
+    result_cache.clear()
+
+
+@pytest.mark.asyncio
+class TestCacheWarmer:
+    async def test_warms_pages_and_search_terms(self, make_client):
+        client = make_client()
+        warmer = CacheWarmer(client, pages=2, search_terms=["vader"])
+
+        await warmer.warm()
+
+        people = [f for name, f in client.calls if name == "people"]
+        films = [f for name, f in client.calls if name == "films"]
+        assert sorted(f.page for f in people if not f.search) == [1, 2]
+        assert [f.search for f in people if f.search] == ["vader"]
+        assert not any(f.search for f in films)
+        assert warmer.stats()["last_failures"] == 3  # planets: two pages and one search
+
+    async def test_preload_runs_before_the_pages(self, make_client):
+        client = make_client()
+        order: list[str] = []
+
+        async def preload() -> None:
+            order.append(f"preload after {len(client.calls)} calls")
+
+        await CacheWarmer(client, pages=1, preload=[preload]).warm()
+
+        assert order == ["preload after 0 calls"]
+
+    async def test_ready_after_timeout_while_warm_up_continues(self, make_client):
+        warmer = CacheWarmer(make_client(delay=0.2), pages=1)
+
+        run = asyncio.create_task(warmer.run(timeout=0.01, refresh_interval=0))
+        await asyncio.sleep(0.05)
+
+        assert warmer.ready
+        assert warmer.timed_out
+        assert warmer.passes == 0
+        await run
+        assert warmer.passes == 1
+
+    async def test_refreshes_periodically(self, make_client):
+        warmer = CacheWarmer(make_client(), pages=1)
+
+        run = asyncio.create_task(warmer.run(timeout=1, refresh_interval=0.01))
+        await asyncio.sleep(0.1)
+        run.cancel()
+
+        assert warmer.ready
+        assert not warmer.timed_out
+        assert warmer.passes > 2
@@ -0,0 +1,76 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from src.api.compression import accepted_encodings, compress, negotiate
+from src.api.middleware.compression import CompressionMiddleware
+from src.api.responses import ResponseCache
+
+TEXT = "It is a period of civil war. " * 100
+
+
+def test_negotiate_picks_the_first_accepted_encoding() -> None:
+    assert negotiate("gzip, br", ("zstd", "br", "gzip")) == "br"
+    assert negotiate("gzip;q=0, br;q=0", ("br", "gzip")) is None
+    assert negotiate(None, ("gzip",)) is None
+    assert accepted_encodings("GZIP; q=0.5") == {"gzip"}
+
+
+def test_gzip_round_trips() -> None:
+    assert gzip.decompress(compress(TEXT.encode(), "gzip")) == TEXT.encode()
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, min_size=100, encodings=("gzip",))
+
+    @app.get("/text")
+    def text(size: int = len(TEXT)) -> PlainTextResponse:
+        return PlainTextResponse(TEXT[:size], headers={"ETag": '"abc"'})
+
+    @app.get("/image")
+    def image() -> Response:
+        return Response(TEXT.encode(), media_type="image/png")
+
+    @app.get("/stream")
+    def stream() -> StreamingResponse:
+        return StreamingResponse(iter([TEXT, TEXT]), media_type="text/plain")
+
+    return app
+
+
+def test_large_text_is_compressed_with_a_weak_etag() -> None:
+    response = TestClient(_app()).get("/text", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == 'W/"abc"'
+    assert int(response.headers["content-length"]) < len(TEXT)
+    assert response.text == TEXT
+
+
+def test_small_binary_and_streamed_bodies_are_sent_as_is() -> None:
+    client = TestClient(_app())
+    headers = {"Accept-Encoding": "gzip"}
+
+    for path in ("/text?size=50", "/image", "/stream"):
+        assert "content-encoding" not in client.get(path, headers=headers).headers
+    assert "content-encoding" not in client.get("/text", headers={"Accept-Encoding": "br"}).headers
+
+
+async def test_cached_pages_are_compressed_once_per_encoding() -> None:
+    cache = ResponseCache(max_size=10, ttl=60)
+    request = Request({"type": "http", "method": "GET", "headers": [(b"accept-encoding", b"gzip")]})
+
+    async def produce() -> dict[str, str]:
+        return {"opening_crawl": TEXT}
+
+    first = await cache.respond(request, "films:1", produce)
+    second = await cache.respond(request, "films:1", produce)
+
+    assert first.headers["content-encoding"] == "gzip"
+    assert first.body is second.body
+    assert gzip.decompress(second.body) == await cache.get_or_render_body("films:1", produce)
@@ -1,8 +1,12 @@
-from domain.entities.character import Character
-from domain.entities.film import Film
-from domain.entities.planet import Planet
-from domain.entities.starship import Starship
-from domain.value_objects.filters import SearchFilters
+from dataclasses import asdict
+
+from src.domain.entities import data_fields
+from src.domain.entities.character import Character
+from src.domain.entities.film import Film
+from src.domain.entities.planet import Planet
+from src.domain.entities.starship import Starship
+from src.domain.value_objects.filters import SearchFilters
+from src.domain.value_objects.ordering import Ordering, SortColumns, is_unknown, parse_numeric
 
 
 class TestCharacterEntity:
@@ -29,6 +33,26 @@ class TestCharacterEntity:
         assert len(character.films) == 2
         assert character.films[0] == "https://swapi.dev/api/films/1/"
 
+    def test_character_parses_numeric_fields_once(self):
+        character = Character.from_swapi(
+            {
+                "name": "Jabba Desilijic Tiure",
+                "height": "175",
+                "mass": "1,358",
+                "hair_color": "n/a",
+                "skin_color": "green-tan, brown",
+                "eye_color": "orange",
+                "birth_year": "600BBY",
+                "gender": "hermaphrodite",
+                "homeworld": "https://swapi.dev/api/planets/24/",
+                "url": "https://swapi.dev/api/people/16/",
+            }
+        )
+
+        assert character.numeric_values == {"height": 175.0, "mass": 1358.0}
+        assert [field.name for field in data_fields(character)] == list(asdict(character))[:-1]
+        assert "numeric_values" not in repr(character)
+
 
 class TestPlanetEntity:
     def test_planet_from_swapi(self):
@@ -109,3 +133,68 @@ class TestSearchFilters:
 
         assert params == {"page": 1}
         assert "search" not in params
+
+
+class TestOrdering:
+    def _character(self, name: str, mass: str) -> Character:
+        return Character(
+            name=name,
+            height="100",
+            mass=mass,
+            hair_color="n/a",
+            skin_color="n/a",
+            eye_color="n/a",
+            birth_year="unknown",
+            gender="n/a",
+            homeworld="",
+            url="",
+            films=[],
+        )
+
+    def test_parse_returns_none_without_field(self):
+        assert Ordering.parse(None) is None
+        assert Ordering.parse("-") is None
+        assert Ordering.parse("-Mass") == Ordering(field="mass", descending=True)
+
+    def test_parse_numeric_handles_separators_and_unknowns(self):
+        assert parse_numeric("1,358") == 1358.0
+        assert is_unknown(parse_numeric("unknown"))
+        assert is_unknown(parse_numeric("n/a"))
+        assert is_unknown(parse_numeric("12-15"))
+
+    def test_numeric_sort_puts_unknown_last_in_both_directions(self):
+        people = [
+            self._character("Yoda", "17"),
+            self._character("Jabba", "1,358"),
+            self._character("Ghost", "unknown"),
+            self._character("Luke", "77"),
+        ]
+        ascending = Ordering.parse("mass").sort(people)
+        descending = Ordering.parse("-mass").sort(people)
+
+        assert [c.name for c in ascending] == ["Yoda", "Luke", "Jabba", "Ghost"]
+        assert [c.name for c in descending] == ["Jabba", "Luke", "Yoda", "Ghost"]
+
+    def test_sorting_an_ordered_slice_is_stable(self):
+        people = [self._character(name, "10") for name in ["b", "a", "c"]]
+        ordering = Ordering.parse("-mass")
+
+        ordered = ordering.sort(people)
+
+        assert ordering.sort(ordered[:2]) == ordered[:2]
+
+    def test_unknown_field_keeps_original_order(self):
+        people = [self._character("b", "1"), self._character("a", "2")]
+
+        for field in ("nonexistent", "numeric_values"):
+            ordered = Ordering.parse(field).sort(people)
+
+            assert [c.name for c in ordered] == ["b", "a"]
+
+    def test_sort_columns_are_reused_across_orderings(self):
+        people = [self._character("b", "2"), self._character("a", "1")]
+        columns = SortColumns(people)
+
+        assert columns.argsort(Ordering("mass")) == [1, 0]
+        assert columns.argsort(Ordering("mass", descending=True)) == [0, 1]
+        assert columns.argsort(Ordering("name")) == [1, 0]
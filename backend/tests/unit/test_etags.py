@@ -0,0 +1,22 @@
+from starlette.datastructures import Headers
+
+from src.api.etags import entity_tag, etag_matches
+from src.api.frontend import is_not_modified
+from src.api.responses import RenderedBody
+
+
+def test_etag_matching_is_weak_and_accepts_lists() -> None:
+    assert etag_matches('"a", W/"b"', 'W/"b"')
+    assert etag_matches('"b"', 'W/"b"')
+    assert etag_matches("*", 'W/"b"')
+    assert not etag_matches('W/"a"', 'W/"b"')
+
+
+def test_api_pages_and_static_files_share_one_tag_scheme() -> None:
+    body = b'{"count": 0}'
+    rendered = RenderedBody.of(body)
+
+    assert rendered.etag == entity_tag(body, weak=True) == f"W/{entity_tag(body)}"
+    # A static file revalidates against the weakened tag a proxy may send back
+    assert is_not_modified(Headers({"if-none-match": rendered.etag}), entity_tag(body), 0)
+    assert not is_not_modified(Headers({"if-none-match": entity_tag(b"{}")}), entity_tag(body), 0)
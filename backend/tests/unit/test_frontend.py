@@ -0,0 +1,129 @@
+import gzip
+import os
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from starlette.datastructures import Headers
+
+from src.api.frontend import IndexPage, PrecompressedStaticFiles, accepted_encodings
+
+INDEX_HTML = "<html><head><script>window.__ENV__ = {};</script></head></html>"
+
+
+@pytest.fixture
+def index_path(tmp_path: Path) -> Path:
+    path = tmp_path / "index.html"
+    path.write_text(INDEX_HTML)
+    return path
+
+
+class TestIndexPage:
+    def test_injects_config_once(self, index_path: Path) -> None:
+        page = IndexPage(index_path, config={"ENVIRONMENT": "test"})
+
+        first = page.get()
+        index_path.write_text("changed")
+        assert first is not None
+        assert b'window.__ENV__ = {"ENVIRONMENT": "test"}' in first.body
+        assert page.get() is first
+
+    def test_watch_rerenders_on_change(self, index_path: Path) -> None:
+        page = IndexPage(index_path, config={}, watch=True)
+        first = page.get()
+        assert first is not None
+
+        index_path.write_text(INDEX_HTML + "<!-- v2 -->")
+        os.utime(index_path, (first.last_modified + 10, first.last_modified + 10))
+
+        second = page.get()
+        assert second is not None
+        assert b"v2" in second.body
+        assert second.etag != first.etag
+
+    def test_conditional_requests_return_304(self, index_path: Path) -> None:
+        page = IndexPage(index_path, config={})
+        response = page.response(Headers())
+        assert response is not None
+        assert response.status_code == 200
+
+        matched = page.response(Headers({"if-none-match": response.headers["etag"]}))
+        assert matched is not None
+        assert matched.status_code == 304
+        last_modified = response.headers["last-modified"]
+        revalidated = page.response(Headers({"if-modified-since": last_modified}))
+        assert revalidated is not None
+        assert revalidated.status_code == 304
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        assert IndexPage(tmp_path / "index.html", config={}).response(Headers()) is None
+
+
+class TestPrecompressedStaticFiles:
+    @pytest.fixture
+    def client(self, tmp_path: Path) -> TestClient:
+        (tmp_path / "app.js").write_text("console.log('a long line of javascript');\n" * 100)
+        (tmp_path / "tiny.css").write_text("a{}")
+
+        app = FastAPI()
+        app.mount("/assets", PrecompressedStaticFiles(directory=tmp_path), name="assets")
+        return TestClient(app)
+
+    def test_serves_gzip_variant(self, client: TestClient) -> None:
+        response = client.get("/assets/app.js", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert "immutable" in response.headers["cache-control"]
+        assert response.text.startswith("console.log")
+
+    def test_identity_without_accept_encoding(self, client: TestClient) -> None:
+        response = client.get("/assets/app.js", headers={"Accept-Encoding": "identity"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+        assert response.headers["vary"] == "Accept-Encoding"
+
+    def test_variant_etag_revalidates(self, client: TestClient) -> None:
+        headers = {"Accept-Encoding": "gzip"}
+        etag = client.get("/assets/app.js", headers=headers).headers["etag"]
+
+        response = client.get("/assets/app.js", headers={**headers, "If-None-Match": etag})
+        assert response.status_code == 304
+
+    def test_variant_is_revalidated_against_the_file_mtime(self, client: TestClient) -> None:
+        headers = {"Accept-Encoding": "gzip"}
+        last_modified = client.get("/assets/app.js", headers=headers).headers["last-modified"]
+
+        current = client.get(
+            "/assets/app.js", headers={**headers, "If-Modified-Since": last_modified}
+        )
+        outdated = client.get(
+            "/assets/app.js",
+            headers={**headers, "If-Modified-Since": "Thu, 01 Jan 1970 00:00:01 GMT"},
+        )
+
+        assert current.status_code == 304
+        assert outdated.status_code == 200
+        assert outdated.headers["content-encoding"] == "gzip"
+
+    def test_small_files_are_not_compressed(self, client: TestClient) -> None:
+        response = client.get("/assets/tiny.css", headers={"Accept-Encoding": "gzip"})
+
+        assert response.status_code == 200
+        assert "content-encoding" not in response.headers
+
+    def test_prebuilt_sibling_is_used(self, tmp_path: Path) -> None:
+        source = "body { color: red; }\n" * 200
+        (tmp_path / "site.css").write_text(source)
+        (tmp_path / "site.css.gz").write_bytes(gzip.compress(source.encode(), mtime=0))
+
+        static = PrecompressedStaticFiles(directory=tmp_path)
+        assert static.variants["site.css"]["gzip"].body == (tmp_path / "site.css.gz").read_bytes()
+
+
+def test_accepted_encodings_ignores_q0() -> None:
+    assert accepted_encodings("gzip;q=0, br") == {"br"}
+    assert accepted_encodings(None) == set()
@@ -0,0 +1,132 @@
+import httpx
+import pytest
+from fastapi import FastAPI
+
+from src.api.metrics import serve_metrics
+from src.api.middleware import metrics as middleware_module
+from src.api.middleware.metrics import MetricsMiddleware
+from src.infrastructure.metrics import CONTENT_TYPE, MetricsRegistry, registry
+
+
+class TestRegistry:
+    def test_counter_renders_labels(self) -> None:
+        registry = MetricsRegistry()
+        counter = registry.counter("rejections_total", "Rejected requests", ["route"])
+
+        counter.inc(("/api/v1/people",))
+        counter.inc(("/api/v1/people",))
+
+        assert registry.render() == (
+            "# HELP rejections_total Rejected requests\n"
+            "# TYPE rejections_total counter\n"
+            'rejections_total{route="/api/v1/people"} 2\n'
+        )
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+
+        for value in (0.05, 0.1, 0.5, 3.0):
+            histogram.observe(value)
+
+        lines = registry.render().splitlines()
+        assert 'latency_seconds_bucket{le="0.1"} 2' in lines
+        assert 'latency_seconds_bucket{le="1"} 3' in lines
+        assert 'latency_seconds_bucket{le="+Inf"} 4' in lines
+        assert "latency_seconds_sum 3.65" in lines
+        assert "latency_seconds_count 4" in lines
+
+    def test_gauge_reads_collect_at_render(self) -> None:
+        registry = MetricsRegistry()
+        size = 0
+        registry.gauge("cache_size", "Entries", ["cache"], collect=lambda: [(("l1",), size)])
+
+        size = 7
+
+        assert 'cache_size{cache="l1"} 7' in registry.render()
+
+    def test_counter_can_read_a_running_total_at_render(self) -> None:
+        registry = MetricsRegistry()
+        hits = {"l1": 3}
+        registry.counter(
+            "cache_hits_total", "Hits", ["cache"], collect=lambda: [(("l1",), hits["l1"])]
+        )
+
+        hits["l1"] = 5
+
+        text = registry.render()
+        assert "# TYPE cache_hits_total counter" in text
+        assert 'cache_hits_total{cache="l1"} 5' in text
+
+    def test_label_values_are_escaped(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("errors_total", "Errors", ["reason"]).inc(('bad "quote"\n',))
+
+        assert 'errors_total{reason="bad \\"quote\\"\\n"} 1' in registry.render()
+
+    def test_duplicate_registration_is_rejected(self) -> None:
+        registry = MetricsRegistry()
+        registry.counter("requests_total", "Requests", ["route"])
+
+        with pytest.raises(ValueError):
+            registry.counter("requests_total", "Requests", ["route"])
+        with pytest.raises(ValueError):
+            registry.gauge("requests_total", "Requests")
+
+
+@pytest.fixture
+def isolated_registry(monkeypatch) -> MetricsRegistry:
+    registry = MetricsRegistry()
+    monkeypatch.setattr(
+        middleware_module,
+        "REQUEST_DURATION",
+        registry.histogram("http_request_duration_seconds", "", ["method", "route", "status"]),
+    )
+    monkeypatch.setattr(
+        middleware_module,
+        "REQUESTS_IN_FLIGHT",
+        registry.gauge("http_requests_in_flight", ""),
+    )
+    return registry
+
+
+async def test_middleware_labels_by_route_template(isolated_registry) -> None:
+    app = FastAPI()
+    in_flight: list[float] = []
+
+    @app.get("/items/{item_id}")
+    async def item(item_id: int) -> dict[str, int]:
+        in_flight.append(middleware_module.REQUESTS_IN_FLIGHT.values[()])
+        return {"id": item_id}
+
+    app.add_middleware(MetricsMiddleware)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        await client.get("/items/1")
+        await client.get("/items/2")
+        await client.get("/missing")
+        await client.get("/metrics")
+
+    series = middleware_module.REQUEST_DURATION.series
+    assert set(series) == {
+        ("GET", "/items/{item_id}", "200"),
+        ("GET", "unmatched", "404"),
+    }
+    assert sum(series[("GET", "/items/{item_id}", "200")][:-1]) == 2
+    assert in_flight == [1, 1]
+    assert middleware_module.REQUESTS_IN_FLIGHT.values[()] == 0
+
+
+async def test_metrics_can_be_served_on_their_own_port() -> None:
+    server = await serve_metrics("127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    try:
+        async with httpx.AsyncClient() as client:
+            response = await client.get(f"http://127.0.0.1:{port}/metrics")
+    finally:
+        server.close()
+        await server.wait_closed()
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == CONTENT_TYPE
+    assert response.text == registry.render()
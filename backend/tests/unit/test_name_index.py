@@ -0,0 +1,46 @@
+import pytest
+
+from src.application.use_cases.suggest_names import SuggestionsUnavailableError, SuggestNames
+from src.domain.value_objects.suggestion import Suggestion
+from src.infrastructure.name_index import PrefixIndex
+
+SUGGESTIONS = [
+    Suggestion("Luke Skywalker", "people", "https://swapi.dev/api/people/1/"),
+    Suggestion("Anakin Skywalker", "people", "https://swapi.dev/api/people/11/"),
+    Suggestion("Sly Moore", "people", "https://swapi.dev/api/people/82/"),
+    Suggestion("Skakoan", "people", "https://swapi.dev/api/people/83/"),
+    Suggestion("Sky", "planets", "https://swapi.dev/api/planets/99/"),
+    Suggestion("Padmé Amidala", "people", "https://swapi.dev/api/people/35/"),
+    Suggestion("X-wing", "starships", "https://swapi.dev/api/starships/12/"),
+]
+
+
+def _names(text: str, limit: int = 10) -> list[str]:
+    return [suggestion.name for suggestion in PrefixIndex(SUGGESTIONS).suggest(text, limit)]
+
+
+def test_exact_then_name_prefix_then_word_prefix() -> None:
+    assert _names("sky") == ["Sky", "Luke Skywalker", "Anakin Skywalker"]
+
+
+def test_shorter_names_first_within_a_rank() -> None:
+    assert _names("s") == ["Sky", "Skakoan", "Sly Moore", "Luke Skywalker", "Anakin Skywalker"]
+
+
+def test_limit_keeps_the_best_matches() -> None:
+    assert _names("s", limit=2) == ["Sky", "Skakoan"]
+
+
+@pytest.mark.parametrize(("text", "expected"), [("PADME", "Padmé Amidala"), ("wing", "X-wing")])
+def test_case_accents_and_hyphenated_words(text: str, expected: str) -> None:
+    assert _names(text) == [expected]
+
+
+def test_no_match_and_blank_text() -> None:
+    assert _names("yoda") == []
+    assert _names("  ") == []
+
+
+def test_use_case_needs_a_local_dataset(make_swapi) -> None:
+    with pytest.raises(SuggestionsUnavailableError):
+        SuggestNames(make_swapi()).execute("sky", 10)
@@ -0,0 +1,113 @@
+import re
+import time
+from typing import Any
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from limits.storage import MemoryStorage
+from slowapi import _rate_limit_exceeded_handler
+from slowapi.errors import RateLimitExceeded
+
+from src.api.middleware.rate_limit import create_limiter
+from src.api.middleware.timing import ServerTimingMiddleware
+
+
+class FlakyStorage(MemoryStorage):
+    """In-process stand-in for a shared store that can be taken down"""
+
+    STORAGE_SCHEME = ["flaky"]
+    down = False
+
+    def _fail_if_down(self) -> None:
+        if FlakyStorage.down:
+            raise ConnectionError("rate limit store unavailable")
+
+    def acquire_sliding_window_entry(self, *args: Any, **kwargs: Any) -> bool:
+        self._fail_if_down()
+        return super().acquire_sliding_window_entry(*args, **kwargs)
+
+    def get_sliding_window(self, *args: Any, **kwargs: Any) -> tuple[int, float, int, float]:
+        self._fail_if_down()
+        return super().get_sliding_window(*args, **kwargs)
+
+    def check(self) -> bool:
+        return not FlakyStorage.down
+
+
+def _app(storage_uri: str, limit: str, relaxed_limit: str = "10/minute") -> TestClient:
+    limiter = create_limiter(storage_uri=storage_uri)
+    app = FastAPI()
+    app.state.limiter = limiter
+    app.add_exception_handler(RateLimitExceeded, _rate_limit_exceeded_handler)
+    app.add_middleware(ServerTimingMiddleware, emit_header=True)
+
+    @app.get("/limited")
+    @limiter.limit(limit)
+    async def limited(request: Request) -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/relaxed")
+    @limiter.limit(relaxed_limit)
+    async def relaxed(request: Request) -> dict[str, bool]:
+        return {"ok": True}
+
+    @app.get("/slow")
+    @limiter.limit(relaxed_limit)
+    async def slow(request: Request) -> dict[str, bool]:
+        time.sleep(0.05)
+        return {"ok": True}
+
+    return TestClient(app)
+
+
+class TestRateLimiter:
+    def test_sliding_window_counter_enforces_the_limit(self):
+        client = _app("memory://", "2/minute")
+
+        statuses = [client.get("/limited").status_code for _ in range(3)]
+
+        assert statuses == [200, 200, 429]
+
+    def test_unreachable_store_degrades_to_local_limiting(self):
+        FlakyStorage.down = True
+        try:
+            client = _app("flaky://", "2/minute")
+
+            statuses = [client.get("/limited").status_code for _ in range(3)]
+        finally:
+            FlakyStorage.down = False
+
+        assert statuses == [200, 200, 429]
+
+    def test_routes_keep_their_own_limits_while_the_store_is_down(self):
+        FlakyStorage.down = True
+        try:
+            client = _app("flaky://", "1/minute", relaxed_limit="3/minute")
+
+            limited = [client.get("/limited").status_code for _ in range(2)]
+            relaxed = [client.get("/relaxed").status_code for _ in range(4)]
+        finally:
+            FlakyStorage.down = False
+
+        assert limited == [200, 429]
+        assert relaxed == [200, 200, 200, 429]
+
+    def test_unsupported_store_falls_back_to_memory(self):
+        client = _app("unknown-scheme://host", "1/minute")
+
+        statuses = [client.get("/limited").status_code for _ in range(2)]
+
+        assert statuses == [200, 429]
+
+    def test_limit_check_is_timed_up_to_the_endpoint_body(self):
+        client = _app("memory://", "1/minute")
+
+        served = client.get("/slow")
+        client.get("/limited")
+        rejected = client.get("/limited")
+
+        limiter_ms = re.search(r"limiter;dur=([\d.]+)", served.headers["Server-Timing"])
+        assert limiter_ms is not None
+        assert float(limiter_ms[1]) < 50
+        assert rejected.status_code == 429
+        assert "limiter;dur=" in rejected.headers["Server-Timing"]
@@ -0,0 +1,65 @@
+from typing import Any
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.core.config import settings
+from src.main import app
+
+HEADERS = {"X-API-Key": settings.API_KEY}
+
+
+@pytest.fixture
+def swapi(make_swapi, make_person, serve_swapi):
+    """People 1 to 5, listed two to a page or fetched one at a time"""
+    people = [make_person(i) for i in range(1, 6)]
+    return serve_swapi(make_swapi({"people": people}, page_size=2))
+
+
+def _get(path: str) -> Any:
+    return TestClient(app).get(path, headers=HEADERS)
+
+
+def test_detail_route_serves_listed_entities_without_fetching(swapi):
+    _get("/api/v1/people")
+    response = _get("/api/v1/people/2")
+
+    assert response.status_code == 200
+    assert response.json()["name"] == "Person 2"
+    assert swapi.fetched == []
+
+
+def test_detail_route_is_404_for_unknown_ids(swapi):
+    assert _get("/api/v1/people/9").status_code == 404
+    assert _get("/api/v1/planets/1").status_code == 404
+    assert _get("/api/v1/people/0").status_code == 422
+
+
+def test_unchanged_records_are_revalidated_with_304(swapi):
+    first = _get("/api/v1/people/1")
+    second = TestClient(app).get(
+        "/api/v1/people/1", headers={**HEADERS, "If-None-Match": first.headers["etag"]}
+    )
+
+    assert second.status_code == 304
+    assert second.headers["etag"] == first.headers["etag"]
+    assert "max-age=" in second.headers["cache-control"]
+
+
+def test_ids_lookup_fetches_only_the_misses(swapi):
+    _get("/api/v1/people")
+    response = _get("/api/v1/people?ids=4,1,9,4,3")
+
+    body = response.json()
+    assert [person["name"] for person in body["results"]] == ["Person 4", "Person 1", "Person 3"]
+    assert body["missing"] == [9]
+    assert sorted(swapi.fetched) == [f"https://swapi.dev/api/people/{i}/" for i in (3, 4, 9)]
+
+
+def test_ids_lookup_rejects_bad_input(swapi):
+    too_many = ",".join(str(i) for i in range(1, settings.IDS_MAX_COUNT + 2))
+
+    assert _get("/api/v1/people?ids=1,x").status_code == 400
+    assert _get("/api/v1/films?ids=").status_code == 400
+    assert _get(f"/api/v1/starships?ids={too_many}").status_code == 400
+    assert swapi.fetched == []
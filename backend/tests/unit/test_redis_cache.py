@@ -0,0 +1,158 @@
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from fnmatch import fnmatch
+from typing import Any
+
+import pytest
+
+from src.infrastructure.cache import (
+    CacheEntry,
+    cache_stats,
+    cached,
+    clear_cache,
+    configure_shared_cache,
+    flush_shared_cache,
+)
+from src.infrastructure.redis_cache import RedisCacheBackend
+
+
+class FakeRedis:
+    """In-process stand-in for the subset of redis.asyncio used by the backend"""
+
+    def __init__(self) -> None:
+        self.data: dict[str, tuple[bytes, float]] = {}
+        self.last_px: int | None = None
+        self.fail = False
+
+    def _check(self) -> None:
+        if self.fail:
+            raise ConnectionError("redis unavailable")
+
+    async def get(self, name: str) -> bytes | None:
+        self._check()
+        value = self.data.get(name)
+        if value is None or value[1] < time.monotonic():
+            return None
+        return value[0]
+
+    async def set(self, name: str, value: bytes, px: int | None = None) -> bool:
+        self._check()
+        self.last_px = px
+        expires = time.monotonic() + (px / 1000 if px else 1e9)
+        self.data[name] = (value, expires)
+        return True
+
+    async def delete(self, *names: str) -> int:
+        return sum(self.data.pop(name, None) is not None for name in names)
+
+    async def scan_iter(self, match: str | None = None) -> AsyncIterator[str]:
+        for key in list(self.data):
+            if match is None or fnmatch(key, match):
+                yield key
+
+    async def aclose(self) -> None:
+        pass
+
+
+@pytest.fixture
+def redis() -> FakeRedis:
+    fake = FakeRedis()
+    configure_shared_cache(RedisCacheBackend(fake, prefix="test:", max_ttl=600))
+    clear_cache()
+    yield fake
+    configure_shared_cache(None)
+    clear_cache()
+
+
+def _planet() -> dict[str, Any]:
+    return {"name": "Tatooine", "url": "https://swapi.dev/api/planets/1/", "residents": []}
+
+
+@pytest.mark.asyncio
+class TestSharedCacheTier:
+    async def test_l2_hit_is_served_after_l1_is_lost(self, redis: FakeRedis):
+        call_count = 0
+
+        @cached(ttl=60)
+        async def fetch(x: int) -> dict[str, Any]:
+            nonlocal call_count
+            call_count += 1
+            return {"count": 1, "results": [_planet()]}
+
+        first = await fetch(1)
+        await flush_shared_cache()
+        clear_cache()  # another instance: empty L1, same Redis
+        second = await fetch(1)
+
+        assert call_count == 1
+        assert second == first
+        tiers = cache_stats()["tiers"]
+        assert tiers["l1"]["misses"] == 1
+        assert tiers["l2"]["hits"] == 1
+
+    async def test_backend_ttl_caps_redis_expiry(self, redis: FakeRedis):
+        @cached(ttl=60, stale_if_error_ttl=86400)
+        async def fetch(x: int) -> int:
+            return x
+
+        await fetch(1)
+        await flush_shared_cache()
+
+        assert redis.last_px is not None
+        assert 590_000 <= redis.last_px <= 600_000
+
+    async def test_unavailable_redis_degrades_to_l1(self, redis: FakeRedis):
+        redis.fail = True
+
+        @cached(ttl=60)
+        async def fetch(x: int) -> int:
+            return x
+
+        assert await fetch(2) == 2
+        assert await fetch(2) == 2
+        await flush_shared_cache()
+        assert cache_stats()["tiers"]["l2"]["errors"] == 2
+
+    async def test_callers_do_not_wait_for_the_shared_write(self, redis: FakeRedis):
+        release = asyncio.Event()
+        write = redis.set
+
+        async def slow_set(name: str, value: bytes, px: int | None = None) -> bool:
+            await release.wait()
+            return await write(name, value, px=px)
+
+        redis.set = slow_set  # type: ignore[method-assign]
+
+        @cached(ttl=60)
+        async def fetch(x: int) -> int:
+            return x
+
+        assert await asyncio.wait_for(fetch(3), timeout=1) == 3
+        assert not redis.data
+        release.set()
+        await flush_shared_cache()
+        assert len(redis.data) == 1
+
+    async def test_deadlines_survive_the_round_trip(self, redis: FakeRedis):
+        backend = RedisCacheBackend(redis, prefix="raw:")
+        entry = CacheEntry("value", 30, stale_ttl=60)
+
+        await backend.set("key", entry)
+        restored = await backend.get("key")
+
+        assert restored is not None
+        assert restored.expires_at == pytest.approx(entry.expires_at, abs=0.05)
+        assert restored.stale_until == pytest.approx(entry.stale_until, abs=0.05)
+        await backend.clear()
+        assert await backend.get("key") is None
+        await asyncio.sleep(0)
+
+    async def test_malformed_entries_are_misses(self, redis: FakeRedis):
+        backend = RedisCacheBackend(redis, prefix="raw:")
+        await redis.set("raw:truncated", b'{"value": 1')
+        await redis.set("raw:no-deadlines", b'{"value": 1}')
+
+        assert await backend.get("truncated") is None
+        assert await backend.get("no-deadlines") is None
+        assert backend.stats()["errors"] == 2
@@ -0,0 +1,123 @@
+import json
+from types import MappingProxyType
+
+import pytest
+from starlette.requests import Request
+
+from src.api import responses
+from src.api.responses import JSONBytesResponse, ResponseCache, dumps
+from src.domain.entities.planet import Planet
+
+TATOOINE = {
+    "name": "Tatooine",
+    "rotation_period": "23",
+    "orbital_period": "304",
+    "diameter": "10465",
+    "climate": "arid",
+    "gravity": "1 standard",
+    "terrain": "desert",
+    "surface_water": "1",
+    "population": "200000",
+    "residents": [],
+    "films": [],
+    "url": "https://swapi.dev/api/planets/1/",
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def encoder(request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch) -> str:
+    if request.param == "json":
+        monkeypatch.setattr(responses, "orjson", None)
+    else:
+        pytest.importorskip("orjson")
+    return str(request.param)
+
+
+def test_dumps_writes_entity_fields(encoder: str) -> None:
+    planet = Planet.from_swapi({**TATOOINE, "name": "Tatooiné"})
+
+    body = dumps({"count": 1, "results": (planet,), "missing": MappingProxyType({"ids": [9]})})
+
+    decoded = json.loads(body)
+    assert decoded["results"][0]["name"] == "Tatooiné"
+    assert "numeric_values" not in decoded["results"][0]
+    assert decoded["missing"] == {"ids": [9]}
+    assert b" " not in body.replace(b"1 standard", b"")
+    assert "Tatooiné".encode() in body
+
+
+def test_encoders_write_the_same_bytes() -> None:
+    pytest.importorskip("orjson")
+    content = {"count": 1, "results": [Planet.from_swapi(TATOOINE)], "next": None}
+
+    fast = dumps(content)
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(responses, "orjson", None)
+        assert dumps(content) == fast
+
+
+def test_bytes_are_sent_unchanged() -> None:
+    assert JSONBytesResponse(b'{"count":0}').body == b'{"count":0}'
+
+
+class TestResponseCache:
+    async def test_hit_skips_the_use_case(self) -> None:
+        cache = ResponseCache(max_size=10, ttl=60)
+        calls = 0
+
+        async def produce() -> dict[str, int]:
+            nonlocal calls
+            calls += 1
+            return {"count": calls}
+
+        first = await cache.get_or_render("planets:1", produce)
+        second = await cache.get_or_render("planets:1", produce)
+
+        assert first.body == second.body == b'{"count":1}'
+        assert calls == 1
+
+    async def test_zero_ttl_disables_caching(self) -> None:
+        cache = ResponseCache(max_size=10, ttl=0)
+
+        async def produce() -> dict[str, int]:
+            return {"count": 0}
+
+        await cache.get_or_render("planets:1", produce)
+
+        assert len(cache._cache) == 0
+
+    async def test_respond_sets_etag_and_remaining_max_age(self) -> None:
+        cache = ResponseCache(max_size=10, ttl=60)
+
+        async def produce() -> dict[str, int]:
+            return {"count": 1}
+
+        response = await cache.respond(_request(), "planets:1", produce)
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.headers["cache-control"] == (
+            "private, max-age=60, stale-while-revalidate=60"
+        )
+
+    async def test_matching_if_none_match_is_304_without_rendering(self) -> None:
+        cache = ResponseCache(max_size=10, ttl=60)
+        calls = 0
+
+        async def produce() -> dict[str, int]:
+            nonlocal calls
+            calls += 1
+            return {"count": 1}
+
+        etag = (await cache.respond(_request(), "planets:1", produce)).headers["etag"]
+        response = await cache.respond(_request(("if-none-match", etag)), "planets:1", produce)
+
+        assert response.status_code == 304
+        assert response.body == b""
+        assert response.headers["etag"] == etag
+        assert calls == 1
+
+
+def _request(*headers: tuple[str, str]) -> Request:
+    raw = [(name.encode(), value.encode()) for name, value in headers]
+    return Request({"type": "http", "method": "GET", "headers": raw})
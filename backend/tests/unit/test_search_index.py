@@ -0,0 +1,47 @@
+import pytest
+
+from src.domain.value_objects.filters import SearchFilters
+from src.infrastructure.search_index import SearchIndex, fold
+from src.infrastructure.swapi_mirror import RESOURCES, MirrorTable
+
+NAMES = ["Luke Skywalker", "Anakin Skywalker", "Padmé Amidala", "Wal Alker", "R2-D2"]
+
+
+def test_fold_ignores_case_and_accents() -> None:
+    assert fold("PADMÉ Amidala") == fold("padme amidala") == "padme amidala"
+
+
+@pytest.mark.parametrize(
+    ("term", "expected"),
+    [
+        ("sky", {0, 1}),
+        ("SKYWALKER", {0, 1}),
+        ("padme", {2}),
+        ("Padmé", {2}),
+        ("a", {0, 1, 2, 3}),
+        ("r2-d2", {4}),
+        ("yoda", set()),
+        ("", {0, 1, 2, 3, 4}),
+    ],
+)
+def test_search_matches_substrings(term: str, expected: set[int]) -> None:
+    assert SearchIndex(NAMES).search(term) == expected
+
+
+def test_trigrams_out_of_order_are_not_a_match() -> None:
+    # "Wal Alker" holds every trigram of "walker" but not the word itself
+    assert SearchIndex(NAMES).search("walker") == {0, 1}
+
+
+def test_table_search_keeps_ordering_and_pagination(make_person) -> None:
+    records = [make_person(i, name=f"Clone {i:02d}", height=str(150 + i)) for i in range(15)]
+    records.append(make_person(15, name="Padmé Amidala", height="185"))
+    table = MirrorTable(RESOURCES[0], records)
+
+    page = table.query(SearchFilters(search="e", ordering="-height", page=2))
+
+    assert page["count"] == 16
+    assert [record["name"] for record in page["results"]] == [
+        f"Clone {i:02d}" for i in range(5, -1, -1)
+    ]
+    assert table.query(SearchFilters(search="padme"))["results"][0]["name"] == "Padmé Amidala"
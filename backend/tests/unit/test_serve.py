@@ -0,0 +1,170 @@
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from src import serve
+from src.api.middleware.rate_limit import create_limiter
+from src.core.config import settings
+from src.infrastructure.swapi_snapshot import SnapshotError
+
+
+@pytest.mark.parametrize(("cpu_max", "quota_cpus"), [("200000 100000", 2), ("50000 100000", 1)])
+def test_cpu_quota_caps_the_worker_count(tmp_path, cpu_max: str, quota_cpus: int) -> None:
+    path = tmp_path / "cpu.max"
+    path.write_text(cpu_max)
+
+    assert serve.available_cpus(path) == min(quota_cpus, len(os.sched_getaffinity(0)))
+
+
+def test_without_a_quota_every_allowed_cpu_is_used(tmp_path) -> None:
+    unlimited = tmp_path / "cpu.max"
+    unlimited.write_text("max 100000")
+
+    assert serve.available_cpus(unlimited) == len(os.sched_getaffinity(0))
+    assert serve.available_cpus(tmp_path / "missing") == len(os.sched_getaffinity(0))
+
+
+def test_server_config_comes_from_settings(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "PORT", 9000)
+    monkeypatch.setattr(settings, "SERVER_LIMIT_CONCURRENCY", 0)
+
+    config = serve.server_config()
+
+    assert config.port == 9000
+    assert config.backlog == settings.SERVER_BACKLOG
+    assert config.limit_concurrency is None
+    assert config.loop == ("uvloop" if serve._installed("uvloop") else "asyncio")
+
+
+def test_several_workers_need_a_shared_rate_limit_store(monkeypatch) -> None:
+    in_memory = create_limiter(storage_uri="memory://")
+    shared = SimpleNamespace(limiter=SimpleNamespace(storage=object()))
+    monkeypatch.setattr(settings, "SERVER_WORKERS", 0)
+    assert serve.worker_count(cpus=4, limiter=in_memory) == 1
+    assert serve.worker_count(cpus=4, limiter=shared) == 4
+
+    monkeypatch.setattr(settings, "SERVER_WORKERS", 4)
+    with pytest.raises(SystemExit, match="RATE_LIMIT_STORAGE_URI"):
+        serve.worker_count(cpus=4, limiter=in_memory)
+    assert serve.worker_count(cpus=2, limiter=shared) == 4
+
+
+def test_a_store_that_fell_back_to_memory_runs_one_worker(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "SERVER_WORKERS", 0)
+    fallback = create_limiter(storage_uri="unknown-scheme://host:6379/1")
+
+    assert serve.worker_count(cpus=4, limiter=fallback) == 1
+
+
+def test_warm_data_is_only_shared_on_request(monkeypatch) -> None:
+    async def crawl(path: str) -> dict[str, int]:
+        raise AssertionError("crawled without SERVER_SHARE_WARM_DATA")
+
+    monkeypatch.setattr(serve, "crawl", crawl)
+    monkeypatch.setattr(settings, "SWAPI_SNAPSHOT_PATH", "")
+
+    assert settings.SERVER_SHARE_WARM_DATA is False
+    assert serve.share_warm_data() is None
+    assert settings.SWAPI_SNAPSHOT_PATH == ""
+
+
+def test_configured_snapshot_is_not_crawled_again(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "SERVER_SHARE_WARM_DATA", True)
+    monkeypatch.setattr(settings, "SWAPI_SNAPSHOT_PATH", "data/swapi-snapshot.bin")
+
+    assert serve.share_warm_data() is None
+
+
+def test_failed_crawl_leaves_workers_to_warm_up(monkeypatch) -> None:
+    async def crawl(path: str) -> dict[str, int]:
+        raise SnapshotError("SWAPI crawl incomplete")
+
+    monkeypatch.setattr(serve, "crawl", crawl)
+    monkeypatch.setattr(settings, "SERVER_SHARE_WARM_DATA", True)
+    monkeypatch.setattr(settings, "SWAPI_SNAPSHOT_PATH", "")
+    monkeypatch.setattr(settings, "SWAPI_MIRROR_ENABLED", True)
+
+    assert serve.share_warm_data() is None
+    assert settings.SWAPI_SNAPSHOT_PATH == ""
+
+
+def test_crawled_snapshot_is_served_by_the_workers(monkeypatch) -> None:
+    async def crawl(path: str) -> dict[str, int]:
+        return {"people": 82}
+
+    monkeypatch.setattr(serve, "crawl", crawl)
+    monkeypatch.setattr(settings, "SERVER_SHARE_WARM_DATA", True)
+    monkeypatch.setattr(settings, "SWAPI_SNAPSHOT_PATH", "")
+    monkeypatch.setattr(settings, "SWAPI_MIRROR_ENABLED", True)
+
+    path = serve.share_warm_data()
+
+    assert path is not None
+    assert settings.SWAPI_SNAPSHOT_PATH == str(path)
+
+
+def _supervisor(monkeypatch, **limits) -> tuple[serve.Supervisor, list[float], list[int]]:
+    """Two workers exiting with status 1 as soon as they are waited on
+
+    Also returns the restart delays slept through and the pids sent SIGTERM.
+    """
+    supervisor = serve.Supervisor(None, None, 2, **limits)  # type: ignore[arg-type]
+    pids = iter(range(100, 200))
+    slept: list[float] = []
+    killed: list[int] = []
+    monkeypatch.setattr(supervisor, "spawn", lambda slot: next(pids))
+    monkeypatch.setattr(serve.os, "wait", lambda: (min(supervisor.pids), 1 << 8))
+    monkeypatch.setattr(serve.os, "kill", lambda pid, signum: killed.append(pid))
+    monkeypatch.setattr(serve.signal, "signal", lambda signum, handler: None)
+    monkeypatch.setattr(serve.time, "sleep", slept.append)
+    return supervisor, slept, killed
+
+
+def test_restarts_back_off_up_to_the_cap(monkeypatch) -> None:
+    supervisor, _, _ = _supervisor(monkeypatch, restart_limit=10, restart_window=60, max_backoff=4)
+
+    assert [supervisor.backoff() for _ in range(5)] == [1, 2, 4, 4, 4]
+
+
+def test_old_exits_no_longer_slow_restarts(monkeypatch) -> None:
+    supervisor, _, _ = _supervisor(monkeypatch, restart_limit=10, restart_window=60, max_backoff=30)
+    now = [1000.0]
+    monkeypatch.setattr(serve.time, "monotonic", lambda: now[0])
+
+    supervisor.backoff()
+    supervisor.backoff()
+    now[0] += 61
+
+    assert supervisor.backoff() == 1
+
+
+def test_crash_loop_stops_the_server_with_status_1(monkeypatch) -> None:
+    supervisor, slept, killed = _supervisor(
+        monkeypatch, restart_limit=3, restart_window=60, max_backoff=30
+    )
+
+    assert supervisor.run() == 1
+    assert slept == [1, 2, 4]
+    # Workers 100 to 103 crashed; the survivor is stopped rather than replaced
+    assert killed == [104]
+    assert not supervisor.pids
+
+
+def test_replacements_keep_the_slot_and_its_metrics_port(monkeypatch) -> None:
+    monkeypatch.setattr(settings, "METRICS_ENABLED", True)
+    monkeypatch.setattr(settings, "METRICS_PORT", 0)
+    supervisor, _, _ = _supervisor(monkeypatch, restart_limit=1, restart_window=60, max_backoff=1)
+    slots: list[int] = []
+    pids = iter(range(100, 200))
+
+    def spawn(slot: int) -> int:
+        slots.append(slot)
+        return next(pids)
+
+    monkeypatch.setattr(supervisor, "spawn", spawn)
+
+    assert supervisor.run() == 1
+    assert supervisor.metrics_port == serve.WORKER_METRICS_PORT
+    # Worker 100 in slot 0 exited and was replaced in the same slot
+    assert slots == [0, 1, 0]
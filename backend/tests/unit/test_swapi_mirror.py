@@ -0,0 +1,131 @@
+import pytest
+
+from src.application.ports.swapi_client import RecordNotFoundError
+from src.application.use_cases.get_characters import GetCharacters
+from src.domain.value_objects.filters import SearchFilters
+from src.domain.value_objects.ordering import Ordering
+from src.infrastructure.swapi_mirror import SwapiMirror
+
+
+@pytest.fixture
+def upstream(make_swapi, people):
+    starship = {"name": "Millennium Falcon", "url": "https://swapi.dev/api/starships/9/"}
+    return make_swapi(
+        {"people": people, "starships": [starship]},
+        failures={"starships": RuntimeError("SWAPI unavailable")},
+    )
+
+
+@pytest.mark.asyncio
+class TestSwapiMirror:
+    async def test_load_pulls_every_page(self, upstream):
+        mirror = SwapiMirror(upstream)
+
+        await mirror.load()
+
+        people_pages = sorted(f.page for name, f in upstream.calls if name == "people")
+        assert people_pages == [1, 2, 3]
+        assert mirror.stats()["records"]["people"] == 25
+        assert not mirror.is_ready  # starships failed to load
+
+    async def test_reload_reports_only_changed_records(self, upstream, make_person):
+        mirror = SwapiMirror(upstream)
+
+        assert await mirror.load()
+        table = mirror.tables["people"]
+        assert not await mirror.load()
+        assert mirror.tables["people"] is table
+
+        upstream.records["people"][0] = make_person(1, name="Renamed")
+        assert await mirror.load()
+        assert mirror.tables["people"].records[0]["name"] == "Renamed"
+
+    async def test_ordering_is_global_across_pages(self, upstream):
+        mirror = SwapiMirror(upstream)
+        await mirror.load()
+
+        page = await mirror.get_characters(SearchFilters(page=1, ordering="-mass"))
+
+        assert page["count"] == 25
+        assert page["results"][0]["name"] == "Person 25"
+        assert [r["name"] for r in page["results"]][-1] == "Person 16"
+
+    async def test_unknown_values_sort_last_on_the_last_page(self, upstream):
+        mirror = SwapiMirror(upstream)
+        await mirror.load()
+
+        page = await mirror.get_characters(SearchFilters(page=3, ordering="height"))
+
+        assert [r["height"] for r in page["results"]][-3:] == ["unknown"] * 3
+
+    async def test_search_is_local_and_case_insensitive(self, upstream):
+        mirror = SwapiMirror(upstream)
+        await mirror.load()
+        calls = len(upstream.calls)
+
+        page = await mirror.get_characters(SearchFilters(search="person 1"))
+
+        assert page["count"] == 10
+        assert len(upstream.calls) == calls
+
+    async def test_unloaded_resource_falls_back_to_upstream(self, upstream):
+        mirror = SwapiMirror(upstream)
+
+        page = await mirror.get_characters(SearchFilters(page=2))
+
+        assert page["results"][0]["name"] == "Person 11"
+
+    async def test_use_case_keeps_mirror_order(self, upstream):
+        mirror = SwapiMirror(upstream)
+        await mirror.load()
+
+        result = await GetCharacters(mirror).execute(SearchFilters(page=2, ordering="-mass"))
+
+        assert [c.name for c in result["results"]][:2] == ["Person 15", "Person 14"]
+
+    async def test_use_case_sorts_only_pages_the_mirror_did_not_order(self, upstream, monkeypatch):
+        sorted_pages: list[Ordering] = []
+        sort = Ordering.sort
+
+        def counting_sort(ordering, items):
+            sorted_pages.append(ordering)
+            return sort(ordering, items)
+
+        monkeypatch.setattr(Ordering, "sort", counting_sort)
+        mirror = SwapiMirror(upstream)
+
+        await GetCharacters(mirror).execute(SearchFilters(ordering="-mass"))
+        await mirror.load()
+        await GetCharacters(mirror).execute(SearchFilters(page=2, ordering="-mass"))
+
+        assert mirror.orders_globally("people")
+        assert not mirror.orders_globally("starships")
+        assert len(sorted_pages) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_resource_is_answered_from_the_mirror(upstream):
+    mirror = SwapiMirror(upstream)
+    await mirror.load()
+
+    person = await mirror.get_resource("https://swapi.dev/api/people/3/")
+    starship = await mirror.get_resource("https://swapi.dev/api/starships/9/")
+
+    assert person["name"] == "Person 03"
+    assert starship["name"] == "Millennium Falcon"
+    assert upstream.fetched == ["https://swapi.dev/api/starships/9/"]
+
+
+@pytest.mark.asyncio
+async def test_get_record_is_answered_from_the_loaded_tables(upstream):
+    mirror = SwapiMirror(upstream)
+    await mirror.load()
+
+    person = await mirror.get_record("people", 3)
+    starship = await mirror.get_record("starships", 9)
+
+    assert person["name"] == "Person 03"
+    assert starship["name"] == "Millennium Falcon"
+    assert upstream.fetched == ["https://swapi.dev/api/starships/9/"]
+    with pytest.raises(RecordNotFoundError):
+        await mirror.get_record("people", 999)
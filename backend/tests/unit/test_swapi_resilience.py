@@ -0,0 +1,262 @@
+import asyncio
+import logging
+from collections.abc import AsyncIterator
+
+import httpx
+import pytest
+
+from src.core.config import settings
+from src.domain.value_objects.filters import SearchFilters
+from src.infrastructure import cache as cache_module
+from src.infrastructure.cache import clear_cache
+from src.infrastructure.circuit_breaker import CircuitBreaker, CircuitOpenError
+from src.infrastructure.swapi_http_client import SwapiHttpClient
+
+BODY = b'{"count": 0, "results": []}'
+
+
+class StandInSwapi:
+    """Local HTTP server standing in for SWAPI, with scripted latency and errors
+
+    Each request takes the next ``(delay, status)`` from ``script``; once the
+    script runs out every request gets a fast 200.
+    """
+
+    def __init__(self) -> None:
+        self.script: list[tuple[float, int]] = []
+        self.requests = 0
+        self.server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        assert self.server is not None
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/api"
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            await reader.readuntil(b"\r\n\r\n")
+            self.requests += 1
+            delay, status = self.script.pop(0) if self.script else (0.0, 200)
+            await asyncio.sleep(delay)
+            writer.write(
+                f"HTTP/1.1 {status} Scripted\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(BODY)}\r\n"
+                "Connection: close\r\n\r\n".encode()
+                + BODY
+            )
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.fixture
+async def swapi() -> AsyncIterator[StandInSwapi]:
+    stand_in = StandInSwapi()
+    stand_in.server = await asyncio.start_server(stand_in.handle, "127.0.0.1", 0)
+    async with stand_in.server:
+        yield stand_in
+
+
+@pytest.fixture(autouse=True)
+def fast_settings(monkeypatch):
+    monkeypatch.setattr(settings, "SWAPI_CONNECT_TIMEOUT_SECONDS", 1.0)
+    monkeypatch.setattr(settings, "SWAPI_READ_TIMEOUT_SECONDS", 1.0)
+    monkeypatch.setattr(settings, "SWAPI_REQUEST_BUDGET_SECONDS", 5.0)
+    monkeypatch.setattr(settings, "SWAPI_RETRIES", 2)
+    monkeypatch.setattr(settings, "SWAPI_RETRY_BACKOFF_SECONDS", 0.01)
+    clear_cache()
+    yield
+    clear_cache()
+
+
+def _client(url: str, breaker: CircuitBreaker | None = None) -> SwapiHttpClient:
+    return SwapiHttpClient(base_url=url, breaker=breaker)
+
+
+@pytest.mark.asyncio
+class TestRetries:
+    async def test_retries_retryable_status_then_succeeds(self, swapi):
+        swapi.script = [(0, 503), (0, 502)]
+        client = _client(swapi.url)
+
+        response = await client._get("/people/")
+
+        assert response.status_code == 200
+        assert swapi.requests == 3
+        assert client.retries_total == 2
+        await client.close()
+
+    async def test_gives_up_after_the_last_retry(self, swapi):
+        swapi.script = [(0, 503)] * 3
+        client = _client(swapi.url)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client._get("/people/")
+        assert swapi.requests == 3
+        await client.close()
+
+    async def test_client_errors_are_not_retried(self, swapi):
+        swapi.script = [(0, 404)]
+        client = _client(swapi.url)
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client._get("/people/999/")
+        assert swapi.requests == 1
+        assert client.breaker.stats()["window_failures"] == 0
+        await client.close()
+
+    async def test_read_timeout_is_retried(self, swapi, monkeypatch):
+        monkeypatch.setattr(settings, "SWAPI_READ_TIMEOUT_SECONDS", 0.05)
+        swapi.script = [(0.5, 200)]
+        client = _client(swapi.url)
+
+        response = await client._get("/people/")
+
+        assert response.status_code == 200
+        assert client.retries_total == 1
+        await client.close()
+
+
+@pytest.mark.asyncio
+class TestDeadlineBudget:
+    async def test_budget_caps_all_attempts(self, swapi, monkeypatch):
+        monkeypatch.setattr(settings, "SWAPI_READ_TIMEOUT_SECONDS", 0.2)
+        monkeypatch.setattr(settings, "SWAPI_REQUEST_BUDGET_SECONDS", 0.3)
+        swapi.script = [(1.0, 200)] * 3
+        client = _client(swapi.url)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        with pytest.raises(httpx.TimeoutException):
+            await client._get("/people/")
+
+        assert loop.time() - start < 0.6
+        assert client.budget_exhausted_total == 1
+        await client.close()
+
+
+@pytest.mark.asyncio
+class TestCircuitBreakerIntegration:
+    async def test_open_circuit_fails_fast_without_calling_swapi(self, swapi, monkeypatch):
+        monkeypatch.setattr(settings, "SWAPI_RETRIES", 0)
+        swapi.script = [(0, 500)] * 2
+        breaker = CircuitBreaker(failure_ratio=0.5, window=4, min_calls=2, reset_timeout=60)
+        client = _client(swapi.url, breaker)
+
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                await client._get("/people/")
+        with pytest.raises(CircuitOpenError):
+            await client._get("/people/")
+
+        assert swapi.requests == 2
+        assert client.resilience_stats()["circuit"]["state"] == "open"
+        assert client.resilience_stats()["circuit"]["rejected_total"] == 1
+        await client.close()
+
+    async def test_stale_data_is_served_while_open(self, swapi, monkeypatch):
+        monkeypatch.setattr(settings, "SWAPI_RETRIES", 0)
+        breaker = CircuitBreaker(failure_ratio=0.5, window=4, min_calls=1, reset_timeout=60)
+        client = _client(swapi.url, breaker)
+        fresh = await client.get_characters(SearchFilters())
+
+        # Expire the cached page, then take SWAPI down behind an open circuit
+        for entry in cache_module._cache.cache.values():
+            entry.expires_at = entry.stale_until = 0
+        breaker.record_failure()
+
+        assert await client.get_characters(SearchFilters()) == fresh
+        assert swapi.requests == 1
+        assert cache_module.cache_stats()["stale_if_error_served"] == 1
+        await client.close()
+
+    async def test_open_circuit_does_not_flood_the_logs(self, swapi, monkeypatch, caplog):
+        monkeypatch.setattr(settings, "SWAPI_RETRIES", 0)
+        breaker = CircuitBreaker(failure_ratio=0.5, window=4, min_calls=1, reset_timeout=60)
+        client = _client(swapi.url, breaker)
+        await client.get_characters(SearchFilters())
+
+        # Stale but revalidatable: every hit would schedule a refresh
+        for entry in cache_module._cache.cache.values():
+            entry.expires_at = 0
+        with caplog.at_level(logging.DEBUG):
+            breaker.record_failure()
+            for _ in range(5):
+                await client.get_characters(SearchFilters())
+                await asyncio.sleep(0)
+
+        warnings = [r.getMessage() for r in caplog.records if r.levelno >= logging.WARNING]
+        assert warnings == ["Circuit opened, failing calls fast for 60s"]
+        assert cache_module.cache_stats()["background_refresh_failures"] >= 1
+        assert swapi.requests == 1
+        await client.close()
+
+
+class TestCircuitBreaker:
+    def test_opens_at_failure_ratio(self):
+        breaker = CircuitBreaker(failure_ratio=0.5, window=4, min_calls=4)
+        for success in (True, True, False):
+            breaker.record_success() if success else breaker.record_failure()
+        assert breaker.state == "closed"
+
+        breaker.record_failure()
+        assert breaker.state == "open"
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+    def test_half_open_allows_one_trial(self):
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0)
+        breaker.record_failure()
+
+        assert breaker.state == "half_open"
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError):
+            breaker.before_call()
+
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_trial_reopens(self):
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.before_call()
+
+        breaker.record_failure()
+
+        assert breaker.opened_total == 2
+
+    def test_abandoned_trial_frees_the_slot(self):
+        breaker = CircuitBreaker(min_calls=1, reset_timeout=0)
+        breaker.record_failure()
+        breaker.before_call()
+
+        breaker.record_abandoned()
+
+        breaker.before_call()
+
+
+@pytest.mark.asyncio
+class TestPoolStats:
+    async def test_counts_open_connections(self, swapi):
+        client = _client(swapi.url)
+        await client._get("/people/")
+
+        stats = client.pool_stats()
+
+        assert stats["requests_total"] == 1
+        assert stats["open_connections"] == stats["active_connections"] + stats["idle_connections"]
+        await client.close()
+
+    async def test_survives_httpcore_internals_changing(self, swapi, monkeypatch):
+        client = _client(swapi.url)
+        with monkeypatch.context() as patch:
+            patch.delattr(client._transport, "_pool")
+            stats = client.pool_stats()
+
+        assert stats["open_connections"] is None
+        assert stats["max_connections"] == client.limits.max_connections
+        await client.close()
@@ -0,0 +1,83 @@
+import pytest
+
+from src.application.ports.swapi_client import RecordNotFoundError
+from src.domain.value_objects.filters import SearchFilters
+from src.domain.value_objects.ordering import Ordering
+from src.infrastructure.swapi_mirror import RESOURCES, MirrorTable
+from src.infrastructure.swapi_snapshot import SnapshotError, SwapiSnapshot, write_snapshot
+
+
+@pytest.fixture
+def records(people, make_planet):
+    skywalkers = [
+        {**record, "name": f"{record['name']} Skywalker"} if i % 5 == 0 else record
+        for i, record in enumerate(people, start=1)
+    ]
+    return {"people": skywalkers, "planets": [make_planet(1)], "films": [], "starships": []}
+
+
+@pytest.fixture
+def snapshot(tmp_path, records):
+    path = tmp_path / "swapi-snapshot.bin"
+    write_snapshot(path, records, "https://swapi.dev/api")
+    snapshot = SwapiSnapshot(path)
+    yield snapshot
+    snapshot.close()
+
+
+@pytest.mark.asyncio
+class TestSwapiSnapshot:
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            SearchFilters(page=1),
+            SearchFilters(page=3),
+            SearchFilters(page=2, ordering="-height"),
+            SearchFilters(page=1, search="skywalker", ordering="name"),
+            SearchFilters(page=2, search="person"),
+            SearchFilters(page=1, search="1", ordering="-mass"),
+        ],
+    )
+    async def test_answers_like_the_in_memory_mirror(self, snapshot, records, filters):
+        mirror = MirrorTable(RESOURCES[0], records["people"])
+
+        assert await snapshot.get_characters(filters) == mirror.query(filters)
+
+    async def test_indexes_are_read_in_place(self, snapshot):
+        table = snapshot.tables["people"]
+
+        assert isinstance(table.sort_indexes[Ordering("height", descending=True)], memoryview)
+        assert isinstance(table.search_index.postings["sky"], memoryview)
+        assert table.ids[25] == 24
+
+    async def test_get_resource_reads_one_record(self, snapshot):
+        record = await snapshot.get_resource("https://swapi.dev/api/planets/1/")
+
+        assert record["name"] == "Tatooine"
+        with pytest.raises(ValueError):
+            await snapshot.get_resource("https://swapi.dev/api/planets/2/")
+
+    async def test_get_record_looks_up_by_id(self, snapshot):
+        record = await snapshot.get_record("people", 3)
+
+        assert record["url"] == "https://swapi.dev/api/people/3/"
+        with pytest.raises(RecordNotFoundError):
+            await snapshot.get_record("planets", 2)
+
+    async def test_stats_count_records(self, snapshot):
+        assert snapshot.stats()["records"] == {
+            "people": 25,
+            "planets": 1,
+            "films": 0,
+            "starships": 0,
+        }
+
+
+def test_rejects_files_that_are_not_snapshots(tmp_path):
+    path = tmp_path / "other.bin"
+    path.write_text('{"name": "Luke"}\n')
+
+    with pytest.raises(SnapshotError):
+        SwapiSnapshot(path)
+    with pytest.raises(SnapshotError):
+        SwapiSnapshot(tmp_path / "missing.bin")
@@ -0,0 +1,96 @@
+import asyncio
+import json
+import logging
+
+import httpx
+from fastapi import FastAPI
+
+from src.api.middleware.timing import ServerTimingMiddleware
+from src.core.logs import JSONFormatter
+from src.core.timing import ServerTiming, phase, start_timing, stop_timing
+
+
+class TestServerTiming:
+    def test_phase_is_a_no_op_outside_a_timed_request(self) -> None:
+        with phase("swapi"):
+            pass
+
+    def test_repeated_phases_accumulate(self) -> None:
+        timing, token = start_timing()
+        try:
+            for _ in range(3):
+                with phase("swapi"):
+                    pass
+            with phase("serialize"):
+                pass
+        finally:
+            stop_timing(token)
+
+        assert timing.counts == {"swapi": 3, "serialize": 1}
+        swapi, serialize, total = timing.header().split(", ")
+        assert swapi.startswith("swapi;dur=") and swapi.endswith(';desc="3 calls"')
+        assert serialize.startswith("serialize;dur=") and "desc" not in serialize
+        assert total.startswith("total;dur=")
+
+    async def test_tasks_record_into_the_request_timing(self) -> None:
+        timing, token = start_timing()
+
+        async def fetch() -> None:
+            with phase("swapi"):
+                await asyncio.sleep(0)
+
+        try:
+            await asyncio.gather(fetch(), fetch())
+        finally:
+            stop_timing(token)
+
+        assert timing.counts["swapi"] == 2
+
+    def test_log_fields_are_milliseconds(self) -> None:
+        timing = ServerTiming()
+        timing.add("cache", 0.0015)
+
+        assert timing.log_fields()["cache_ms"] == 1.5
+        assert "duration_ms" in timing.log_fields()
+
+
+def _app(**options: object) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/planets")
+    async def planets() -> dict[str, int]:
+        with phase("build"):
+            pass
+        return {"count": 0}
+
+    app.add_middleware(ServerTimingMiddleware, **options)
+    return app
+
+
+async def _get(app: FastAPI, path: str) -> httpx.Response:
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(path)
+
+
+async def test_middleware_sends_server_timing_header() -> None:
+    response = await _get(_app(emit_header=True, slow_request_ms=10_000), "/planets")
+
+    assert response.headers["server-timing"].startswith("build;dur=")
+
+
+async def test_header_is_opt_in() -> None:
+    response = await _get(_app(emit_header=False, slow_request_ms=10_000), "/planets")
+
+    assert "server-timing" not in response.headers
+
+
+async def test_slow_requests_are_logged_with_phase_fields(caplog) -> None:
+    with caplog.at_level(logging.INFO, logger="src.api.middleware.timing"):
+        await _get(_app(emit_header=False, slow_request_ms=0), "/planets")
+
+    record = next(record for record in caplog.records if record.msg == "Request timing")
+    line = json.loads(JSONFormatter().format(record))
+    assert line["route"] == "/planets"
+    assert line["status"] == 200
+    assert "build_ms" in line and "duration_ms" in line
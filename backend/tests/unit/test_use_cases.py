@@ -1,99 +1,71 @@
+from dataclasses import FrozenInstanceError
 from typing import Any
 
 import pytest
 
-from application.ports.swapi_client import SwapiClient
-from application.use_cases.get_characters import GetCharacters
-from application.use_cases.get_films import GetFilms
-from application.use_cases.get_planets import GetPlanets
-from application.use_cases.get_starships import GetStarships
-from domain.value_objects.filters import SearchFilters
-
-
-class MockSwapiClient(SwapiClient):
-    """Mock implementation of SwapiClient for testing"""
-
-    async def get_characters(self, filters: SearchFilters) -> dict[str, Any]:
-        return {
-            "count": 1,
-            "results": [
-                {
-                    "name": "Luke Skywalker",
-                    "height": "172",
-                    "mass": "77",
-                    "hair_color": "blond",
-                    "skin_color": "fair",
-                    "eye_color": "blue",
-                    "birth_year": "19BBY",
-                    "gender": "male",
-                    "homeworld": "https://swapi.dev/api/planets/1/",
-                    "url": "https://swapi.dev/api/people/1/",
-                }
-            ],
-        }
-
-    async def get_planets(self, filters: SearchFilters) -> dict[str, Any]:
-        return {
-            "count": 1,
-            "results": [
-                {
-                    "name": "Tatooine",
-                    "rotation_period": "23",
-                    "orbital_period": "304",
-                    "diameter": "10465",
-                    "climate": "arid",
-                    "gravity": "1 standard",
-                    "terrain": "desert",
-                    "surface_water": "1",
-                    "population": "200000",
-                    "url": "https://swapi.dev/api/planets/1/",
-                }
-            ],
-        }
-
-    async def get_films(self, filters: SearchFilters) -> dict[str, Any]:
-        return {
-            "count": 1,
-            "results": [
-                {
-                    "title": "A New Hope",
-                    "episode_id": 4,
-                    "opening_crawl": "It is a period of civil war...",
-                    "director": "George Lucas",
-                    "producer": "Gary Kurtz",
-                    "release_date": "1977-05-25",
-                    "url": "https://swapi.dev/api/films/1/",
-                }
-            ],
-        }
-
-    async def get_starships(self, filters: SearchFilters) -> dict[str, Any]:
-        return {
-            "count": 1,
-            "results": [
-                {
-                    "name": "Millennium Falcon",
-                    "model": "YT-1300",
-                    "manufacturer": "Corellian",
-                    "cost_in_credits": "100000",
-                    "length": "34.37",
-                    "max_atmosphering_speed": "1050",
-                    "crew": "4",
-                    "passengers": "6",
-                    "cargo_capacity": "100000",
-                    "consumables": "2 months",
-                    "hyperdrive_rating": "0.5",
-                    "starship_class": "Light freighter",
-                    "url": "https://swapi.dev/api/starships/10/",
-                }
-            ],
-        }
+from src.application.use_cases.entity_store import entity_store
+from src.application.use_cases.expand_relations import ExpandRelations
+from src.application.use_cases.get_by_ids import GetByIds
+from src.application.use_cases.get_characters import GetCharacters
+from src.application.use_cases.get_films import GetFilms
+from src.application.use_cases.get_planets import GetPlanets
+from src.application.use_cases.get_starships import GetStarships
+from src.application.use_cases.result_cache import result_cache
+from src.domain.entities.character import Character
+from src.domain.value_objects.filters import SearchFilters
+
+FILM = {
+    "title": "A New Hope",
+    "episode_id": 4,
+    "opening_crawl": "It is a period of civil war...",
+    "director": "George Lucas",
+    "producer": "Gary Kurtz",
+    "release_date": "1977-05-25",
+    "url": "https://swapi.dev/api/films/1/",
+}
+
+FALCON = {
+    "name": "Millennium Falcon",
+    "model": "YT-1300",
+    "manufacturer": "Corellian",
+    "cost_in_credits": "100000",
+    "length": "34.37",
+    "max_atmosphering_speed": "1050",
+    "crew": "4",
+    "passengers": "6",
+    "cargo_capacity": "100000",
+    "consumables": "2 months",
+    "hyperdrive_rating": "0.5",
+    "starship_class": "Light freighter",
+    "url": "https://swapi.dev/api/starships/10/",
+}
+
+
+@pytest.fixture
+def make_client(make_swapi, make_person, make_planet):
+    """One record of each resource: Luke, Tatooine, A New Hope and the Millennium Falcon"""
+
+    def make_client():
+        return make_swapi(
+            {
+                "people": [make_person(1, name="Luke Skywalker")],
+                "planets": [make_planet(1)],
+                "films": [FILM],
+                "starships": [FALCON],
+            }
+        )
+
+    return make_client
+
+
+def _planet_calls(client: Any) -> int:
+    return sum(resource == "planets" for resource, _ in client.calls)
 
 
 @pytest.mark.asyncio
 class TestGetCharactersUseCase:
-    async def test_execute_returns_character_entities(self):
-        mock_client = MockSwapiClient()
+    async def test_execute_returns_character_entities(self, make_client):
+        mock_client = make_client()
         use_case = GetCharacters(mock_client)
         filters = SearchFilters(search="Luke")
 
@@ -106,8 +78,8 @@ class TestGetCharactersUseCase:
 
 @pytest.mark.asyncio
 class TestGetPlanetsUseCase:
-    async def test_execute_returns_planet_entities(self):
-        mock_client = MockSwapiClient()
+    async def test_execute_returns_planet_entities(self, make_client):
+        mock_client = make_client()
         use_case = GetPlanets(mock_client)
         filters = SearchFilters()
 
@@ -120,8 +92,8 @@ class TestGetPlanetsUseCase:
 
 @pytest.mark.asyncio
 class TestGetFilmsUseCase:
-    async def test_execute_returns_film_entities(self):
-        mock_client = MockSwapiClient()
+    async def test_execute_returns_film_entities(self, make_client):
+        mock_client = make_client()
         use_case = GetFilms(mock_client)
         filters = SearchFilters()
 
@@ -134,8 +106,8 @@ class TestGetFilmsUseCase:
 
 @pytest.mark.asyncio
 class TestGetStarshipsUseCase:
-    async def test_execute_returns_starship_entities(self):
-        mock_client = MockSwapiClient()
+    async def test_execute_returns_starship_entities(self, make_client):
+        mock_client = make_client()
         use_case = GetStarships(mock_client)
         filters = SearchFilters()
 
@@ -144,3 +116,134 @@ class TestGetStarshipsUseCase:
         assert result["count"] == 1
         assert len(result["results"]) == 1
         assert result["results"][0].name == "Millennium Falcon"
+
+
+@pytest.mark.asyncio
+class TestResultCache:
+    @pytest.fixture(autouse=True)
+    def _clear(self):
+        result_cache.clear()
+        yield
+        result_cache.clear()
+
+    async def test_hot_page_is_shared_without_refetching(self, make_client):
+        client = make_client()
+
+        first = await GetPlanets(client).execute(SearchFilters(page=1, ordering="name"))
+        second = await GetPlanets(client).execute(SearchFilters(page=1, ordering="name"))
+
+        assert second is first
+        assert _planet_calls(client) == 1
+
+    async def test_key_includes_ordering_and_client(self, make_client):
+        client = make_client()
+        other = make_client()
+
+        await GetPlanets(client).execute(SearchFilters(ordering="name"))
+        await GetPlanets(client).execute(SearchFilters(ordering="-name"))
+        await GetPlanets(other).execute(SearchFilters(ordering="name"))
+
+        assert _planet_calls(client) == 2
+        assert _planet_calls(other) == 1
+
+    async def test_results_are_read_only(self, make_client):
+        result = await GetPlanets(make_client()).execute(SearchFilters())
+
+        with pytest.raises(TypeError):
+            result["count"] = 0  # type: ignore[index]
+        with pytest.raises(FrozenInstanceError):
+            result["results"][0].name = "Hoth"
+
+
+@pytest.fixture
+def characters_page(make_person):
+    """A page of Lukes, one per homeworld URL"""
+
+    def characters_page(homeworlds: list[str]) -> dict[str, Any]:
+        luke = make_person(1, name="Luke Skywalker")
+        results = [Character.from_swapi({**luke, "homeworld": url}) for url in homeworlds]
+        return {"count": len(results), "results": tuple(results)}
+
+    return characters_page
+
+
+@pytest.mark.asyncio
+class TestExpandRelations:
+    async def test_shared_urls_are_fetched_once(self, make_client, characters_page):
+        client = make_client()
+        tatooine = "https://swapi.dev/api/planets/1/"
+        page = characters_page([tatooine] * 5 + ["https://swapi.dev/api/planets/2/"])
+
+        result = await ExpandRelations(client).execute(page, ["homeworld"])
+
+        assert sorted(client.fetched) == [tatooine, "https://swapi.dev/api/planets/2/"]
+        assert result["results"][0]["homeworld"].name == "Tatooine"
+        assert result["results"][0]["name"] == "Luke Skywalker"
+
+    async def test_concurrency_is_bounded(self, make_client, characters_page):
+        client = make_client()
+        page = characters_page([f"https://swapi.dev/api/planets/{i}/" for i in range(20)])
+
+        await ExpandRelations(client, max_concurrency=3).execute(page, ["homeworld"])
+
+        assert len(client.fetched) == 20
+        assert client.max_active == 3
+
+    async def test_unresolvable_urls_are_kept(self, make_client, characters_page):
+        page = characters_page(["https://swapi.dev/api/planets/1/"])
+        film = "https://swapi.dev/api/films/7/"
+        page["results"][0].films.append(film)
+
+        result = await ExpandRelations(make_client()).execute(page, ["homeworld", "films"])
+
+        assert result["results"][0]["films"] == (film,)
+        assert result["results"][0]["homeworld"].name == "Tatooine"
+
+
+@pytest.mark.asyncio
+class TestGetByIds:
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        result_cache.clear()
+        entity_store.clear()
+        yield
+        result_cache.clear()
+        entity_store.clear()
+
+    async def test_entities_from_list_pages_are_not_fetched_again(self, make_client):
+        client = make_client()
+        await GetCharacters(client).execute(SearchFilters())
+
+        result = await GetByIds(client, "people").execute([1])
+
+        assert result["results"][0].name == "Luke Skywalker"
+        assert client.fetched == []
+
+    async def test_misses_are_fetched_and_stored(self, make_client):
+        client = make_client()
+
+        first = await GetByIds(client, "planets").execute([1])
+        second = await GetByIds(client, "planets").execute([1])
+
+        assert first["results"] == second["results"]
+        assert second["results"][0].name == "Tatooine"
+        assert client.fetched == ["https://swapi.dev/api/planets/1/"]
+
+    async def test_unknown_ids_are_reported_missing_in_request_order(self, make_client):
+        client = make_client()
+
+        result = await GetByIds(client, "planets").execute([7, 1, 3])
+
+        assert result["count"] == 1
+        assert result["missing"] == (7, 3)
+
+    async def test_other_errors_propagate(self, make_client, monkeypatch):
+        client = make_client()
+
+        async def get_record(resource: str, record_id: int) -> dict[str, Any]:
+            raise RuntimeError("SWAPI unavailable")
+
+        monkeypatch.setattr(client, "get_record", get_record)
+
+        with pytest.raises(RuntimeError):
+            await GetByIds(client, "films").execute([1])